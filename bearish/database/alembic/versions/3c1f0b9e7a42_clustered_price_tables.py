@@ -0,0 +1,40 @@
+"""clustered price tables
+
+Revision ID: 3c1f0b9e7a42
+Revises: facbb399b102
+Create Date: 2026-10-17 00:32:10.118406
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f0b9e7a42"
+down_revision: Union[str, None] = "facbb399b102"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRICE_TABLES = ["price", "priceindex", "priceetf"]
+
+
+def upgrade() -> None:
+    for table in PRICE_TABLES:
+        with op.batch_alter_table(
+            table, recreate="always", table_kwargs={"sqlite_with_rowid": False}
+        ) as batch_op:
+            batch_op.drop_index(f"ix_{table}_symbol_date")
+            batch_op.drop_index(f"ix_{table}_symbol")
+
+
+def downgrade() -> None:
+    for table in PRICE_TABLES:
+        with op.batch_alter_table(
+            table, recreate="always", table_kwargs={"sqlite_with_rowid": True}
+        ) as batch_op:
+            batch_op.create_index(f"ix_{table}_symbol", ["symbol"], unique=False)
+            batch_op.create_index(
+                f"ix_{table}_symbol_date", ["symbol", "date"], unique=False
+            )
@@ -0,0 +1,127 @@
+"""symbol dimension
+
+Revision ID: 8d2e5c7b1f90
+Revises: 3c1f0b9e7a42
+Create Date: 2026-10-17 01:05:42.530177
+
+"""
+
+from typing import Any, Mapping, Sequence, Union
+
+import sqlmodel
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e5c7b1f90"
+down_revision: Union[str, None] = "3c1f0b9e7a42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRICE_TABLES = ["price", "priceindex", "priceetf"]
+FINANCIALS_TABLES = [
+    "financialmetrics",
+    "balancesheet",
+    "cashflow",
+    "quarterlyfinancialmetrics",
+    "quarterlybalancesheet",
+    "quarterlycashflow",
+    "earningsdate",
+]
+SYMBOL_COLUMNS = ["exchange", "symbol", "source"]
+
+
+def _create_view(table: str, columns: Sequence[Mapping[str, Any]]) -> None:
+    columns_ = ", ".join(
+        (
+            f"symbol.{column['name']}"
+            if column["name"] in SYMBOL_COLUMNS
+            else f"data.{column['name']}"
+        )
+        for column in columns
+    )
+    op.execute(
+        f'CREATE VIEW "{table}" AS SELECT {columns_} FROM "{table}data" AS data '
+        "JOIN symbol ON symbol.id = data.symbol_id"
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "symbol",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("symbol", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("source", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("exchange", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index(
+        "ix_symbol_symbol_source", "symbol", ["symbol", "source"], unique=True
+    )
+    inspector = sa.inspect(op.get_bind())
+    for table in PRICE_TABLES + FINANCIALS_TABLES:
+        columns = inspector.get_columns(table)
+        data_columns = [c for c in columns if c["name"] not in SYMBOL_COLUMNS]
+        op.execute(
+            "INSERT INTO symbol (symbol, source, exchange) "
+            f'SELECT symbol, source, MAX(exchange) FROM "{table}" WHERE true '
+            "GROUP BY symbol, source ON CONFLICT (symbol, source) "
+            "DO UPDATE SET exchange = COALESCE(symbol.exchange, excluded.exchange)"
+        )
+        op.create_table(
+            f"{table}data",
+            sa.Column("symbol_id", sa.Integer(), nullable=False),
+            *[
+                sa.Column(c["name"], c["type"], nullable=c["nullable"])
+                for c in data_columns
+            ],
+            sa.ForeignKeyConstraint(["symbol_id"], ["symbol.id"]),
+            sa.PrimaryKeyConstraint("symbol_id", "date"),
+            sqlite_with_rowid=False,
+        )
+        names = ", ".join(c["name"] for c in data_columns)
+        values = ", ".join(f"data.{c['name']}" for c in data_columns)
+        op.execute(
+            f'INSERT INTO "{table}data" (symbol_id, {names}) '
+            f'SELECT symbol.id, {values} FROM "{table}" AS data '
+            "JOIN symbol ON symbol.symbol = data.symbol AND symbol.source = data.source"
+        )
+        op.drop_table(table)
+        _create_view(table, columns)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in PRICE_TABLES + FINANCIALS_TABLES:
+        columns = inspector.get_columns(table)
+        nullable = {
+            **{c["name"]: c["nullable"] for c in inspector.get_columns(f"{table}data")},
+            **{"exchange": True, "symbol": False, "source": False},
+        }
+        op.create_table(
+            f"{table}_downgrade",
+            *[
+                sa.Column(c["name"], c["type"], nullable=nullable[c["name"]])
+                for c in columns
+            ],
+            sa.PrimaryKeyConstraint("symbol", "source", "date"),
+            sqlite_with_rowid=table not in PRICE_TABLES,
+        )
+        names = ", ".join(c["name"] for c in columns)
+        op.execute(
+            f'INSERT INTO "{table}_downgrade" ({names}) SELECT {names} FROM "{table}"'
+        )
+        op.execute(f'DROP VIEW "{table}"')
+        op.drop_table(f"{table}data")
+        op.rename_table(f"{table}_downgrade", table)
+        op.create_index(f"ix_{table}_date", table, ["date"], unique=False)
+        op.create_index(f"ix_{table}_source", table, ["source"], unique=False)
+        if table in FINANCIALS_TABLES:
+            op.create_index(f"ix_{table}_symbol", table, ["symbol"], unique=False)
+            op.create_index(
+                f"ix_{table}_symbol_date", table, ["symbol", "date"], unique=False
+            )
+    op.drop_index("ix_symbol_symbol_source", table_name="symbol")
+    op.drop_table("symbol")
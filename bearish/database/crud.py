@@ -1,13 +1,40 @@
+import heapq
 import logging
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
 from functools import cached_property
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import List, TYPE_CHECKING, Type, Union, Any, Optional
+from typing import (
+    List,
+    TYPE_CHECKING,
+    Type,
+    Union,
+    Any,
+    Optional,
+    Iterator,
+    Tuple,
+    Dict,
+    Iterable,
+    Set,
+)
 
 import pandas as pd
-from pydantic import BaseModel, ConfigDict
-from sqlalchemy import Engine, create_engine, insert
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from sqlalchemy import (
+    Connection,
+    Engine,
+    Select,
+    Table,
+    create_engine,
+    delete,
+    func,
+    insert,
+    text,
+    update,
+)
 from sqlmodel import Session, select
+from sqlmodel.sql.expression import SelectOfScalar
 from sqlmodel.main import SQLModel
 
 
@@ -21,17 +48,37 @@ from bearish.database.schemas import (
     BalanceSheetORM,
     PriceORM,
     SourcesORM,
+    ApiUsageORM,
     EarningsDateORM,
     QuarterlyFinancialMetricsORM,
     QuarterlyCashFlowORM,
     QuarterlyBalanceSheetORM,
     PriceTrackerORM,
     FinancialsTrackerORM,
+    FinancialsRetryORM,
     IndexORM,
     SecORM,
     SecShareIncreaseORM,
+    BEARISH_TABLES,
+    BEARISH_VIEWS,
+    EPOCH,
+    SERIES_TABLES,
+    SymbolORM,
+    SYMBOL_COLUMNS,
+)
+from bearish.database.profiles import (
+    ProfileName,
+    SqliteProfile,
+    get_profile,
+    is_new_database,
+)
+from bearish.database.scripts.upgrade import (
+    upgrade,
+    current_revision,
+    create_schema,
+    is_empty,
+    HEAD_REVISION,
 )
-from bearish.database.scripts.upgrade import upgrade
 from bearish.exchanges.exchanges import ExchangeQuery
 from bearish.interface.interface import BearishDbBase
 from bearish.models.assets.assets import Assets
@@ -40,6 +87,7 @@ from bearish.models.base import (
     Ticker,
     BaseTracker,
     FinancialsTracker,
+    FinancialsRetry,
     PriceTracker,
 )
 from bearish.models.financials.balance_sheet import BalanceSheet, QuarterlyBalanceSheet
@@ -52,6 +100,7 @@ from bearish.models.financials.metrics import (
 )
 from bearish.models.price.price import Price
 from bearish.models.sec.sec import Sec, SecShareIncrease
+from bearish.types import DateStorage
 from bearish.utils.utils import batch
 
 if TYPE_CHECKING:
@@ -60,21 +109,75 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 BATCH_SIZE = 5000
+YIELD_PER = 1000
+PRICE_VALUES = ["open", "high", "low", "close", "volume", "dividends", "stock_splits"]
+PRICE_REQUIRED = ["symbol", "source", "date", "open", "high", "low", "close", "volume"]
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+FINANCIALS_TABLES: Dict[str, Tuple[Type[BaseModel], Type[SQLModel]]] = {
+    "financial_metrics": (FinancialMetrics, FinancialMetricsORM),
+    "balance_sheets": (BalanceSheet, BalanceSheetORM),
+    "cash_flows": (CashFlow, CashFlowORM),
+    "quarterly_financial_metrics": (
+        QuarterlyFinancialMetrics,
+        QuarterlyFinancialMetricsORM,
+    ),
+    "quarterly_balance_sheets": (QuarterlyBalanceSheet, QuarterlyBalanceSheetORM),
+    "quarterly_cash_flows": (QuarterlyCashFlow, QuarterlyCashFlowORM),
+    "earnings_date": (EarningsDate, EarningsDateORM),
+}
 
 
 class BearishDb(BearishDbBase):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     database_path: Path
     auto_migration: bool = True
+    sqlite_profile: Union[ProfileName, SqliteProfile] = "safe"
+    date_storage: DateStorage = "iso"
+    _symbol_ids: Dict[Tuple[str, str], int] = PrivateAttr(default_factory=dict)
+    _symbol_exchanges: Dict[Tuple[str, str], Optional[str]] = PrivateAttr(
+        default_factory=dict
+    )
+    _date_storage: DateStorage = PrivateAttr(default="iso")
 
     @cached_property
     def _engine(self) -> Engine:
         database_url = f"sqlite:///{Path(self.database_path)}"
-        if self.auto_migration:
-            upgrade(database_url)
         engine = create_engine(database_url)
+        get_profile(self.sqlite_profile).register(
+            engine, new_database=is_new_database(self.database_path)
+        )
+        with engine.begin() as connection:
+            revision = current_revision(connection)
+            if self.auto_migration and revision is None and is_empty(connection):
+                logger.info("Creating database schema from metadata")
+                create_schema(
+                    connection,
+                    BEARISH_TABLES[self.date_storage],
+                    BEARISH_VIEWS[self.date_storage],
+                )
+                revision = HEAD_REVISION
+        if self.auto_migration and revision != HEAD_REVISION:
+            logger.info(f"Upgrading database from revision {revision}")
+            upgrade(database_url)
+        with engine.connect() as connection:
+            self._date_storage = self._read_date_storage(connection)
+        if self._date_storage != self.date_storage:
+            logger.warning(
+                f"Database {self.database_path} stores dates as "
+                f"'{self._date_storage}', ignoring '{self.date_storage}'"
+            )
         return engine
 
+    def _read_date_storage(self, connection: Connection) -> DateStorage:
+        date_type = connection.execute(
+            text("SELECT type FROM pragma_table_info('pricedata') WHERE name = 'date'")
+        ).scalar()
+        return "epoch_day" if date_type == "INTEGER" else "iso"
+
+    @property
+    def _series_tables(self) -> Dict[str, Table]:
+        return SERIES_TABLES[self._date_storage]
+
     def model_post_init(self, __context: Any) -> None:
         self._engine  # noqa: B018
 
@@ -97,14 +200,112 @@ class BearishDb(BearishDbBase):
     def _write_series(
         self, series: List["Price"], table: Optional[Type[SQLModel]] = None
     ) -> None:
-        price_orm = table or PriceORM
-        with Session(self._engine) as session:
-            data = [serie.model_dump() for serie in series]
-            chunks = batch(data, BATCH_SIZE)
-            for chunk in chunks:
-                stmt = insert(price_orm).prefix_with("OR REPLACE").values(chunk)
-                session.exec(stmt)  # type: ignore
-            session.commit()
+        self._write_series_rows(
+            [serie.model_dump() for serie in series], table or PriceORM
+        )
+
+    def _write_series_frame(
+        self, series: pd.DataFrame, table: Optional[Type[SQLModel]] = None
+    ) -> None:
+        series_table = self._series_tables[(table or PriceORM).__tablename__]  # type: ignore
+        data = series.reindex(
+            columns=[*SYMBOL_COLUMNS, "date", "created_at", *PRICE_VALUES]
+        )
+        data[PRICE_VALUES] = data[PRICE_VALUES].astype("float64")
+        data = data.dropna(subset=PRICE_REQUIRED)
+        if data.empty:
+            logger.warning("No valid prices found in series frame")
+            return None
+        dates = pd.to_datetime(data["date"]).dt.tz_localize(None).dt.normalize()
+        if self._date_storage == "epoch_day":
+            data["date"] = (dates - EPOCH).dt.days.astype(object)
+        else:
+            data["date"] = dates.dt.strftime(DATETIME_FORMAT)
+        data["created_at"] = (
+            pd.to_datetime(data["created_at"])
+            .fillna(pd.Timestamp(date.today()))
+            .dt.strftime("%Y-%m-%d")
+        )
+        data["exchange"] = (
+            data["exchange"].astype(object).where(data["exchange"].notna(), None)
+        )
+        columns = ["symbol_id", "date", "created_at", *PRICE_VALUES]
+        stmt = (
+            f'INSERT OR REPLACE INTO "{series_table.name}" '
+            f"({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+        )
+        with self._engine.begin() as connection:
+            symbol_ids = self._read_symbol_ids(
+                connection,
+                data[SYMBOL_COLUMNS]
+                .drop_duplicates(["symbol", "source"])
+                .itertuples(index=False, name=None),
+            )
+            data["symbol_id"] = [
+                symbol_ids[key]
+                for key in zip(data["symbol"], data["source"], strict=True)
+            ]
+            for chunk in batch(
+                list(data[columns].itertuples(index=False, name=None)), BATCH_SIZE
+            ):
+                connection.exec_driver_sql(stmt, chunk)
+
+    def _write_series_rows(
+        self, rows: List[Dict[str, Any]], table: Type[SQLModel]
+    ) -> None:
+        series_table = self._series_tables[table.__tablename__]  # type: ignore
+        with self._engine.begin() as connection:
+            symbol_ids = self._read_symbol_ids(
+                connection,
+                ((row["exchange"], row["symbol"], row["source"]) for row in rows),
+            )
+            data = [
+                {
+                    "symbol_id": symbol_ids[(row["symbol"], row["source"])],
+                    **{k: v for k, v in row.items() if k not in SYMBOL_COLUMNS},
+                }
+                for row in rows
+            ]
+            for chunk in batch(data, BATCH_SIZE):
+                connection.execute(
+                    insert(series_table).prefix_with("OR REPLACE"), chunk
+                )
+
+    def _read_symbol_ids(
+        self,
+        connection: Connection,
+        symbols: Iterable[Tuple[Optional[str], str, str]],
+    ) -> Dict[Tuple[str, str], int]:
+        missing = {
+            (symbol, source): exchange
+            for exchange, symbol, source in symbols
+            if (symbol, source) not in self._symbol_ids
+            or (
+                exchange is not None
+                and exchange != self._symbol_exchanges.get((symbol, source))
+            )
+        }
+        if not missing:
+            return self._symbol_ids
+        connection.exec_driver_sql(
+            "INSERT INTO symbol (symbol, source, exchange) VALUES (?, ?, ?) "
+            "ON CONFLICT (symbol, source) "
+            "DO UPDATE SET exchange = COALESCE(excluded.exchange, symbol.exchange)",
+            [
+                (symbol, source, exchange)
+                for (symbol, source), exchange in missing.items()
+            ],
+        )
+        for chunk in batch(sorted({symbol for symbol, _ in missing}), BATCH_SIZE):
+            query = select(
+                SymbolORM.id, SymbolORM.symbol, SymbolORM.source, SymbolORM.exchange
+            ).where(
+                SymbolORM.symbol.in_(chunk)  # type: ignore
+            )
+            for id_, symbol, source, exchange in connection.execute(query):
+                self._symbol_ids[(symbol, source)] = id_
+                self._symbol_exchanges[(symbol, source)] = exchange
+        return self._symbol_ids
 
     def _write_sec(self, secs: List["Sec"]) -> None:
 
@@ -161,13 +362,7 @@ class BearishDb(BearishDbBase):
         if not series:
             logger.warning(f"No data found for '{[serie.symbol for serie in series]}'")
             return None
-        with Session(self._engine) as session:
-            data = [serie.model_dump() for serie in series]
-            chunks = batch(data, BATCH_SIZE)
-            for chunk in chunks:
-                stmt = insert(table).prefix_with("OR REPLACE").values(chunk)
-                session.exec(stmt)  # type: ignore
-            session.commit()
+        self._write_series_rows([serie.model_dump() for serie in series], table)
 
     def _read_series(
         self,
@@ -178,13 +373,71 @@ class BearishDb(BearishDbBase):
         end_date = datetime.now()
         start_date = end_date - pd.Timedelta(days=months * 31)
         table = table or PriceORM
-        with Session(self._engine) as session:
-            query_ = select(table)
-            query_ = query_.where(table.symbol.in_(query.symbols.all())).where(  # type: ignore
-                table.date.between(start_date, end_date)  # type: ignore
+        query_ = self._series_query(query, table, table.__table__.columns.keys())  # type: ignore
+        series_table = self._series_tables[table.__tablename__]  # type: ignore
+        query_ = query_.where(series_table.c.date.between(start_date, end_date))
+        with self._engine.connect() as connection:
+            series = connection.execute(query_).mappings()
+            return [Price.model_validate(dict(serie)) for serie in series]
+
+    def _series_query(
+        self, query: "AssetQuery", table: Type[SQLModel], columns: List[str]
+    ) -> Select[Any]:
+        series_table = self._series_tables[table.__tablename__]  # type: ignore
+        symbol_table = SymbolORM.__table__  # type: ignore
+        return (
+            series_table.join(
+                symbol_table, symbol_table.c.id == series_table.c.symbol_id
+            )
+            .select()
+            .with_only_columns(
+                *[
+                    symbol_table.c[c] if c in SYMBOL_COLUMNS else series_table.c[c]
+                    for c in columns
+                ]
             )
-            series = session.exec(query_).all()
-            return [Price.model_validate(serie) for serie in series]
+            .where(symbol_table.c.symbol.in_(query.symbols.all()))
+            .order_by(symbol_table.c.symbol, series_table.c.date)
+        )
+
+    def _read_series_frame(
+        self,
+        query: "AssetQuery",
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        columns: Optional[List[str]] = None,
+        table: Optional[Type[SQLModel]] = None,
+    ) -> pd.DataFrame:
+        table = table or PriceORM
+        price_columns = table.__table__.columns.keys()  # type: ignore
+        if columns is None:
+            columns = [c for c in price_columns if c not in {"symbol", "date"}]
+        unknown_columns = set(columns).difference(price_columns)
+        if unknown_columns:
+            raise ValueError(f"Unknown price columns: {sorted(unknown_columns)}")
+        selected = [
+            "symbol",
+            "date",
+            *[c for c in columns if c not in {"symbol", "date"}],
+        ]
+        series_table = self._series_tables[table.__tablename__]  # type: ignore
+        query_ = self._series_query(query, table, selected)
+        if start is not None:
+            query_ = query_.where(
+                series_table.c.date >= datetime.combine(start, time())
+            )
+        if end is not None:
+            query_ = query_.where(
+                series_table.c.date < datetime.combine(end + timedelta(days=1), time())
+            )
+        with self._engine.connect() as connection:
+            data = pd.read_sql(query_, con=connection)
+        data["date"] = pd.to_datetime(data["date"])
+        if "created_at" in data.columns:
+            data["created_at"] = pd.to_datetime(data["created_at"])
+        values = [c for c in data.columns if c in PRICE_VALUES]
+        data[values] = data[values].astype("float64")
+        return data.set_index(["symbol", "date"])
 
     def _read_financials(self, query: "AssetQuery") -> Financials:
         with Session(self._engine) as session:
@@ -260,6 +513,12 @@ class BearishDb(BearishDbBase):
         ],
         query: "AssetQuery",
     ) -> List[BaseModel]:
+        assets = session.exec(self._asset_type_query(orm_table, query)).all()
+        return [table.model_validate(asset) for asset in assets]
+
+    def _asset_type_query(
+        self, orm_table: Type[SQLModel], query: "AssetQuery"
+    ) -> SelectOfScalar[Any]:
         if query.symbols.all():
             query_ = select(orm_table).where(orm_table.symbol.in_(query.symbols.all()))  # type: ignore
         else:
@@ -270,9 +529,81 @@ class BearishDb(BearishDbBase):
                 query_ = query_.where(orm_table.exchange.in_(query.exchanges))  # type: ignore
         if query.excluded_sources:
             query_ = query_.where(~orm_table.source.in_(query.excluded_sources))  # type: ignore
+        return query_
 
-        assets = session.exec(query_).all()
-        return [table.model_validate(asset) for asset in assets]
+    def _iter_series(
+        self,
+        query: "AssetQuery",
+        months: int = 1,
+        table: Optional[Type[SQLModel]] = None,
+    ) -> Iterator[List[Price]]:
+        end_date = datetime.now()
+        start_date = end_date - pd.Timedelta(days=months * 31)
+        table = table or PriceORM
+        series_table = self._series_tables[table.__tablename__]  # type: ignore
+        query_ = (
+            self._series_query(query, table, table.__table__.columns.keys())  # type: ignore
+            .where(series_table.c.date.between(start_date, end_date))
+            .execution_options(yield_per=YIELD_PER)
+        )
+        with self._engine.connect() as connection:
+            series_ = connection.execute(query_).mappings()
+            for _, series in groupby(series_, key=itemgetter("symbol")):
+                yield [Price.model_validate(dict(serie)) for serie in series]
+
+    def _iter_financials(self, query: "AssetQuery") -> Iterator[Financials]:
+        with Session(self._engine) as session:
+            streams = [
+                self._iter_asset_type(session, field, table, orm_table, query)
+                for field, (table, orm_table) in FINANCIALS_TABLES.items()
+            ]
+            for _, rows in groupby(
+                heapq.merge(*streams, key=itemgetter(0)), key=itemgetter(0)
+            ):
+                financials = Financials()
+                for _, field, financial in rows:
+                    getattr(financials, field).append(financial)
+                yield financials
+
+    def _iter_assets(self, query: "AssetQuery") -> Iterator[Assets]:
+        from bearish.models.assets.equity import Equity
+        from bearish.models.assets.crypto import Crypto
+        from bearish.models.assets.currency import Currency
+        from bearish.models.assets.etfs import Etf
+        from bearish.models.assets.index import Index
+
+        assets_tables: Dict[str, Tuple[Type[BaseModel], Type[SQLModel]]] = {
+            "equities": (Equity, EquityORM),
+            "currencies": (Currency, CurrencyORM),
+            "cryptos": (Crypto, CryptoORM),
+            "etfs": (Etf, EtfORM),
+            "index": (Index, IndexORM),
+        }
+        with Session(self._engine) as session:
+            for field, (table, orm_table) in assets_tables.items():
+                query_ = self._asset_type_query(orm_table, query).execution_options(
+                    yield_per=YIELD_PER
+                )
+                for assets in session.exec(query_).partitions():
+                    yield Assets(
+                        **{field: [table.model_validate(asset) for asset in assets]}
+                    )
+
+    def _iter_asset_type(
+        self,
+        session: Session,
+        field: str,
+        table: Type[BaseModel],
+        orm_table: Type[SQLModel],
+        query: "AssetQuery",
+    ) -> Iterator[Tuple[str, str, BaseModel]]:
+        query_ = (
+            self._asset_type_query(orm_table, query)
+            .order_by(orm_table.symbol)  # type: ignore
+            .execution_options(yield_per=YIELD_PER)
+        )
+        for asset in session.exec(query_):
+            yield asset.symbol, field, table.model_validate(asset)
 
     def _read_sources(self) -> List[str]:
         with Session(self._engine) as session:
@@ -310,26 +641,48 @@ class BearishDb(BearishDbBase):
             session.exec(stmt)  # type: ignore
             session.commit()
 
-    def _read_tracker(
+    def _read_trackers(
         self,
         tracker_query: TrackerQuery,
         tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
-    ) -> List[Ticker]:
-        with Session(self._engine) as session:
-            tracker_orm = (
-                PriceTrackerORM
-                if tracker_type is PriceTracker
-                else FinancialsTrackerORM
+    ) -> List[BaseTracker]:
+        tracker_orm = (
+            PriceTrackerORM if tracker_type is PriceTracker else FinancialsTrackerORM
+        )
+        last_date = func.max(tracker_orm.date)
+        query = (
+            select(
+                tracker_orm.symbol, tracker_orm.exchange, tracker_orm.source, last_date
             )
-            query = select(tracker_orm.symbol, tracker_orm.exchange, tracker_orm.source)
-            if tracker_query.exchange:
-                query = query.where(tracker_orm.exchange == tracker_query.exchange)
-
-            tracker_orm = session.exec(query).all()  # type: ignore
+            .group_by(tracker_orm.symbol)
+            .order_by(last_date, tracker_orm.symbol)
+        )
+        if tracker_query.exchange:
+            query = query.where(tracker_orm.exchange == tracker_query.exchange)
+        if tracker_query.reference_date:
+            query = query.having(
+                last_date
+                < tracker_query.reference_date - timedelta(days=tracker_query.delay)
+            )
+        with self._engine.connect() as connection:
             return [
-                Ticker(symbol=t[0], exchange=t[1], source=t[2]) for t in tracker_orm  # type: ignore
+                tracker_type(
+                    symbol=symbol, exchange=exchange, source=source, date=last_date_
+                )
+                for symbol, exchange, source, last_date_ in connection.execute(query)
             ]
 
+    def _read_tracked_symbols(
+        self, tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]]
+    ) -> Set[str]:
+        tracker_orm = (
+            PriceTrackerORM if tracker_type is PriceTracker else FinancialsTrackerORM
+        )
+        with self._engine.connect() as connection:
+            return set(
+                connection.execute(select(tracker_orm.symbol).distinct()).scalars()
+            )
+
     def _get_tickers(self, exchange_query: ExchangeQuery) -> List[Ticker]:
         if not exchange_query.sources:
             query = f"""SELECT symbol, exchange from equity where {exchange_query.to_suffixes_sql_statement()} 
@@ -354,6 +707,62 @@ class BearishDb(BearishDbBase):
             con=self._engine,
         )
 
+    def _write_financials_retries(self, retries: List[FinancialsRetry]) -> None:
+        with Session(self._engine) as session:
+            stmt = (
+                insert(FinancialsRetryORM)
+                .prefix_with("OR REPLACE")
+                .values([retry.model_dump() for retry in retries])
+            )
+            session.exec(stmt)  # type: ignore
+            session.commit()
+
+    def _read_financials_retries(self, source: str) -> List[FinancialsRetry]:
+        with Session(self._engine) as session:
+            query = (
+                select(FinancialsRetryORM)
+                .where(FinancialsRetryORM.source == source)
+                .order_by(FinancialsRetryORM.next_attempt)  # type: ignore
+            )
+            return [
+                FinancialsRetry.model_validate(retry.model_dump())
+                for retry in session.exec(query)
+            ]
+
+    def _delete_financials_retries(self, source: str, symbols: List[str]) -> None:
+        with Session(self._engine) as session:
+            stmt = delete(FinancialsRetryORM).where(
+                FinancialsRetryORM.source == source,  # type: ignore
+                FinancialsRetryORM.symbol.in_(symbols),  # type: ignore
+            )
+            session.exec(stmt)  # type: ignore
+            session.commit()
+
+    def _read_api_calls(self, source: str, period: str) -> int:
+        with Session(self._engine) as session:
+            query = select(ApiUsageORM.calls).where(
+                ApiUsageORM.source == source, ApiUsageORM.period == period
+            )
+            return session.exec(query).first() or 0
+
+    def _reserve_api_calls(
+        self, source: str, period: str, calls: int, limit: Optional[int] = None
+    ) -> bool:
+        with self._engine.begin() as connection:
+            connection.execute(
+                insert(ApiUsageORM)
+                .prefix_with("OR IGNORE")
+                .values(source=source, period=period, calls=0)
+            )
+            stmt = (
+                update(ApiUsageORM)
+                .where(ApiUsageORM.source == source, ApiUsageORM.period == period)  # type: ignore
+                .values(calls=ApiUsageORM.calls + calls)
+            )
+            if limit is not None:
+                stmt = stmt.where(ApiUsageORM.calls + calls <= limit)  # type: ignore
+            return connection.execute(stmt).rowcount == 1
+
     def read_price_tracker(self, symbol: str) -> Optional[date]:
         with Session(self._engine) as session:
             query = select(PriceTrackerORM.date).where(PriceTrackerORM.symbol == symbol)  # type: ignore
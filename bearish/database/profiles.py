@@ -0,0 +1,96 @@
+import logging
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+ProfileName = Literal["safe", "bulk-load", "read-mostly"]
+
+
+class SqliteProfile(BaseModel):
+    model_config = ConfigDict(frozen=True)
+    journal_mode: Optional[
+        Literal["DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"]
+    ] = None
+    synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "FULL"
+    cache_size: int = -2000
+    mmap_size: int = 0
+    temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "DEFAULT"
+    busy_timeout: int = 5000
+    page_size: Optional[int] = None
+    auto_vacuum: Optional[Literal["NONE", "FULL", "INCREMENTAL"]] = None
+
+    def file_pragmas(self) -> Dict[str, Any]:
+        pragmas = {"page_size": self.page_size, "auto_vacuum": self.auto_vacuum}
+        return {k: v for k, v in pragmas.items() if v is not None}
+
+    def connection_pragmas(self) -> Dict[str, Any]:
+        pragmas = {
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "cache_size": self.cache_size,
+            "mmap_size": self.mmap_size,
+            "temp_store": self.temp_store,
+            "busy_timeout": self.busy_timeout,
+        }
+        return {k: v for k, v in pragmas.items() if v is not None}
+
+    def apply(self, dbapi_connection: Any, new_database: bool = False) -> None:
+        pragmas = self.connection_pragmas()
+        if new_database:
+            pragmas = self.file_pragmas() | pragmas
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+    def register(self, engine: Engine, new_database: bool = False) -> None:
+        state = {"new_database": new_database}
+
+        def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+            self.apply(dbapi_connection, new_database=state["new_database"])
+            state["new_database"] = False
+
+        event.listen(engine, "connect", _on_connect)
+
+
+PROFILES: Dict[ProfileName, SqliteProfile] = {
+    "safe": SqliteProfile(
+        synchronous="FULL",
+        cache_size=-64_000,
+    ),
+    "bulk-load": SqliteProfile(
+        journal_mode="WAL",
+        synchronous="OFF",
+        cache_size=-512_000,
+        mmap_size=256 * 1024**2,
+        temp_store="MEMORY",
+        busy_timeout=30_000,
+        page_size=8192,
+        auto_vacuum="NONE",
+    ),
+    "read-mostly": SqliteProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        cache_size=-256_000,
+        mmap_size=1024**3,
+        temp_store="MEMORY",
+        page_size=8192,
+    ),
+}
+
+
+def get_profile(profile: Union[ProfileName, SqliteProfile]) -> SqliteProfile:
+    if isinstance(profile, SqliteProfile):
+        return profile
+    return PROFILES[profile]
+
+
+def is_new_database(database_path: Path) -> bool:
+    path = Path(database_path)
+    return not path.exists() or path.stat().st_size == 0
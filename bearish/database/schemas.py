@@ -1,7 +1,17 @@
-from datetime import datetime
-from typing import Optional, Dict
-
-from sqlalchemy import JSON, Column
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Dict, List, Type, Union, get_args
+
+from sqlalchemy import (
+    JSON,
+    Column,
+    Dialect,
+    ForeignKey,
+    Index as TableIndex,
+    Integer,
+    MetaData,
+    Table,
+    TypeDecorator,
+)
 from sqlmodel import SQLModel, Field
 
 
@@ -10,7 +20,7 @@ from bearish.models.assets.crypto import Crypto
 from bearish.models.assets.currency import Currency
 from bearish.models.assets.etfs import Etf
 from bearish.models.assets.index import Index
-from bearish.models.base import PriceTracker, FinancialsTracker
+from bearish.models.base import PriceTracker, FinancialsTracker, FinancialsRetry
 from bearish.models.financials.balance_sheet import BalanceSheet, QuarterlyBalanceSheet
 from bearish.models.financials.cash_flow import CashFlow, QuarterlyCashFlow
 from bearish.models.financials.earnings_date import EarningsDate
@@ -20,6 +30,10 @@ from bearish.models.financials.metrics import (
 )
 from bearish.models.price.price import Price
 from bearish.models.sec.sec import Sec, SecShareIncrease
+from bearish.types import DateStorage
+
+
+SYMBOL_COLUMNS = ["exchange", "symbol", "source"]
 
 
 class BaseBearishTable(SQLModel):
@@ -32,10 +46,26 @@ class BaseTable(BaseBearishTable):
     id: Optional[int] = Field(default=None, primary_key=True)
 
 
-class BaseFinancials(SQLModel):
-    date: datetime = Field(primary_key=True, index=True)
-    symbol: str = Field(primary_key=True, index=True)
-    source: str = Field(primary_key=True, index=True)
+class BaseSeries(SQLModel):
+    __table_args__ = {"info": {"is_view": True}}
+    date: datetime = Field(primary_key=True)
+    symbol: str = Field(primary_key=True)
+    source: str = Field(primary_key=True)
+
+
+class BaseFinancials(BaseSeries): ...
+
+
+class SymbolORM(SQLModel, table=True):
+    __tablename__ = "symbol"
+    __table_args__ = (
+        TableIndex("ix_symbol_symbol_source", "symbol", "source", unique=True),
+        {"sqlite_autoincrement": True},
+    )
+    id: Optional[int] = Field(default=None, primary_key=True)
+    symbol: str
+    source: str
+    exchange: Optional[str] = None
 
 
 class EquityORM(BaseTable, Equity, table=True):  # type: ignore
@@ -65,25 +95,16 @@ class EtfORM(BaseTable, Etf, table=True):  # type: ignore
     sector_weightings: Optional[Dict[str, float]] = Field(None, sa_column=Column(JSON))
 
 
-class PriceORM(SQLModel, Price, table=True):  # type: ignore
+class PriceORM(BaseSeries, Price, table=True):  # type: ignore
     __tablename__ = "price"
-    date: datetime = Field(primary_key=True, index=True)
-    symbol: str = Field(primary_key=True, index=True)
-    source: str = Field(primary_key=True, index=True)  # type: ignore
 
 
-class PriceIndexORM(SQLModel, Price, table=True):  # type: ignore
+class PriceIndexORM(BaseSeries, Price, table=True):  # type: ignore
     __tablename__ = "priceindex"
-    date: datetime = Field(primary_key=True, index=True)
-    symbol: str = Field(primary_key=True, index=True)
-    source: str = Field(primary_key=True, index=True)  # type: ignore
 
 
-class PriceEtfORM(SQLModel, Price, table=True):  # type: ignore
+class PriceEtfORM(BaseSeries, Price, table=True):  # type: ignore
     __tablename__ = "priceetf"
-    date: datetime = Field(primary_key=True, index=True)
-    symbol: str = Field(primary_key=True, index=True)
-    source: str = Field(primary_key=True, index=True)  # type: ignore
 
 
 class FinancialMetricsORM(BaseFinancials, FinancialMetrics, table=True):  # type: ignore
@@ -119,20 +140,39 @@ class SourcesORM(SQLModel, table=True):
     source: str = Field(primary_key=True, index=True)
 
 
+class ApiUsageORM(SQLModel, table=True):
+    __tablename__ = "apiusage"
+    source: str = Field(primary_key=True)
+    period: str = Field(primary_key=True)
+    calls: int = 0
+
+
 class PriceTrackerORM(SQLModel, PriceTracker, table=True):
     __tablename__ = "pricetracker"
-    __table_args__ = {"sqlite_autoincrement": True}
+    __table_args__ = (
+        TableIndex("ix_pricetracker_exchange", "exchange"),
+        {"sqlite_autoincrement": True},
+    )
     source: str = Field(index=True, primary_key=True)
     symbol: str = Field(index=True, primary_key=True)
 
 
 class FinancialsTrackerORM(SQLModel, FinancialsTracker, table=True):
     __tablename__ = "financialstracker"
-    __table_args__ = {"sqlite_autoincrement": True}
+    __table_args__ = (
+        TableIndex("ix_financialstracker_exchange", "exchange"),
+        {"sqlite_autoincrement": True},
+    )
     source: str = Field(index=True, primary_key=True)
     symbol: str = Field(index=True, primary_key=True)
 
 
+class FinancialsRetryORM(SQLModel, FinancialsRetry, table=True):
+    __tablename__ = "financialsretry"
+    source: str = Field(primary_key=True)
+    symbol: str = Field(primary_key=True)
+
+
 class SecORM(SQLModel, Sec, table=True):
     __tablename__ = "sec"
     __table_args__ = {"sqlite_autoincrement": True}
@@ -146,3 +186,128 @@ class SecShareIncreaseORM(SQLModel, SecShareIncrease, table=True):
     __tablename__ = "secshareincrease"
     __table_args__ = {"sqlite_autoincrement": True}
     ticker: str = Field(index=True, primary_key=True)
+
+
+SERIES_VIEWS: List[Type[SQLModel]] = [
+    PriceORM,
+    PriceIndexORM,
+    PriceEtfORM,
+    FinancialMetricsORM,
+    BalanceSheetORM,
+    CashFlowORM,
+    QuarterlyFinancialMetricsORM,
+    QuarterlyBalanceSheetORM,
+    QuarterlyCashFlowORM,
+    EarningsDateORM,
+]
+
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_DAY_METADATA = MetaData()
+
+
+class EpochDay(TypeDecorator[datetime]):
+    """Date stored as the number of days since 1970-01-01."""
+
+    impl = Integer
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[Union[str, date]], dialect: Dialect
+    ) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if not isinstance(value, datetime):
+            value = datetime.combine(value, time())
+        return (value.replace(tzinfo=None) - EPOCH).days
+
+    def process_result_value(
+        self, value: Optional[int], dialect: Dialect
+    ) -> Optional[datetime]:
+        if value is None:
+            return None
+        return EPOCH + timedelta(days=value)
+
+
+def series_table(view: Type[SQLModel], date_storage: DateStorage = "iso") -> Table:
+    epoch_day = date_storage == "epoch_day"
+    return Table(
+        f"{view.__tablename__}data",
+        EPOCH_DAY_METADATA if epoch_day else SQLModel.metadata,
+        Column(
+            "symbol_id",
+            Integer,
+            ForeignKey(SymbolORM.__table__.c.id),  # type: ignore
+            primary_key=True,
+        ),
+        *[
+            Column(
+                column.name,
+                EpochDay() if epoch_day and column.name == "date" else column.type,
+                primary_key=column.primary_key,
+                nullable=column.nullable,
+            )
+            for column in view.__table__.columns  # type: ignore
+            if column.name not in SYMBOL_COLUMNS
+        ],
+        sqlite_with_rowid=False,
+    )
+
+
+def series_view(view: Type[SQLModel], date_storage: DateStorage = "iso") -> str:
+    columns = ", ".join(
+        (
+            f"symbol.{column.name}"
+            if column.name in SYMBOL_COLUMNS
+            else (
+                "date(data.date * 86400, 'unixepoch') || ' 00:00:00.000000' AS date"
+                if date_storage == "epoch_day" and column.name == "date"
+                else f"data.{column.name}"
+            )
+        )
+        for column in view.__table__.columns  # type: ignore
+    )
+    return (
+        f'CREATE VIEW "{view.__tablename__}" AS SELECT {columns} '
+        f'FROM "{view.__tablename__}data" AS data '
+        "JOIN symbol ON symbol.id = data.symbol_id"
+    )
+
+
+SERIES_TABLES: Dict[DateStorage, Dict[str, Table]] = {
+    date_storage: {
+        view.__tablename__: series_table(view, date_storage)  # type: ignore
+        for view in SERIES_VIEWS
+    }
+    for date_storage in get_args(DateStorage)
+}
+BEARISH_VIEWS: Dict[DateStorage, List[str]] = {
+    date_storage: [series_view(view, date_storage) for view in SERIES_VIEWS]
+    for date_storage in get_args(DateStorage)
+}
+BEARISH_TABLES: Dict[DateStorage, List[Table]] = {
+    date_storage: [
+        *[
+            table.__table__  # type: ignore
+            for table in [
+                SymbolORM,
+                EquityORM,
+                IndexORM,
+                CryptoORM,
+                CurrencyORM,
+                EtfORM,
+                SourcesORM,
+                ApiUsageORM,
+                PriceTrackerORM,
+                FinancialsTrackerORM,
+                FinancialsRetryORM,
+                SecORM,
+                SecShareIncreaseORM,
+            ]
+        ],
+        *SERIES_TABLES[date_storage].values(),
+    ]
+    for date_storage in get_args(DateStorage)
+}
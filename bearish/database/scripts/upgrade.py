@@ -1,17 +1,82 @@
 import os
+import re
 from pathlib import Path
+from typing import Optional, Set, List
 
-from alembic import command
-from alembic.config import Config
+from sqlalchemy import Connection, Table, text
+from sqlalchemy.exc import OperationalError
+from sqlmodel import SQLModel
 
 from bearish.database.settings import DATABASE_URL
 
+ALEMBIC_FOLDER = Path(__file__).parents[1] / "alembic"
+REVISION_PATTERN = re.compile(
+    r"^(revision|down_revision)\s*(?::[^=]+)?=\s*(?:[\"']([0-9a-f]+)[\"']|None)",
+    re.MULTILINE,
+)
+
+
+def read_head_revision(versions_folder: Path = ALEMBIC_FOLDER / "versions") -> str:
+    revisions: Set[str] = set()
+    down_revisions: Set[str] = set()
+    for version in versions_folder.glob("*.py"):
+        for name, revision in REVISION_PATTERN.findall(version.read_text()):
+            if name == "revision":
+                revisions.add(revision)
+            elif revision:
+                down_revisions.add(revision)
+    heads = revisions - down_revisions
+    if len(heads) != 1:
+        raise ValueError(f"Expected a single alembic head, found {sorted(heads)}")
+    return heads.pop()
+
+
+HEAD_REVISION = read_head_revision()
+
+
+def current_revision(connection: Connection) -> Optional[str]:
+    try:
+        return connection.execute(
+            text("SELECT version_num FROM alembic_version")
+        ).scalar()
+    except OperationalError:
+        return None
+
+
+def is_empty(connection: Connection) -> bool:
+    return not connection.execute(text("SELECT COUNT(*) FROM sqlite_master")).scalar()
+
+
+def stamp_head(connection: Connection) -> None:
+    connection.execute(
+        text(
+            "CREATE TABLE IF NOT EXISTS alembic_version (version_num VARCHAR(32) NOT NULL, "
+            "CONSTRAINT alembic_version_pkc PRIMARY KEY (version_num))"
+        )
+    )
+    connection.execute(text("DELETE FROM alembic_version"))
+    connection.execute(
+        text("INSERT INTO alembic_version (version_num) VALUES (:revision)"),
+        {"revision": HEAD_REVISION},
+    )
+
+
+def create_schema(
+    connection: Connection, tables: List[Table], views: List[str]
+) -> None:
+    SQLModel.metadata.create_all(connection, tables=tables)
+    for view in views:
+        connection.execute(text(view))
+    stamp_head(connection)
+
 
 def upgrade(database_url: str) -> None:
-    root_folder = Path(__file__).parents[1]
+    from alembic import command
+    from alembic.config import Config
+
     os.environ.update({"DATABASE_URL": database_url})
-    alembic_cfg = Config(root_folder / "alembic" / "alembic.ini")
-    alembic_cfg.set_main_option("script_location", str(root_folder / "alembic"))
+    alembic_cfg = Config(ALEMBIC_FOLDER / "alembic.ini")
+    alembic_cfg.set_main_option("script_location", str(ALEMBIC_FOLDER))
     command.upgrade(alembic_cfg, "head")
 
 
@@ -16,3 +16,7 @@ class FinancialDataError(Exception):
 
 class IncompleteDataError(Exception):
     pass
+
+
+class SourceNotFoundError(Exception):
+    pass
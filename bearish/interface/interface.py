@@ -2,8 +2,9 @@ import abc
 import logging
 from datetime import date
 from pathlib import Path
-from typing import List, Type, Union, Optional
+from typing import Any, Iterable, Iterator, List, Set, Type, Union, Optional
 
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, ConfigDict, validate_call
 from sqlmodel import SQLModel
@@ -15,6 +16,7 @@ from bearish.models.base import (
     Ticker,
     PriceTracker,
     FinancialsTracker,
+    FinancialsRetry,
     BaseTracker,
 )
 from bearish.models.financials.base import Financials
@@ -43,6 +45,16 @@ class BearishDbBase(BaseModel):
     ) -> None:
         return self._write_series(series, table=table)
 
+    @observability
+    def write_series_frame(
+        self,
+        series: Union[pd.DataFrame, "np.ndarray[Any, Any]"],
+        table: Optional[Type[SQLModel]] = None,
+    ) -> None:
+        if isinstance(series, np.ndarray):
+            series = pd.DataFrame.from_records(series)
+        return self._write_series_frame(series, table=table)
+
     @validate_call
     def write_sec(self, secs: List[Sec]) -> None:
         return self._write_sec(secs)
@@ -70,6 +82,33 @@ class BearishDbBase(BaseModel):
     ) -> List[Price]:
         return self._read_series(query, months, table=table)
 
+    @validate_call
+    def read_series_frame(
+        self,
+        query: AssetQuery,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        columns: Optional[List[str]] = None,
+        table: Optional[Type[SQLModel]] = None,
+    ) -> pd.DataFrame:
+        return self._read_series_frame(
+            query, start=start, end=end, columns=columns, table=table
+        )
+
+    @validate_call
+    def iter_series(
+        self, query: AssetQuery, months: int = 1, table: Optional[Type[SQLModel]] = None
+    ) -> Iterator[List[Price]]:
+        return self._iter_series(query, months, table=table)
+
+    @validate_call
+    def iter_financials(self, query: AssetQuery) -> Iterator[Financials]:
+        return self._iter_financials(query)
+
+    @validate_call
+    def iter_assets(self, query: AssetQuery) -> Iterator[Assets]:
+        return self._iter_assets(query)
+
     @validate_call
     def read_sec_companies(self) -> List[str]:
         return self._read_sec_companies()
@@ -107,7 +146,18 @@ class BearishDbBase(BaseModel):
         tracker_query: TrackerQuery,
         tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
     ) -> List[Ticker]:
-        return self._read_tracker(tracker_query, tracker_type)
+        return [
+            Ticker(symbol=t.symbol, exchange=t.exchange, source=t.source)
+            for t in self._read_trackers(tracker_query, tracker_type)
+        ]
+
+    @validate_call
+    def read_trackers(
+        self,
+        tracker_query: TrackerQuery,
+        tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
+    ) -> List[BaseTracker]:
+        return self._read_trackers(tracker_query, tracker_type)
 
     def write_trackers(
         self, trackers: List[FinancialsTracker] | List[PriceTracker]
@@ -115,9 +165,41 @@ class BearishDbBase(BaseModel):
         tracker_type = type(trackers[0])
         return self._write_trackers(trackers, tracker_type)
 
+    def read_tracked_symbols(
+        self, tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]]
+    ) -> Set[str]:
+        return self._read_tracked_symbols(tracker_type)
+
+    def read_untracked_symbols(
+        self,
+        symbols: Iterable[str],
+        tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
+    ) -> List[str]:
+        tracked = self._read_tracked_symbols(tracker_type)
+        return [symbol for symbol in symbols if symbol not in tracked]
+
     def read_query(self, query: str) -> pd.DataFrame:
         return self._read_query(query)
 
+    def write_financials_retries(self, retries: List[FinancialsRetry]) -> None:
+        if retries:
+            self._write_financials_retries(retries)
+
+    def read_financials_retries(self, source: str) -> List[FinancialsRetry]:
+        return self._read_financials_retries(source)
+
+    def delete_financials_retries(self, source: str, symbols: List[str]) -> None:
+        if symbols:
+            self._delete_financials_retries(source, symbols)
+
+    def read_api_calls(self, source: str, period: str) -> int:
+        return self._read_api_calls(source, period)
+
+    def reserve_api_calls(
+        self, source: str, period: str, calls: int, limit: Optional[int] = None
+    ) -> bool:
+        return self._reserve_api_calls(source, period, calls, limit)
+
     @abc.abstractmethod
     def _write_assets(self, assets: Assets) -> None: ...
 
@@ -126,6 +208,11 @@ class BearishDbBase(BaseModel):
         self, series: List[Price], table: Optional[Type[SQLModel]] = None
     ) -> None: ...
 
+    @abc.abstractmethod
+    def _write_series_frame(
+        self, series: pd.DataFrame, table: Optional[Type[SQLModel]] = None
+    ) -> None: ...
+
     @abc.abstractmethod
     def _write_sec(self, secs: List[Sec]) -> None: ...
 
@@ -149,6 +236,27 @@ class BearishDbBase(BaseModel):
         self, query: AssetQuery, months: int = 1, table: Optional[Type[SQLModel]] = None
     ) -> List[Price]: ...
 
+    @abc.abstractmethod
+    def _read_series_frame(
+        self,
+        query: AssetQuery,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        columns: Optional[List[str]] = None,
+        table: Optional[Type[SQLModel]] = None,
+    ) -> pd.DataFrame: ...
+
+    @abc.abstractmethod
+    def _iter_series(
+        self, query: AssetQuery, months: int = 1, table: Optional[Type[SQLModel]] = None
+    ) -> Iterator[List[Price]]: ...
+
+    @abc.abstractmethod
+    def _iter_financials(self, query: AssetQuery) -> Iterator[Financials]: ...
+
+    @abc.abstractmethod
+    def _iter_assets(self, query: AssetQuery) -> Iterator[Assets]: ...
+
     @abc.abstractmethod
     def _read_financials(self, query: AssetQuery) -> Financials: ...
 
@@ -162,11 +270,12 @@ class BearishDbBase(BaseModel):
     def _read_sources(self) -> List[str]: ...
 
     @abc.abstractmethod
-    def _read_tracker(
+    def _read_trackers(
         self,
         tracker_query: TrackerQuery,
         tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
-    ) -> List[Ticker]: ...
+    ) -> List[BaseTracker]: ...
+
     @abc.abstractmethod
     def _write_trackers(
         self,
@@ -177,8 +286,30 @@ class BearishDbBase(BaseModel):
     @abc.abstractmethod
     def _get_tickers(self, exchange_query: ExchangeQuery) -> List[Ticker]: ...
 
+    @abc.abstractmethod
+    def _read_tracked_symbols(
+        self, tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]]
+    ) -> Set[str]: ...
+
     @abc.abstractmethod
     def _read_query(self, query: str) -> pd.DataFrame: ...
 
+    @abc.abstractmethod
+    def _write_financials_retries(self, retries: List[FinancialsRetry]) -> None: ...
+
+    @abc.abstractmethod
+    def _read_financials_retries(self, source: str) -> List[FinancialsRetry]: ...
+
+    @abc.abstractmethod
+    def _delete_financials_retries(self, source: str, symbols: List[str]) -> None: ...
+
+    @abc.abstractmethod
+    def _read_api_calls(self, source: str, period: str) -> int: ...
+
+    @abc.abstractmethod
+    def _reserve_api_calls(
+        self, source: str, period: str, calls: int, limit: Optional[int] = None
+    ) -> bool: ...
+
     @abc.abstractmethod
     def read_price_tracker(self, symbol: str) -> Optional[date]: ...
@@ -1,10 +1,25 @@
 import datetime
 import logging
 import os
+import time
 from enum import Enum
 from pathlib import Path
-from typing import Optional, List, Any, get_args, Annotated, cast, Union, Type, Callable
+from typing import (
+    Optional,
+    List,
+    Any,
+    get_args,
+    Annotated,
+    cast,
+    Union,
+    Type,
+    Callable,
+    Iterator,
+    Dict,
+    Set,
+)
 
+import pandas as pd
 import typer
 from pydantic import (
     BaseModel,
@@ -17,9 +32,7 @@ from pydantic import (
 from rich.console import Console
 from sqlmodel import SQLModel
 
-from bearish.database.crud import BearishDb
-from bearish.database.schemas import PriceIndexORM, PriceEtfORM
-from bearish.exceptions import InvalidApiKeyError, LimitApiKeyReachedError
+from bearish.database.profiles import ProfileName, SqliteProfile
 from bearish.exchanges.exchanges import (
     Countries,
     exchanges_factory,
@@ -30,25 +43,32 @@ from bearish.interface.interface import BearishDbBase
 from bearish.models.api_keys.api_keys import SourceApiKeys
 from bearish.models.assets.assets import Assets
 from bearish.models.assets.index import PRICE_INDEX
-from bearish.models.base import Ticker, TrackerQuery, FinancialsTracker, PriceTracker
+from bearish.models.base import (
+    Ticker,
+    TrackerQuery,
+    FinancialsTracker,
+    PriceTracker,
+    FinancialsRetry,
+    RetryPolicy,
+    BaseTracker,
+)
 from bearish.models.financials.base import Financials
 from bearish.models.price.price import Price
-from bearish.models.price.prices import Prices
 from bearish.models.query.query import AssetQuery, Symbols
-from bearish.models.sec.sec import Secs
 from bearish.sources.base import AbstractSource
-from bearish.sources.financedatabase import FinanceDatabaseSource
-from bearish.sources.financial_modelling_prep import FmpAssetsSource, FmpSource
-from bearish.sources.investpy import InvestPySource
-from bearish.sources.tiingo import TiingoSource
-from bearish.sources.yahooquery import YahooQuerySource
-from bearish.sources.yfinance import yFinanceSource
-from bearish.types import SeriesLength, Sources
+from bearish.sources.fetch import plan_chunks, route_chunks
+from bearish.sources.registry import load_source
+from bearish.types import DateStorage, SeriesLength, Sources
 from bearish.utils.utils import batch
 
 logger = logging.getLogger(__name__)
 app = typer.Typer()
 console = Console()
+SourceSpec = Union[AbstractSource, str]
+
+
+def _source_names(*names: str) -> Callable[[], List[SourceSpec]]:
+    return lambda: list(names)
 
 
 class CountryEnum(str, Enum): ...
@@ -77,93 +97,139 @@ class Filter(BaseModel):
         return list({t for t in tickers if t.symbol in self.filters})
 
 
+def _serving_sources(
+    tickers: List[Ticker],
+    sources: List[AbstractSource],
+    covers: Optional[Callable[[AbstractSource, Ticker], bool]] = None,
+) -> Dict[str, List[str]]:
+    return {
+        t.symbol: [s.__source__ for s in sources if covers is None or covers(s, t)]
+        for t in tickers
+    }
+
+
+def _record_answers(
+    answered: Dict[str, Set[str]], source: AbstractSource, missing: List[Ticker]
+) -> List[Ticker]:
+    for ticker in missing:
+        answered.setdefault(ticker.symbol, set()).add(source.__source__)
+    return missing
+
+
 class Bearish(BaseModel):
     model_config = ConfigDict(extra="forbid")
     path: Path
     auto_migration: bool = True
+    sqlite_profile: Union[ProfileName, SqliteProfile] = "safe"
+    date_storage: DateStorage = "iso"
     batch_size: int = Field(default=100)
-    pause: int = Field(default=60)
+    pause: Optional[int] = None
     api_keys: SourceApiKeys = Field(default_factory=SourceApiKeys)
+    retry_policy: RetryPolicy = Field(default_factory=RetryPolicy)
     _bearish_db: BearishDbBase = PrivateAttr()
     exchanges: Exchanges = Field(default_factory=exchanges_factory)
-    asset_sources: List[AbstractSource] = Field(
-        default_factory=lambda: [
-            FinanceDatabaseSource(),
-            InvestPySource(),
-            FmpAssetsSource(),
-        ]
+    asset_sources: List[SourceSpec] = Field(
+        default_factory=_source_names("FinanceDatabase", "investpy", "FMPAssets")
     )
-    detailed_asset_sources: List[AbstractSource] = Field(
-        default_factory=lambda: [yFinanceSource(), YahooQuerySource(), FmpSource()]
+    detailed_asset_sources: List[SourceSpec] = Field(
+        default_factory=_source_names("Yfinance", "YahooQuery", "FMP")
     )
-    financials_sources: List[AbstractSource] = Field(
-        default_factory=lambda: [
-            yFinanceSource(),
-            YahooQuerySource(),
-            FmpSource(),
-        ]
+    financials_sources: List[SourceSpec] = Field(
+        default_factory=_source_names("Yfinance", "YahooQuery", "FMP")
     )
-    price_sources: List[AbstractSource] = Field(
-        default_factory=lambda: [
-            yFinanceSource(),
-            YahooQuerySource(),
-            TiingoSource(),
-        ]
+    price_sources: List[SourceSpec] = Field(
+        default_factory=_source_names("Yfinance", "YahooQuery", "Tiingo")
     )
+    _source_instances: Dict[str, AbstractSource] = PrivateAttr(default_factory=dict)
+    _configured_sources: Set[int] = PrivateAttr(default_factory=set)
 
     def model_post_init(self, __context: Any) -> None:
+        from bearish.database.crud import BearishDb
+
         self._bearish_db = BearishDb(
-            database_path=self.path, auto_migration=self.auto_migration
+            database_path=self.path,
+            auto_migration=self.auto_migration,
+            sqlite_profile=self.sqlite_profile,
+            date_storage=self.date_storage,
         )
-        for source in set(
-            self.financials_sources
+
+    def _get_sources(self, sources: List[SourceSpec]) -> List[AbstractSource]:
+        """Resolve source names from the registry, creating each source on first use.
+
+        Sources whose API key is rejected are dropped from ``sources``.
+        """
+        resolved = [
+            source for source in map(self._get_source, sources) if source is not None
+        ]
+        sources[:] = resolved
+        return resolved
+
+    def _get_source(self, source: SourceSpec) -> Optional[AbstractSource]:
+        if isinstance(source, str):
+            if source not in self._source_instances:
+                self._source_instances[source] = load_source(source)()  # type: ignore
+            source = self._source_instances[source]
+        if id(source) in self._configured_sources:
+            return source
+        if self.pause is not None:
+            source.set_pause(self.pause)
+        try:
+            source.set_api_key(
+                self.api_keys.keys.get(
+                    source.__source__, os.environ.get(source.__source__.upper())  # type: ignore
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Invalid API key for {source.__source__}: {e}. It will be removed from sources"
+            )
+            return None
+        if not source.api_usage.shared():
+            source.api_usage.share(source.__source__, self._bearish_db)
+        self._configured_sources.add(id(source))
+        return source
+
+    def _created_sources(self) -> List[AbstractSource]:
+        return [
+            source
+            for source in self.financials_sources
             + self.price_sources
             + self.asset_sources
             + self.detailed_asset_sources
-        ):
-            source.set_pause(self.pause)
-            try:
-                source.set_api_key(
-                    self.api_keys.keys.get(
-                        source.__source__, os.environ.get(source.__source__.upper())  # type: ignore
-                    )
-                )
-            except Exception as e:
-                logger.error(
-                    f"Invalid API key for {source.__source__}: {e}. It will be removed from sources"
-                )
-                for sources in [
-                    self.financials_sources,
-                    self.price_sources,
-                    self.asset_sources,
-                    self.detailed_asset_sources,
-                ]:
-                    if source in sources:
-                        sources.remove(source)
+            if not isinstance(source, str)
+        ]
+
+    def api_quota(self) -> Dict[Sources, int]:
+        quota = {}
+        for source in self._created_sources():
+            remaining = source.api_usage.remaining_calls()
+            if remaining is not None:
+                quota[source.__source__] = remaining
+        return quota
 
     def set_batch_size(self, batch_size: int) -> None:
         self.batch_size = batch_size
 
     def set_pause(self, pause: int) -> None:
-        for source in set(
-            self.financials_sources
-            + self.price_sources
-            + self.asset_sources
-            + self.detailed_asset_sources
-        ):
+        """Deprecated: see ``AbstractSource.set_pause``."""
+        self.pause = pause
+        for source in self._created_sources():
             source.set_pause(pause)
 
     def get_asset_sources(self) -> List[Sources]:
-        return [source.__source__ for source in self.asset_sources]
+        return [source.__source__ for source in self._get_sources(self.asset_sources)]
 
     def get_detailed_asset_sources(self) -> List[Sources]:
-        return [source.__source__ for source in self.detailed_asset_sources]
+        return [
+            source.__source__
+            for source in self._get_sources(self.detailed_asset_sources)
+        ]
 
     def write_assets(self, query: Optional[AssetQuery] = None) -> None:
         existing_sources = self._bearish_db.read_sources()
         asset_sources = [
             asset_source
-            for asset_source in self.asset_sources
+            for asset_source in self._get_sources(self.asset_sources)
             if asset_source.__source__ not in existing_sources
         ]
         logger.debug(f"Found asset sources: {[s.__source__ for s in asset_sources]}")
@@ -171,7 +237,9 @@ class Bearish(BaseModel):
 
     def write_detailed_assets(self, query: Optional[AssetQuery] = None) -> None:
         return self._write_base_assets(
-            self.detailed_asset_sources, query, use_all_sources=False
+            self._get_sources(self.detailed_asset_sources),
+            query,
+            use_all_sources=False,
         )
 
     def _write_base_assets(
@@ -219,6 +287,32 @@ class Bearish(BaseModel):
     ) -> List[Price]:
         return self._bearish_db.read_series(assets_query, months=months, table=table)
 
+    def iter_series(
+        self,
+        assets_query: AssetQuery,
+        months: int = 1,
+        table: Optional[Type[SQLModel]] = None,
+    ) -> Iterator[List[Price]]:
+        return self._bearish_db.iter_series(assets_query, months=months, table=table)
+
+    def iter_financials(self, assets_query: AssetQuery) -> Iterator[Financials]:
+        return self._bearish_db.iter_financials(assets_query)
+
+    def iter_assets(self, assets_query: AssetQuery) -> Iterator[Assets]:
+        return self._bearish_db.iter_assets(assets_query)
+
+    def read_series_frame(
+        self,
+        assets_query: AssetQuery,
+        start: Optional[datetime.date] = None,
+        end: Optional[datetime.date] = None,
+        columns: Optional[List[str]] = None,
+        table: Optional[Type[SQLModel]] = None,
+    ) -> pd.DataFrame:
+        return self._bearish_db.read_series_frame(
+            assets_query, start=start, end=end, columns=columns, table=table
+        )
+
     def _get_tracked_tickers(
         self,
         tracker_query: TrackerQuery,
@@ -226,50 +320,166 @@ class Bearish(BaseModel):
     ) -> List[Ticker]:
         return self._bearish_db.read_tracker(tracker_query, tracker_type)
 
+    def _get_untracked_tickers(
+        self,
+        tickers: List[Ticker],
+        tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
+    ) -> List[Ticker]:
+        untracked = set(
+            self._bearish_db.read_untracked_symbols(
+                (t.symbol for t in tickers), tracker_type
+            )
+        )
+        return [t for t in tickers if t.symbol in untracked]
+
     def get_tickers_without_financials(self, tickers: List[Ticker]) -> List[Ticker]:
-        tracked_tickers = self._get_tracked_tickers(TrackerQuery(), FinancialsTracker)
-        return [t for t in tickers if t not in tracked_tickers]
+        return self._get_untracked_tickers(tickers, FinancialsTracker)
 
     def get_tickers_without_price(self, tickers: List[Ticker]) -> List[Ticker]:
-        return [
-            t
-            for t in tickers
-            if t not in self._get_tracked_tickers(TrackerQuery(), PriceTracker)
-        ]
+        return self._get_untracked_tickers(tickers, PriceTracker)
 
     def get_ticker_with_price(self) -> List[Ticker]:
         return [
-            Ticker(symbol=t)
-            for t in self._get_tracked_tickers(TrackerQuery(), PriceTracker)
+            Ticker(symbol=symbol)
+            for symbol in sorted(self._bearish_db.read_tracked_symbols(PriceTracker))
         ]
 
     def write_many_financials(self, tickers: List[Ticker]) -> None:
         logger.warning(f"Found tickers without financials: {len(tickers)}")
-        chunks = batch(tickers, size=self.batch_size)
-        source = self.financials_sources[0]
-
-        for chunk in chunks:
-            logger.debug(f"getting financial data for {len(chunk)} tickers")
-            try:
-                financials_ = source.read_financials(chunk)
-            except (InvalidApiKeyError, LimitApiKeyReachedError, Exception) as e:
-                logger.error(f"Error reading data using {source.__source__}: {e}")
-                continue
+        sources = self._get_sources(self.financials_sources)
+        answered: Dict[str, Set[str]] = {}
+
+        def _write(
+            source: AbstractSource, chunk: List[Ticker], financials_: List[Financials]
+        ) -> List[Ticker]:
+            missing = self._write_financials(source, chunk, financials_)
+            return _record_answers(answered, source, missing)
+
+        unserved = route_chunks(
+            plan_chunks(
+                tickers, sources, self.batch_size, covers=AbstractSource.covers
+            ),
+            sources,
+            self._fetch_financials,
+            _write,
+        )
+        self._track_without_data(
+            unserved,
+            _serving_sources(tickers, sources, AbstractSource.covers),
+            answered,
+            FinancialsTracker,
+        )
+        for source in sources:
+            self._drain_financials_retries(source)
 
-            if not financials_:
-                logger.warning("No financial data found.")
-                continue
+    def _fetch_financials(
+        self, source: AbstractSource, chunk: List[Ticker]
+    ) -> List[Financials]:
+        logger.debug(f"getting financial data for {len(chunk)} tickers")
+        return cast(List[Financials], source.read_financials(chunk, raise_errors=True))
+
+    def _write_financials(
+        self, source: AbstractSource, chunk: List[Ticker], financials_: List[Financials]
+    ) -> List[Ticker]:
+        deferred = source.pop_deferred([t.symbol for t in chunk])
+        found = {symbol for f in financials_ for symbol in f.symbols()}
+        if not found and not deferred:
+            logger.warning(f"No financial data found using {source.__source__}.")
+            return chunk
+        self._update_financials_retries(source, chunk, deferred)
+        if found:
             self._bearish_db.write_financials(financials_)
+        tracked = [t for t in chunk if t.symbol in found and t.symbol not in deferred]
+        if tracked:
             self._bearish_db.write_trackers(
                 [
                     FinancialsTracker(
                         symbol=t.symbol,
                         source=source.__source__,
                         exchange=t.exchange,
+                        date=datetime.date.today(),
                     )
-                    for t in chunk
+                    for t in tracked
                 ]
             )
+        return [t for t in chunk if t.symbol not in found and t.symbol not in deferred]
+
+    def _write_financials_chunk(
+        self, source: AbstractSource, chunk: List[Ticker]
+    ) -> bool:
+        try:
+            financials_ = self._fetch_financials(source, chunk)
+        except Exception as e:
+            logger.error(f"Error reading data using {source.__source__}: {e}")
+            return False
+        return len(self._write_financials(source, chunk, financials_)) < len(chunk)
+
+    def _update_financials_retries(
+        self, source: AbstractSource, chunk: List[Ticker], deferred: Dict[str, str]
+    ) -> None:
+        queued = {
+            retry.symbol: retry
+            for retry in self._bearish_db.read_financials_retries(source.__source__)
+        }
+        retries = []
+        done = []
+        for ticker in chunk:
+            if ticker.symbol not in deferred:
+                if ticker.symbol in queued:
+                    done.append(ticker.symbol)
+                continue
+            attempts = (
+                queued[ticker.symbol].attempts + 1 if ticker.symbol in queued else 1
+            )
+            next_attempt = self.retry_policy.next_attempt(attempts)
+            if next_attempt is None:
+                logger.error(
+                    f"Giving up on financials for {ticker.symbol} after {attempts} "
+                    f"attempts: {deferred[ticker.symbol]}"
+                )
+                done.append(ticker.symbol)
+                continue
+            retries.append(
+                FinancialsRetry(
+                    source=source.__source__,
+                    symbol=ticker.symbol,
+                    exchange=ticker.exchange,
+                    attempts=attempts,
+                    next_attempt=next_attempt,
+                    error=deferred[ticker.symbol],
+                )
+            )
+        self._bearish_db.delete_financials_retries(source.__source__, done)
+        self._bearish_db.write_financials_retries(retries)
+
+    def _drain_financials_retries(self, source: AbstractSource) -> None:
+        deadline = datetime.datetime.now() + datetime.timedelta(
+            seconds=self.retry_policy.drain_wait
+        )
+        while retries := self._bearish_db.read_financials_retries(source.__source__):
+            if retries[0].next_attempt > deadline:
+                logger.info(
+                    f"Keeping {len(retries)} financials retries for a later run."
+                )
+                return
+            wait = (retries[0].next_attempt - datetime.datetime.now()).total_seconds()
+            if wait > 0:
+                logger.info(
+                    f"Retrying financials for {len(retries)} tickers in {wait:.0f} s"
+                )
+                time.sleep(wait)
+            now = datetime.datetime.now()
+            due = [
+                Ticker(symbol=retry.symbol, exchange=retry.exchange)
+                for retry in retries
+                if retry.next_attempt <= now
+            ]
+            for chunk in batch(due, size=self.batch_size):
+                if not self._write_financials_chunk(source, chunk):
+                    logger.warning(
+                        f"Keeping {len(retries)} financials retries for a later run."
+                    )
+                    return
 
     @validate_call
     def write_many_series(
@@ -280,30 +490,84 @@ class Bearish(BaseModel):
         table: Optional[Type[SQLModel]] = None,
         track: bool = True,
     ) -> None:
-        chunks = batch(tickers, self.batch_size)
-        source = self.price_sources[0]
-        for chunk in chunks:
-            logger.debug(f"getting financial data for {len(chunk)} tickers")
-            try:
-                series_ = source.read_series(chunk, type, apply_filter=apply_filter)
-            except (InvalidApiKeyError, LimitApiKeyReachedError, Exception) as e:
-                logger.error(f"Error reading series: {e}")
-                continue
-            if series_:
-                self._bearish_db.write_series(series_, table=table)
-                if track:
-                    prices_date = Prices(prices=series_)
-                    self._bearish_db.write_trackers(
-                        [
-                            PriceTracker(
-                                symbol=t.symbol,
-                                source=source.__source__,
-                                exchange=t.exchange,
-                                date=prices_date.ticker_date(t.symbol),
-                            )
-                            for t in chunk
-                        ]
-                    )
+        answered: Dict[str, Set[str]] = {}
+
+        def _fetch(source: AbstractSource, chunk: List[Ticker]) -> pd.DataFrame:
+            logger.debug(f"getting price data for {len(chunk)} tickers")
+            return cast(
+                pd.DataFrame,
+                source.read_series_frame(
+                    chunk, type, apply_filter=apply_filter, raise_errors=True
+                ),
+            )
+
+        def _write(
+            source: AbstractSource, chunk: List[Ticker], series_: pd.DataFrame
+        ) -> List[Ticker]:
+            if series_.empty:
+                return _record_answers(answered, source, chunk)
+            self._bearish_db.write_series_frame(series_, table=table)
+            dates = (
+                pd.to_datetime(series_["date"]).groupby(series_["symbol"]).max().dt.date
+            )
+            trackers = [
+                PriceTracker(
+                    symbol=t.symbol,
+                    source=source.__source__,
+                    exchange=t.exchange,
+                    date=dates[t.symbol],
+                )
+                for t in chunk
+                if t.symbol in dates
+            ]
+            if track and trackers:
+                self._bearish_db.write_trackers(trackers)
+            missing = [t for t in chunk if t.symbol not in dates]
+            return _record_answers(answered, source, missing)
+
+        covers = AbstractSource.covers if apply_filter else None
+        sources = self._get_sources(self.price_sources)
+        unserved = route_chunks(
+            plan_chunks(tickers, sources, self.batch_size, covers=covers),
+            sources,
+            _fetch,
+            _write,
+        )
+        if track:
+            self._track_without_data(
+                unserved,
+                _serving_sources(tickers, sources, covers),
+                answered,
+                PriceTracker,
+            )
+
+    def _track_without_data(
+        self,
+        unserved: List[Ticker],
+        serving: Dict[str, List[str]],
+        answered: Dict[str, Set[str]],
+        tracker_type: Type[BaseTracker],
+    ) -> None:
+        """Track tickers that every source able to serve them answered without data.
+
+        They are tracked as of today, so updates only ask for them again once
+        their tracker goes stale, and then for a short window rather than the
+        full history. Tickers a source failed on stay untracked.
+        """
+        trackers = [
+            tracker_type(
+                symbol=t.symbol,
+                source=serving[t.symbol][0],
+                exchange=t.exchange,
+                date=datetime.date.today(),
+            )
+            for t in unserved
+            if serving[t.symbol]
+            and set(serving[t.symbol]) <= answered.get(t.symbol, set())
+        ]
+        if trackers:
+            logger.warning(f"No source has data for {len(trackers)} tickers")
+            self._bearish_db.write_trackers(trackers)  # type: ignore
 
     def read_sources(self) -> List[str]:
         return self._bearish_db.read_sources()
@@ -344,6 +608,8 @@ class Bearish(BaseModel):
         self.write_many_series(tickers, "max")
 
     def get_prices_index(self, series_length: SeriesLength = "max") -> None:
+        from bearish.database.schemas import PriceIndexORM
+
         asset_query = AssetQuery(symbols=Symbols(index=PRICE_INDEX))  # type: ignore
         assets = self.read_assets(asset_query)
         self.write_many_series(
@@ -357,6 +623,8 @@ class Bearish(BaseModel):
     def get_prices_etf(
         self, series_length: SeriesLength = "max", limit: Optional[int] = None
     ) -> List[str]:
+        from bearish.database.schemas import PriceEtfORM
+
         query_etfs = "SELECT DISTINCT symbol from etf;"
         etf_symbols = self._bearish_db.read_query(query_etfs)["symbol"].tolist()
         if limit:
@@ -373,34 +641,44 @@ class Bearish(BaseModel):
     def _update(
         self,
         tracker_type: Union[Type[PriceTracker], Type[FinancialsTracker]],
-        write_function: Callable[[List[Ticker]], None],
+        write_function: Callable[[List[BaseTracker]], None],
         symbols: Optional[List[str]] = None,
         reference_date: Optional[datetime.date] = None,
         delay: int = 5,
     ) -> None:
         reference_date = reference_date or datetime.date.today()
-        tickers = self._get_tracked_tickers(
+        trackers = self._bearish_db.read_trackers(
             TrackerQuery(reference_date=reference_date, delay=delay), tracker_type
         )
         if symbols is not None:
-            tickers = [t for t in tickers if t.symbol in symbols]
-        write_function(tickers)
+            trackers = [t for t in trackers if t.symbol in symbols]
+        write_function(trackers)
 
-    def update_prices(  # noqa: PLR0913
+    def update_prices(  # noqa: PLR0913, PLR0917
         self,
         symbols: Optional[List[str]] = None,
         reference_date: Optional[datetime.date] = None,
         delay: int = 1,
-        series_length: SeriesLength = "1mo",
+        series_length: Optional[SeriesLength] = None,
         batch_size: int = 100,
-        pause: int = 60,
+        pause: Optional[int] = None,
     ) -> None:
-        def write_function(tickers: List[Ticker]) -> None:
-            logger.debug(f"Updating prices for {len(tickers)} tickers")
-            self.write_many_series(tickers, series_length, apply_filter=False)
+        reference_date = reference_date or datetime.date.today()
+
+        def write_function(trackers: List[BaseTracker]) -> None:
+            windows: Dict[SeriesLength, List[Ticker]] = {}
+            for tracker in cast(List[PriceTracker], trackers):
+                window = series_length or tracker.series_length(reference_date)
+                windows.setdefault(window, []).append(
+                    Ticker(symbol=tracker.symbol, exchange=tracker.exchange)
+                )
+            for window, tickers in windows.items():
+                logger.debug(f"Updating {window} prices for {len(tickers)} tickers")
+                self.write_many_series(tickers, window, apply_filter=False)
 
         self.set_batch_size(batch_size)
-        self.set_pause(pause)
+        if pause is not None:
+            self.set_pause(pause)
         self._update(
             PriceTracker,
             write_function,
@@ -415,8 +693,10 @@ class Bearish(BaseModel):
         reference_date: Optional[datetime.date] = None,
         delay: int = 20,
     ) -> None:
-        def write_function(tickers: List[Ticker]) -> None:
-            self.write_many_financials(tickers)
+        def write_function(trackers: List[BaseTracker]) -> None:
+            self.write_many_financials(
+                [Ticker(symbol=t.symbol, exchange=t.exchange) for t in trackers]
+            )
 
         self._update(
             FinancialsTracker,
@@ -427,8 +707,13 @@ class Bearish(BaseModel):
         )
 
 
+def _log_api_quota(bearish: Bearish) -> None:
+    for source, remaining in bearish.api_quota().items():
+        console.log(f"[bold]{source}[/bold] API calls remaining: {remaining}")
+
+
 @app.command()
-def run(  # noqa: PLR0913
+def run(  # noqa: PLR0913, PLR0917
     path: Path,
     countries: Annotated[List[CountriesEnum], typer.Argument()],
     filters: Optional[str] = None,
@@ -437,12 +722,20 @@ def run(  # noqa: PLR0913
     index: bool = True,
     sec: bool = True,
     financials: bool = True,
+    sqlite_profile: str = "safe",
+    date_storage: str = "iso",
 ) -> None:
     console.log(
         f"Fetching assets to database for countries: {countries}, with filters: {filters}",
     )
     source_api_keys = SourceApiKeys.from_file(api_keys)
-    bearish = Bearish(path=path, api_keys=source_api_keys)
+    bearish = Bearish(
+        path=path,
+        api_keys=source_api_keys,
+        sqlite_profile=sqlite_profile,
+        date_storage=date_storage,
+    )
+    _log_api_quota(bearish)
     with console.status("[bold green]Fetching Tickers data..."):
         bearish.write_assets()
         filter = Filter(countries=countries, filters=filters)
@@ -461,6 +754,8 @@ def run(  # noqa: PLR0913
             console.log("[bold][red]Price etf downloaded!")
     if sec:
         with console.status("[bold green]Fetching SEC data..."):
+            from bearish.models.sec.sec import Secs
+
             Secs.upload(bearish._bearish_db)  # type: ignore
             console.log("[bold][red]SEC data downloaded!")
     if financials:
@@ -483,6 +778,7 @@ def tickers(
         )
         source_api_keys = SourceApiKeys.from_file(api_keys)
         bearish = Bearish(path=path, api_keys=source_api_keys)
+        _log_api_quota(bearish)
         if not skip_base_tickers:
             console.log("[green]Fetching base Tickers[/green]")
             bearish.write_assets()
@@ -502,6 +798,7 @@ def financials(
     with console.status("[bold green]Fetching Financial data..."):
         source_api_keys = SourceApiKeys.from_file(api_keys)
         bearish = Bearish(path=path, api_keys=source_api_keys)
+        _log_api_quota(bearish)
         filter = Filter(countries=countries, filters=filters)
         bearish.get_financials(filter)
         console.log("[bold][red]Financial data downloaded!")
@@ -517,6 +814,7 @@ def prices(
     with console.status("[bold green]Fetching Price data..."):
         source_api_keys = SourceApiKeys.from_file(api_keys)
         bearish = Bearish(path=path, api_keys=source_api_keys)
+        _log_api_quota(bearish)
         filter = Filter(countries=countries, filters=filters)
         bearish.get_prices(filter)
         console.log("[bold][red]Price data downloaded!")
@@ -530,11 +828,13 @@ def sec(
     with console.status("[bold green]Fetching SEC data..."):
         source_api_keys = SourceApiKeys.from_file(api_keys)
         bearish = Bearish(path=path, api_keys=source_api_keys)
+        from bearish.models.sec.sec import Secs
+
         Secs.upload(bearish._bearish_db)  # type: ignore
 
 
 @app.command()
-def update(  # noqa: PLR0913
+def update(  # noqa: PLR0913, PLR0917
     path: Path,
     etf: bool = True,
     index: bool = True,
@@ -542,16 +842,24 @@ def update(  # noqa: PLR0913
     financials: bool = True,
     symbols: Optional[List[str]] = None,
     api_keys: Optional[Path] = None,
-    series_length: str = "1mo",
+    series_length: Optional[str] = None,
+    sqlite_profile: str = "safe",
 ) -> None:
     source_api_keys = SourceApiKeys.from_file(api_keys)
-    bearish = Bearish(path=path, api_keys=source_api_keys)
+    bearish = Bearish(
+        path=path,
+        api_keys=source_api_keys,
+        sqlite_profile=sqlite_profile,
+    )
+    _log_api_quota(bearish)
     bearish.update_prices(symbols, series_length=series_length)  # type: ignore
     if index:
-        bearish.get_prices_index(series_length=series_length)  # type: ignore
+        bearish.get_prices_index(series_length=series_length or "1mo")  # type: ignore
     if etf:
-        bearish.get_prices_etf(series_length=series_length)  # type: ignore
+        bearish.get_prices_etf(series_length=series_length or "1mo")  # type: ignore
     if sec:
+        from bearish.models.sec.sec import Secs
+
         Secs.upload(bearish._bearish_db)  # type: ignore
     if financials:
         bearish.update_financials(symbols)
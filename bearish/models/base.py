@@ -1,7 +1,7 @@
 import abc
 import datetime
 from datetime import date
-from typing import Dict, Any, ClassVar, Optional
+from typing import Dict, Any, ClassVar, List, Optional, Tuple
 
 from pydantic import (
     BaseModel,
@@ -11,7 +11,15 @@ from pydantic import (
     Field,
 )
 
-from bearish.types import Sources
+from bearish.types import SeriesLength, Sources
+
+SERIES_WINDOWS: List[Tuple[int, SeriesLength]] = [
+    (1, "1d"),
+    (6, "5d"),
+    (28, "1mo"),
+    (89, "3mo"),
+    (180, "6mo"),
+]
 
 
 class BaseAssets(BaseModel):
@@ -53,12 +61,41 @@ class BaseTracker(BaseTrackerQuery):
     date: datetime.date = Field(default_factory=lambda: date(1970, 1, 1))
 
 
-class PriceTracker(BaseTracker): ...
+class PriceTracker(BaseTracker):
+    def series_length(self, reference_date: datetime.date) -> SeriesLength:
+        """Shortest series length covering the days since the last tracked price."""
+        days = (reference_date - self.date).days
+        for max_days, series_length in SERIES_WINDOWS:
+            if days <= max_days:
+                return series_length
+        return "max"
 
 
 class FinancialsTracker(BaseTracker): ...
 
 
+class FinancialsRetry(BaseModel):
+    source: str
+    symbol: str
+    exchange: Optional[str] = None
+    attempts: int = 1
+    next_attempt: datetime.datetime = Field(default_factory=datetime.datetime.now)
+    error: Optional[str] = None
+
+
+class RetryPolicy(BaseModel):
+    min_wait: float = 60
+    max_wait: float = 1200
+    max_attempts: int = 5
+    drain_wait: float = 60
+
+    def next_attempt(self, attempts: int) -> Optional[datetime.datetime]:
+        if attempts >= self.max_attempts:
+            return None
+        wait = min(self.max_wait, self.min_wait * 2 ** (attempts - 1))
+        return datetime.datetime.now() + datetime.timedelta(seconds=wait)
+
+
 class DataSourceBase(SourceBase, Ticker):
     source: Sources
     date: datetime.date
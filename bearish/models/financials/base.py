@@ -1,6 +1,6 @@
 import datetime
 import logging
-from typing import List, Dict, Any, TYPE_CHECKING
+from typing import List, Dict, Any, Set, TYPE_CHECKING
 
 import pandas as pd
 from pydantic import BaseModel, Field
@@ -50,6 +50,13 @@ class Financials(BaseModel):
         self.quarterly_cash_flows.extend(financials.quarterly_cash_flows)
         self.earnings_date.extend(financials.earnings_date)
 
+    def symbols(self) -> Set[str]:
+        return {
+            field_.symbol
+            for field in type(self).model_fields
+            for field_ in getattr(self, field)
+        }
+
     def is_empty(self) -> bool:
         return not any(
             [
@@ -1,23 +1,33 @@
+import logging
+import os
+import pickle
 import re
 import tempfile
 import xml.etree.ElementTree as ET
 from collections import defaultdict
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
 from typing import Optional, List, Dict, TYPE_CHECKING, Self
 
 import pandas as pd
-import requests  # type: ignore
 from pydantic import BaseModel
-from sec_cik_mapper import StockMapper  # type: ignore
-from sec_edgar_downloader import Downloader  # type: ignore
 
 from bearish.models.sec.ciks import CIKS
+from bearish.utils.http import http_client
 
 if TYPE_CHECKING:
     from bearish.database.crud import BearishDb
 
+logger = logging.getLogger(__name__)
+
+CACHE_FOLDER = Path(
+    os.environ.get("BEARISH_CACHE_FOLDER", Path.home() / ".cache" / "bearish")
+)
+TICKER_MAPPING_VERSION = 1
+TICKER_MAPPING_TTL = timedelta(days=7)
+
 
 def normalize(s: str) -> str:
     s = s.upper()
@@ -30,6 +40,8 @@ def normalize(s: str) -> str:
 
 
 def company_ticker() -> Dict[str, str]:
+    from sec_cik_mapper import StockMapper  # type: ignore
+
     nasdaq_url = "https://www.nasdaqtrader.com/dynamic/symdir/nasdaqlisted.txt"
     other_url = "https://www.nasdaqtrader.com/dynamic/symdir/otherlisted.txt"
     data_ = []
@@ -37,7 +49,7 @@ def company_ticker() -> Dict[str, str]:
     mapper = StockMapper()
 
     for url in [nasdaq_url, other_url]:
-        response = requests.get(url, headers=headers, timeout=30)
+        response = http_client().get(url, headers=headers, timeout=30)
         response.raise_for_status()
         data = pd.read_csv(StringIO(response.text), delimiter="|")
         data = data.rename(columns={"ACT Symbol": "Symbol"})
@@ -53,7 +65,48 @@ def company_ticker() -> Dict[str, str]:
     return ticker_mapping
 
 
-TICKER_MAPPING = company_ticker()
+def load_ticker_mapping(
+    cache_path: Path = CACHE_FOLDER / "ticker_mapping.pickle",
+    ttl: timedelta = TICKER_MAPPING_TTL,
+) -> Dict[str, str]:
+    cached = None
+    try:
+        with cache_path.open("rb") as file:
+            cached = pickle.load(file)  # noqa: S301
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable ticker mapping cache {cache_path}: {e}")
+    if cached is not None and cached.get("version") != TICKER_MAPPING_VERSION:
+        cached = None
+    if cached is not None and datetime.now() - cached["created_at"] < ttl:
+        return cached["mapping"]  # type: ignore
+    try:
+        mapping = company_ticker()
+    except Exception as e:
+        if cached is None:
+            raise
+        logger.warning(f"Using expired ticker mapping cache {cache_path}: {e}")
+        return cached["mapping"]  # type: ignore
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    with temporary_path.open("wb") as file:
+        pickle.dump(
+            {
+                "version": TICKER_MAPPING_VERSION,
+                "created_at": datetime.now(),
+                "mapping": mapping,
+            },
+            file,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    temporary_path.replace(cache_path)
+    return mapping
+
+
+@lru_cache(maxsize=1)
+def get_ticker_mapping() -> Dict[str, str]:
+    return load_ticker_mapping()
 
 
 class BaseSecShare(BaseModel):
@@ -208,6 +261,7 @@ class Secs(BaseModel):
         unique_secs = []
         groups = defaultdict(list)
         date__ = date_ or date.today() - timedelta(days=31 * 7)
+        from sec_edgar_downloader import Downloader  # type: ignore
 
         with tempfile.TemporaryDirectory() as tmpdir:
             dl = Downloader(
@@ -217,7 +271,7 @@ class Secs(BaseModel):
             for p in list(Path(tmpdir).rglob("*.txt")):
                 rows.extend(
                     _info_table_to_rows(
-                        p.read_text(), source, ticker_mapping=TICKER_MAPPING
+                        p.read_text(), source, ticker_mapping=get_ticker_mapping()
                     )
                 )
             for item in rows:
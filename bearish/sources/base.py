@@ -1,22 +1,35 @@
 import abc
 import logging
-from functools import wraps
+import threading
+import warnings
+from functools import cached_property, wraps
 from io import StringIO
-from typing import List, Optional, Type, Callable, Any, cast
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Protocol, Type, Callable, Any, cast
 
 import pandas as pd
-import requests  # type: ignore
-from pydantic import ConfigDict, validate_call, BaseModel, Field
+from pydantic import ConfigDict, validate_call, BaseModel, Field, PrivateAttr
 
 from bearish.exceptions import InvalidApiKeyError, LimitApiKeyReachedError
-from bearish.exchanges.exchanges import Countries, Exchanges, exchanges_factory
+from bearish.exchanges.exchanges import (
+    Countries,
+    ExchangeQuery,
+    Exchanges,
+    exchanges_factory,
+)
 from bearish.models.query.query import AssetQuery
 from bearish.models.assets.assets import Assets
 from bearish.models.base import SourceBase, DataSourceBase, Ticker
 
 from bearish.models.financials.base import Financials
 from bearish.models.price.price import Price
-from bearish.types import Sources, SeriesLength
+from bearish.sources.rate_limit import (
+    RateLimiter,
+    configure_rate_limiter,
+    rate_limit_state,
+)
+from bearish.types import Backends, Sources, SeriesLength
+from bearish.utils.http import http_client
 from bearish.utils.utils import observability
 
 logger = logging.getLogger(__name__)
@@ -41,15 +54,61 @@ class ValidTickers(BaseModel):
             )
 
 
+class ApiUsageLedger(Protocol):
+    def read_api_calls(self, source: str, period: str) -> int: ...
+
+    def reserve_api_calls(
+        self, source: str, period: str, calls: int, limit: Optional[int] = None
+    ) -> bool: ...
+
+
 class ApiUsage(BaseModel):
     calls: int = 0
     calls_limit: Optional[int] = None
+    window: timedelta = timedelta(days=1)
+    _source: Optional[str] = PrivateAttr(default=None)
+    _ledger: Optional[ApiUsageLedger] = PrivateAttr(default=None)
+
+    def share(self, source: str, ledger: ApiUsageLedger) -> None:
+        self._source = source
+        self._ledger = ledger
+
+    def shared(self) -> bool:
+        return self._ledger is not None
+
+    def current_period(self) -> str:
+        window = self.window.total_seconds()
+        start = datetime.now(timezone.utc).timestamp() // window * window
+        return datetime.fromtimestamp(start, timezone.utc).isoformat()
+
+    def total_calls(self) -> int:
+        if self._ledger is not None and self._source is not None:
+            return self._ledger.read_api_calls(self._source, self.current_period())
+        return self.calls
+
+    def remaining_calls(self) -> Optional[int]:
+        if not self.calls_limit:
+            return None
+        return max(0, self.calls_limit - self.total_calls())
 
     def limit_reached(self) -> bool:
-        return self.calls >= self.calls_limit if self.calls_limit else False
+        return self.total_calls() >= self.calls_limit if self.calls_limit else False
 
     def add_api_calls(self, calls: int) -> None:
         self.calls += calls
+        if self._ledger is not None and self._source is not None:
+            self._ledger.reserve_api_calls(self._source, self.current_period(), calls)
+
+    def reserve_api_calls(self, calls: int) -> bool:
+        if self._ledger is not None and self._source is not None:
+            if not self._ledger.reserve_api_calls(
+                self._source, self.current_period(), calls, self.calls_limit
+            ):
+                return False
+        elif self.calls_limit and self.calls + calls > self.calls_limit:
+            return False
+        self.calls += calls
+        return True
 
 
 def check_api_limit(func: Callable[..., Any]) -> Callable[..., Any]:
@@ -60,17 +119,57 @@ def check_api_limit(func: Callable[..., Any]) -> Callable[..., Any]:
                 f"API '{self.__source__}' Limit reached : {self.api_usage.calls_limit}"
             )
         logger.debug(f"API '{self.__source__}' call count: {self.api_usage.calls}")
+        self.rate_limiter.acquire()
         return func(self, *args, **kwargs)
 
     return cast(Callable[..., Any], wrapper)
 
 
 class AbstractSource(SourceBase, abc.ABC):
+    __backend__: Optional[Backends] = None
     model_config = ConfigDict(arbitrary_types_allowed=True)
     countries: List[Countries]
     exchanges: Exchanges = Field(default_factory=exchanges_factory)
     api_usage: ApiUsage = Field(default_factory=ApiUsage)
-    pause: int = 60
+    pause: Optional[int] = None
+    concurrency: int = 1
+    rate: Optional[float] = None
+    burst: int = 1
+    _deferred: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _deferred_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any) -> None:
+        if self.pause is not None:
+            self.set_pause(self.pause)
+        state = rate_limit_state()
+        if state is not None:
+            self.api_usage.share(self.__source__, state)
+
+    @cached_property
+    def rate_limiter(self) -> RateLimiter:
+        return configure_rate_limiter(
+            self.__backend__ or self.__source__, rate=self.rate, burst=self.burst
+        )
+
+    @cached_property
+    def exchange_query(self) -> ExchangeQuery:
+        return self.exchanges.get_exchange_query(self.countries)
+
+    def covers(self, ticker: Ticker) -> bool:
+        return self.exchange_query.included(ticker)
+
+    def defer(self, symbol: str, error: str) -> None:
+        """Mark ``symbol`` as failed so that the caller can retry it later."""
+        with self._deferred_lock:
+            self._deferred[symbol] = error
+
+    def pop_deferred(self, symbols: List[str]) -> Dict[str, str]:
+        with self._deferred_lock:
+            return {
+                symbol: self._deferred.pop(symbol)
+                for symbol in symbols
+                if symbol in self._deferred
+            }
 
     @validate_call(validate_return=True)
     @check_api_limit
@@ -93,15 +192,11 @@ class AbstractSource(SourceBase, abc.ABC):
     @validate_call(validate_return=True)
     @check_api_limit
     @observability
-    def read_financials(self, tickers: List[Ticker]) -> List[Financials]:
+    def read_financials(
+        self, tickers: List[Ticker], raise_errors: bool = False
+    ) -> List[Financials]:
 
-        tickers = [
-            ticker
-            for ticker in tickers
-            if self.exchanges.ticker_belongs_to_countries(
-                ticker, countries=self.countries
-            )
-        ]
+        tickers = [ticker for ticker in tickers if self.covers(ticker)]
 
         try:
             logger.info(f"Reading Financials from {type(self).__name__}")
@@ -111,23 +206,25 @@ class AbstractSource(SourceBase, abc.ABC):
             raise e
         except Exception as e:
             logger.error(f"Error reading Financials from {type(self).__name__}: {e}")
+            if raise_errors:
+                raise
 
         return []
 
+    def _filter_tickers(
+        self, tickers: List[Ticker], apply_filter: bool = True
+    ) -> List[Ticker]:
+        if not apply_filter:
+            return tickers
+        return [ticker for ticker in tickers if self.covers(ticker)]
+
     @validate_call(validate_return=True)
     @check_api_limit
     @observability
     def read_series(
         self, tickers: List[Ticker], type_: SeriesLength, apply_filter: bool = True
     ) -> List[Price]:
-        if apply_filter:
-            tickers = [
-                ticker
-                for ticker in tickers
-                if self.exchanges.ticker_belongs_to_countries(
-                    ticker, countries=self.countries
-                )
-            ]
+        tickers = self._filter_tickers(tickers, apply_filter)
         try:
             prices_ = self._read_series([t.symbol for t in tickers], type_)
             return [p for p in prices_ if p.valid()]
@@ -138,6 +235,36 @@ class AbstractSource(SourceBase, abc.ABC):
 
         return []
 
+    @check_api_limit
+    @observability
+    def read_series_frame(
+        self,
+        tickers: List[Ticker],
+        type_: SeriesLength,
+        apply_filter: bool = True,
+        raise_errors: bool = False,
+    ) -> pd.DataFrame:
+        tickers = self._filter_tickers(tickers, apply_filter)
+        try:
+            prices_ = self._read_series_frame([t.symbol for t in tickers], type_)
+            if prices_.empty:
+                return prices_
+            return prices_.dropna(subset=["open", "high", "low", "close", "volume"])
+        except InvalidApiKeyError as e:
+            raise e
+        except Exception as e:
+            logger.error(f"Error reading prices from {type(self).__name__}: {e}")
+            if raise_errors:
+                raise
+
+        return pd.DataFrame()
+
+    def _read_series_frame(
+        self, tickers: List[str], type: SeriesLength
+    ) -> pd.DataFrame:
+        prices_ = self._read_series(tickers, type)
+        return pd.DataFrame([p.model_dump() for p in prices_ if p.valid()])
+
     @abc.abstractmethod
     def _read_financials(self, tickers: List[str]) -> List[Financials]: ...
 
@@ -151,7 +278,19 @@ class AbstractSource(SourceBase, abc.ABC):
     def set_api_key(self, api_key: str) -> None: ...
 
     def set_pause(self, value: int) -> None:
+        """Deprecated: allow at most one request every ``value`` seconds.
+
+        Set ``rate`` and ``burst`` instead.
+        """
+        warnings.warn(
+            "pause is deprecated, set rate and burst instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         self.pause = value
+        self.rate = 1 / value if value else None
+        self.burst = 1
+        self.__dict__.pop("rate_limiter", None)
 
     def __hash__(self) -> int:
         return hash(self.__source__)
@@ -195,7 +334,7 @@ class DatabaseCsvSource(AbstractSource):
                 url_source = getattr(sources, field)
                 if url_source is None:
                     continue
-                response = requests.get(url_source.url, timeout=10)
+                response = http_client().get(url_source.url)
                 if not response.ok:
                     raise Exception(f"Failed to download data from {url_source.url}")
                 data = pd.read_csv(StringIO(response.text))
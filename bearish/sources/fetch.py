@@ -0,0 +1,185 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+
+from bearish.exceptions import InvalidApiKeyError, LimitApiKeyReachedError
+from bearish.sources.base import AbstractSource
+from bearish.utils.utils import batch
+
+logger = logging.getLogger(__name__)
+
+Result = TypeVar("Result")
+Item = TypeVar("Item")
+Planned = Tuple[List[Item], FrozenSet[int]]
+Running = Dict[Future[Result], Tuple[int, List[Item], FrozenSet[int]]]
+
+
+def plan_chunks(
+    items: Iterable[Item],
+    sources: Sequence[AbstractSource],
+    size: int,
+    covers: Optional[Callable[[AbstractSource, Item], bool]] = None,
+) -> List[Planned[Item]]:
+    """Partition items by the sources able to serve them and batch each partition.
+
+    Each chunk comes with the indices of the sources that must not get it.
+    Without ``covers`` every source can serve every item.
+    """
+    partitions: Dict[FrozenSet[int], List[Item]] = {}
+    for item in items:
+        excluded = frozenset(
+            index
+            for index, source in enumerate(sources)
+            if covers is not None and not covers(source, item)
+        )
+        partitions.setdefault(excluded, []).append(item)
+    for excluded, partition in partitions.items():
+        names = [s.__source__ for i, s in enumerate(sources) if i not in excluded]
+        logger.debug(f"{len(partition)} items can be served by {names}")
+    return [
+        (chunk, excluded)
+        for excluded, partition in partitions.items()
+        for chunk in batch(partition, size)
+    ]
+
+
+def _candidates(
+    tried: FrozenSet[int], sources: Sequence[AbstractSource], disabled: Set[int]
+) -> List[int]:
+    return [
+        index
+        for index in range(len(sources))
+        if index not in tried and index not in disabled
+    ]
+
+
+def _drop_unservable(
+    pending: List[Planned[Item]],
+    sources: Sequence[AbstractSource],
+    disabled: Set[int],
+) -> List[Item]:
+    """Remove the chunks no usable source has left to try and return their items."""
+    servable, unservable = [], []
+    for chunk, tried in pending:
+        if _candidates(tried, sources, disabled):
+            servable.append((chunk, tried))
+        else:
+            unservable.extend(chunk)
+    pending[:] = servable
+    return unservable
+
+
+def _schedule(
+    pending: List[Planned[Item]],
+    sources: Sequence[AbstractSource],
+    running: Running[Result, Item],
+    disabled: Set[int],
+    submit: Callable[[int, List[Item], FrozenSet[int]], None],
+) -> None:
+    """Give every free slot of each source, in order, its most constrained chunk."""
+    for index, source in enumerate(sources):
+        busy = sum(1 for index_, _, _ in running.values() if index_ == index)
+        for _ in range(source.concurrency - busy):
+            choices = [
+                (len(candidates), position)
+                for position, (_, tried) in enumerate(pending)
+                if index in (candidates := _candidates(tried, sources, disabled))
+            ]
+            if not choices:
+                break
+            chunk, tried = pending.pop(min(choices)[1])
+            submit(index, chunk, tried)
+
+
+def _complete(
+    future: Future[Result],
+    source: AbstractSource,
+    chunk: List[Item],
+    write: Callable[[AbstractSource, List[Item], Result], List[Item]],
+) -> Tuple[List[Item], bool]:
+    """Write a fetched chunk, returning its missing items and if the source failed."""
+    try:
+        result = future.result()
+    except (InvalidApiKeyError, LimitApiKeyReachedError) as e:
+        logger.error(f"Not using {source.__source__} anymore: {e}")
+        return chunk, True
+    except Exception as e:
+        logger.error(f"Error fetching chunk from {source.__source__}: {e}")
+        return chunk, False
+    return write(source, chunk, result), False
+
+
+def _requeue(
+    pending: List[Planned[Item]],
+    missing: List[Item],
+    tried: FrozenSet[int],
+    source: AbstractSource,
+) -> None:
+    if missing:
+        logger.debug(f"{len(missing)} items missing from {source.__source__}")
+        pending.append((missing, tried))
+
+
+def route_chunks(
+    plan: Iterable[Planned[Item]],
+    sources: Sequence[AbstractSource],
+    fetch: Callable[[AbstractSource, List[Item]], Result],
+    write: Callable[[AbstractSource, List[Item], Result], List[Item]],
+) -> List[Item]:
+    """Spread planned chunks over ``sources`` and fail missing items over.
+
+    Whenever a source, in configured order, has fewer than ``concurrency``
+    chunks in flight it takes the pending chunk with the fewest other sources
+    left to serve it, so idle sources pull disjoint chunks while busy ones
+    work and partitions only one provider can serve are not starved.
+    ``write`` runs on the calling thread and returns the items it did not
+    get, which are queued for the sources that have not tried them yet.
+    Sources raising an API key error are not used again. Items that no
+    source could serve are returned.
+    """
+    pending: List[Planned[Item]] = list(plan)
+    running: Running[Result, Item] = {}
+    disabled: Set[int] = set()
+    unserved: List[Item] = []
+    executors = [
+        ThreadPoolExecutor(
+            max_workers=source.concurrency,
+            thread_name_prefix=f"bearish-{source.__source__}",
+        )
+        for source in sources
+    ]
+
+    def _submit(index: int, chunk: List[Item], tried: FrozenSet[int]) -> None:
+        future = executors[index].submit(fetch, sources[index], chunk)
+        running[future] = (index, chunk, tried)
+
+    try:
+        while True:
+            unserved.extend(_drop_unservable(pending, sources, disabled))
+            _schedule(pending, sources, running, disabled, _submit)
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, chunk, tried = running.pop(future)
+                missing, disable = _complete(future, sources[index], chunk, write)
+                if disable:
+                    disabled.add(index)
+                _requeue(pending, missing, tried | {index}, sources[index])
+    finally:
+        for executor in executors:
+            executor.shutdown()
+    if unserved:
+        logger.warning(f"No source could serve {len(unserved)} items")
+    return unserved
@@ -1,7 +1,7 @@
+import asyncio
 import logging
-from typing import Optional, List, Any, ClassVar, Dict
+from typing import TYPE_CHECKING, Optional, List, Any, ClassVar, Dict
 
-import requests  # type: ignore
 from pydantic import Field
 
 from bearish.exceptions import InvalidApiKeyError
@@ -17,15 +17,27 @@ from bearish.models.financials.metrics import FinancialMetrics
 from bearish.models.price.price import Price
 from bearish.models.query.query import AssetQuery
 from bearish.sources.base import AbstractSource, ApiUsage
+from bearish.sources.rate_limit import get_rate_limiter
 from bearish.types import Sources, SeriesLength
+from bearish.utils.http import (
+    async_http_session,
+    collect_results,
+    get_json_async,
+    http_client,
+    raise_for_rate_limit,
+    run_async,
+)
 from bearish.utils.utils import get_start_date
 
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = logging.getLogger(__name__)
 
 API_URL = "https://financialmodelingprep.com/api/v3/"
 
 
-def compose_url(  # noqa: PLR0913
+def compose_url(  # noqa: PLR0913, PLR0917
     api_url: str,
     endpoint: str,
     api_key: str,
@@ -41,7 +53,7 @@ def compose_url(  # noqa: PLR0913
     return f"{api_url}{endpoint}/{ticker}{period_}{from__}{separator}apikey={api_key}"
 
 
-def read_api(  # noqa: PLR0913
+def read_api(  # noqa: PLR0913, PLR0917
     api_url: str,
     endpoint: str,
     api_key: str,
@@ -49,11 +61,15 @@ def read_api(  # noqa: PLR0913
     period: Optional[str] = None,
     from_: Optional[str] = None,
 ) -> Any:
-    request_response = requests.get(
-        compose_url(api_url, endpoint, api_key, ticker, period=period, from_=from_),
-        timeout=10,
-    )
-    response_json = request_response.json()
+    with get_rate_limiter(FmpSourceBase.__source__).limit():
+        request_response = http_client().get(
+            compose_url(api_url, endpoint, api_key, ticker, period=period, from_=from_)
+        )
+        raise_for_rate_limit(request_response)
+    return parse_response(ticker, request_response.json())
+
+
+def parse_response(ticker: str, response_json: Any) -> Any:
     if isinstance(response_json, dict) and response_json.get("Error Message"):
         logger.error(f"Error reading {ticker}: {response_json['Error Message']}")
         raise InvalidApiKeyError(response_json["Error Message"])
@@ -141,7 +157,7 @@ class FmpEquity(FmpSourceBase, Equity):
                 datas = [*profile, *quote, *ratio_ttm, *key_metrics]
                 data = {k: v for data in datas for k, v in data.items()}
                 tickers_.append(cls.model_validate(data))
-            except InvalidApiKeyError as e:  # noqa: PERF203
+            except InvalidApiKeyError as e:
                 logger.warning(f"Error reading {ticker}: {e}")
                 break
             except Exception as e:
@@ -221,6 +237,37 @@ class FmpPrice(FmpSourceBase, Price):
     }
 
 
+def to_financials(
+    ticker: str,
+    balance_sheet_statement: List[Dict[str, Any]],
+    cash_flow_statement: List[Dict[str, Any]],
+    ratio_ttm: List[Dict[str, Any]],
+    key_metrics: List[Dict[str, Any]],
+) -> Financials:
+    datas = [*ratio_ttm, *key_metrics]
+    financial_metrics = {k: v for data in datas for k, v in data.items()}
+    financial_metrics.update({"symbol": ticker})
+    return Financials(
+        financial_metrics=[FmpFinancialMetrics.model_validate(financial_metrics)],
+        balance_sheets=[
+            FmpBalanceSheet.model_validate(balance_sheet_statement_)
+            for balance_sheet_statement_ in balance_sheet_statement
+        ],
+        cash_flows=[
+            FmpCashFlow.model_validate(cash_flow_statement_)
+            for cash_flow_statement_ in cash_flow_statement
+        ],
+    )
+
+
+def to_prices(historical_price: Dict[str, Any]) -> List[FmpPrice]:
+    symbol = historical_price["symbol"]
+    return [
+        FmpPrice.model_validate({**data, "symbol": symbol})
+        for data in historical_price["historical"]
+    ]
+
+
 class FmpSource(FmpSourceBase, AbstractSource):
     countries: List[Countries] = ["US"]  # noqa: RUF012
     api_usage: ApiUsage = ApiUsage(calls_limit=220)
@@ -240,6 +287,9 @@ class FmpSource(FmpSourceBase, AbstractSource):
     def _read_financials(self, tickers: List[str]) -> List[Financials]:
         financials = []
         for ticker in tickers:
+            if not self.api_usage.reserve_api_calls(4):
+                logger.warning(f"API '{self.__source__}' limit reached")
+                break
             balance_sheet_statement = read_api(
                 API_URL,
                 "balance-sheet-statement",
@@ -256,23 +306,13 @@ class FmpSource(FmpSourceBase, AbstractSource):
             )
             ratio_ttm = read_api(API_URL, "ratios-ttm", self.__api_key__, ticker)
             key_metrics = read_api(API_URL, "key-metrics-ttm", self.__api_key__, ticker)
-            self.api_usage.add_api_calls(4)
-            datas = [*ratio_ttm, *key_metrics]
-            financial_metrics = {k: v for data in datas for k, v in data.items()}
-            financial_metrics.update({"symbol": ticker})
             financials.append(
-                Financials(
-                    financial_metrics=[
-                        FmpFinancialMetrics.model_validate(financial_metrics)
-                    ],
-                    balance_sheets=[
-                        FmpBalanceSheet.model_validate(balance_sheet_statement_)
-                        for balance_sheet_statement_ in balance_sheet_statement
-                    ],
-                    cash_flows=[
-                        FmpCashFlow.model_validate(cash_flow_statement_)
-                        for cash_flow_statement_ in cash_flow_statement
-                    ],
+                to_financials(
+                    ticker,
+                    balance_sheet_statement,
+                    cash_flow_statement,
+                    ratio_ttm,
+                    key_metrics,
                 )
             )
         return financials
@@ -281,6 +321,9 @@ class FmpSource(FmpSourceBase, AbstractSource):
         from_ = get_start_date(type)
         prices = []
         for ticker in tickers:
+            if not self.api_usage.reserve_api_calls(1):
+                logger.warning(f"API '{self.__source__}' limit reached")
+                break
             historical_price = read_api(
                 API_URL,
                 "historical-price-full",
@@ -289,15 +332,84 @@ class FmpSource(FmpSourceBase, AbstractSource):
                 period=None,
                 from_=from_,
             )
-            self.api_usage.add_api_calls(1)
-            symbol = historical_price["symbol"]
-            datas = historical_price["historical"]
-            prices.extend(
-                [FmpPrice.model_validate({**data, "symbol": symbol}) for data in datas]
-            )
+            prices.extend(to_prices(historical_price))
         return prices
 
 
+class FmpAsyncSource(FmpSource):
+    """FmpSource fanning out its per-ticker requests on an event loop."""
+
+    request_concurrency: int = 16
+
+    def _read_financials(self, tickers: List[str]) -> List[Financials]:
+        return run_async(self._read_financials_async(tickers))
+
+    def _read_series(self, tickers: List[str], type: SeriesLength) -> List[FmpPrice]:  # type: ignore
+        return run_async(self._read_series_async(tickers, get_start_date(type)))
+
+    async def _read_financials_async(self, tickers: List[str]) -> List[Financials]:
+        async with async_http_session(self.request_concurrency) as session:
+            results = await asyncio.gather(
+                *[self._read_ticker_financials(session, ticker) for ticker in tickers],
+                return_exceptions=True,
+            )
+        return collect_results(tickers, results)
+
+    async def _read_series_async(
+        self, tickers: List[str], from_: Optional[str]
+    ) -> List[FmpPrice]:
+        async with async_http_session(self.request_concurrency) as session:
+            results = await asyncio.gather(
+                *[
+                    self._read_ticker_series(session, ticker, from_)
+                    for ticker in tickers
+                ],
+                return_exceptions=True,
+            )
+        return [
+            price for prices in collect_results(tickers, results) for price in prices
+        ]
+
+    async def _read_ticker_financials(
+        self, session: "aiohttp.ClientSession", ticker: str
+    ) -> Optional[Financials]:
+        if not self.api_usage.reserve_api_calls(4):
+            logger.warning(f"API '{self.__source__}' limit reached")
+            return None
+        datas = await asyncio.gather(
+            self._read_api(session, "balance-sheet-statement", ticker, period="annual"),
+            self._read_api(session, "cash-flow-statement", ticker, period="annual"),
+            self._read_api(session, "ratios-ttm", ticker),
+            self._read_api(session, "key-metrics-ttm", ticker),
+        )
+        return to_financials(ticker, *datas)
+
+    async def _read_ticker_series(
+        self, session: "aiohttp.ClientSession", ticker: str, from_: Optional[str]
+    ) -> Optional[List[FmpPrice]]:
+        if not self.api_usage.reserve_api_calls(1):
+            logger.warning(f"API '{self.__source__}' limit reached")
+            return None
+        historical_price = await self._read_api(
+            session, "historical-price-full", ticker, from_=from_
+        )
+        return to_prices(historical_price)
+
+    async def _read_api(
+        self,
+        session: "aiohttp.ClientSession",
+        endpoint: str,
+        ticker: str,
+        period: Optional[str] = None,
+        from_: Optional[str] = None,
+    ) -> Any:
+        await self.rate_limiter.acquire_async()
+        url = compose_url(
+            API_URL, endpoint, self.__api_key__, ticker, period=period, from_=from_
+        )
+        return parse_response(ticker, await get_json_async(session, url))
+
+
 class FmpAssetsSource(FmpAssetsSourceBase, AbstractSource):
     countries: List[Countries] = Field(default_factory=list)
 
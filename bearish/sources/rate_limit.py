@@ -0,0 +1,302 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, PrivateAttr
+
+from bearish.types import Backends
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_MESSAGES = ["too many requests", "rate limit"]
+RATE_LIMIT_STATE = "BEARISH_RATE_LIMIT_STATE"
+
+
+def is_rate_limit_message(message: str) -> bool:
+    return any(text in message.lower() for text in RATE_LIMIT_MESSAGES)
+
+
+def is_rate_limited(exception: BaseException) -> bool:
+    response = getattr(exception, "response", None)
+    if getattr(response, "status_code", None) == HTTPStatus.TOO_MANY_REQUESTS:
+        return True
+    if type(exception).__name__ == "YFRateLimitError":
+        return True
+    return is_rate_limit_message(str(exception))
+
+
+class RateLimitState(BaseModel):
+    """Token buckets and API call counts shared by processes through a SQLite file.
+
+    Every operation runs in its own ``BEGIN IMMEDIATE`` transaction, so reading
+    and updating a bucket or a counter is atomic across processes.
+    """
+
+    path: Path
+
+    def model_post_init(self, __context: Any) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS bucket "
+                "(name TEXT PRIMARY KEY, rate REAL, tokens REAL, updated REAL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS api_calls "
+                "(source TEXT, period TEXT, calls INTEGER, PRIMARY KEY (source, period))"
+            )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _bucket(
+        connection: sqlite3.Connection, name: str, rate: float, tokens: float
+    ) -> Tuple[float, float, float]:
+        row = connection.execute(
+            "SELECT rate, tokens, updated FROM bucket WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return rate, tokens, time.time()
+        return row[0], row[1], row[2]
+
+    def reserve(self, name: str, rate: float, burst: int) -> Tuple[float, float]:
+        """Take a token from the bucket, returning its shared rate and the wait."""
+        with self._transaction() as connection:
+            rate, tokens, updated = self._bucket(connection, name, rate, burst)
+            now = time.time()
+            tokens = min(float(burst), tokens + max(0.0, now - updated) * rate) - 1
+            connection.execute(
+                "INSERT OR REPLACE INTO bucket VALUES (?, ?, ?, ?)",
+                (name, rate, tokens, now),
+            )
+        return rate, max(0.0, -tokens / rate)
+
+    def update_rate(
+        self,
+        name: str,
+        rate: float,
+        function: Callable[[float], float],
+        drain: bool = False,
+    ) -> float:
+        with self._transaction() as connection:
+            rate, tokens, updated = self._bucket(connection, name, rate, 0.0)
+            rate = function(rate)
+            tokens = min(tokens, 0.0) if drain else tokens
+            connection.execute(
+                "INSERT OR REPLACE INTO bucket VALUES (?, ?, ?, ?)",
+                (name, rate, tokens, updated),
+            )
+        return rate
+
+    def read_api_calls(self, source: str, period: str) -> int:
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT calls FROM api_calls WHERE source = ? AND period = ?",
+                (source, period),
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def reserve_api_calls(
+        self, source: str, period: str, calls: int, limit: Optional[int] = None
+    ) -> bool:
+        """Count ``calls`` unless they would take the total over ``limit``."""
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT calls FROM api_calls WHERE source = ? AND period = ?",
+                (source, period),
+            ).fetchone()
+            total = (row[0] if row else 0) + calls
+            if limit is not None and total > limit:
+                return False
+            connection.execute(
+                "INSERT OR REPLACE INTO api_calls VALUES (?, ?, ?)",
+                (source, period, total),
+            )
+        return True
+
+
+@lru_cache
+def _rate_limit_state(path: str) -> RateLimitState:
+    return RateLimitState(path=Path(path))
+
+
+def rate_limit_state() -> Optional[RateLimitState]:
+    path = os.getenv(RATE_LIMIT_STATE)
+    return _rate_limit_state(path) if path else None
+
+
+class RateLimiterMetrics(BaseModel):
+    name: str
+    rate: Optional[float] = None
+    acquired: int = 0
+    waited: float = 0.0
+    throttle_events: int = 0
+
+
+class RateLimiter(BaseModel):
+    """Token bucket refilled at ``rate`` tokens per second, holding at most ``burst``.
+
+    The rate follows AIMD: it grows by ``increase`` after every successful call
+    up to ``max_rate`` and is multiplied by ``decrease`` whenever the provider
+    throttles, never going below ``min_rate``. With a ``state`` the bucket and
+    its rate are shared with every process using the same state file.
+    """
+
+    name: str = "default"
+    rate: Optional[float] = None
+    burst: int = 1
+    min_rate: float = 0.01
+    max_rate: Optional[float] = None
+    increase: float = 0.05
+    decrease: float = 0.5
+    state: Optional[RateLimitState] = None
+    _tokens: float = PrivateAttr(default=0.0)
+    _updated: float = PrivateAttr(default_factory=time.monotonic)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _metrics: RateLimiterMetrics = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._tokens = float(self.burst)
+        if self.max_rate is None:
+            self.max_rate = self.rate
+        self._metrics = RateLimiterMetrics(name=self.name, rate=self.rate)
+
+    def configure(self, rate: Optional[float], burst: int) -> None:
+        with self._lock:
+            self.rate = rate
+            self.max_rate = rate
+            self.burst = burst
+            self._tokens = min(self._tokens, float(burst))
+            if self.state is not None and rate:
+                self.state.update_rate(self.name, rate, lambda _: rate)
+        logger.debug(f"Rate limiter '{self.name}' set to {rate}/s, burst {burst}")
+
+    def _reserve(self) -> float:
+        with self._lock:
+            self._metrics.acquired += 1
+            if not self.rate:
+                return 0.0
+            if self.state is not None:
+                self.rate, wait = self.state.reserve(self.name, self.rate, self.burst)
+            else:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.burst), self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                self._tokens -= 1
+                wait = max(0.0, -self._tokens / self.rate)
+            self._metrics.waited += wait
+        return wait
+
+    def acquire(self) -> float:
+        wait = self._reserve()
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        if self.state is not None:
+            wait = await asyncio.to_thread(self._reserve)
+        else:
+            wait = self._reserve()
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def _increased(self, rate: float) -> float:
+        rate = rate + self.increase
+        return min(self.max_rate, rate) if self.max_rate else rate
+
+    def _decreased(self, rate: float) -> float:
+        return max(self.min_rate, rate * self.decrease)
+
+    def success(self) -> None:
+        with self._lock:
+            if self.rate is None:
+                return
+            if self.state is not None:
+                self.rate = self.state.update_rate(
+                    self.name, self.rate, self._increased
+                )
+            else:
+                self.rate = self._increased(self.rate)
+
+    def throttle(self) -> None:
+        with self._lock:
+            if self.state is not None:
+                self.rate = self.state.update_rate(
+                    self.name, self.rate or 1.0, self._decreased, drain=True
+                )
+            else:
+                self.rate = self._decreased(self.rate or 1.0)
+                self._tokens = min(self._tokens, 0.0)
+            self._metrics.throttle_events += 1
+        logger.warning(f"Rate limited by '{self.name}', slowing down to {self.rate}/s")
+
+    @contextmanager
+    def limit(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        except Exception as e:
+            if is_rate_limited(e):
+                self.throttle()
+            raise
+        self.success()
+
+    def metrics(self) -> RateLimiterMetrics:
+        with self._lock:
+            return self._metrics.model_copy(update={"rate": self.rate})
+
+
+YAHOO: Backends = "Yahoo"
+YAHOO_RATE = 5.0
+YAHOO_BURST = 2
+RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    name: str, rate: Optional[float] = None, burst: int = 1
+) -> RateLimiter:
+    with _RATE_LIMITERS_LOCK:
+        if name not in RATE_LIMITERS:
+            RATE_LIMITERS[name] = RateLimiter(
+                name=name, rate=rate, burst=burst, state=rate_limit_state()
+            )
+        return RATE_LIMITERS[name]
+
+
+def configure_rate_limiter(
+    name: str, rate: Optional[float] = None, burst: int = 1
+) -> RateLimiter:
+    """Shared rate limiter of ``name``, reconfigured if it runs with other settings."""
+    rate_limiter = get_rate_limiter(name, rate=rate, burst=burst)
+    if (rate_limiter.max_rate, rate_limiter.burst) != (rate, burst):
+        rate_limiter.configure(rate, burst)
+    return rate_limiter
+
+
+def rate_limiter_metrics() -> List[RateLimiterMetrics]:
+    return [rate_limiter.metrics() for rate_limiter in RATE_LIMITERS.values()]
@@ -0,0 +1,49 @@
+import importlib
+import logging
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Dict, Type, cast
+
+from bearish.exceptions import SourceNotFoundError
+
+if TYPE_CHECKING:
+    from bearish.sources.base import AbstractSource
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "bearish.sources"
+SOURCES: Dict[str, str] = {
+    "Yfinance": "bearish.sources.yfinance:yFinanceSource",
+    "YahooQuery": "bearish.sources.yahooquery:YahooQuerySource",
+    "Tiingo": "bearish.sources.tiingo:TiingoSource",
+    "TiingoAsync": "bearish.sources.tiingo:TiingoAsyncSource",
+    "FMP": "bearish.sources.financial_modelling_prep:FmpSource",
+    "FMPAsync": "bearish.sources.financial_modelling_prep:FmpAsyncSource",
+    "FMPAssets": "bearish.sources.financial_modelling_prep:FmpAssetsSource",
+    "FinanceDatabase": "bearish.sources.financedatabase:FinanceDatabaseSource",
+    "investpy": "bearish.sources.investpy:InvestPySource",
+}
+
+
+def register_source(name: str, target: str) -> None:
+    SOURCES[name] = target
+
+
+@lru_cache(maxsize=1)
+def _register_entry_points() -> None:
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name in SOURCES:
+            logger.warning(f"Ignoring source plugin '{entry_point.name}' override")
+            continue
+        register_source(entry_point.name, entry_point.value)
+
+
+def load_source(name: str) -> Type["AbstractSource"]:
+    if name not in SOURCES:
+        _register_entry_points()
+    if name not in SOURCES:
+        raise SourceNotFoundError(f"Unknown source '{name}'")
+    module, _, attribute = SOURCES[name].partition(":")
+    return cast(
+        Type["AbstractSource"], getattr(importlib.import_module(module), attribute)
+    )
@@ -1,7 +1,8 @@
+import asyncio
+import logging
 from datetime import datetime
-from typing import Optional, List, Dict, Any, cast, ClassVar
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, cast, ClassVar
 
-import requests  # type: ignore
 
 from bearish.exchanges.exchanges import Countries
 from bearish.models.assets.assets import Assets
@@ -10,22 +11,41 @@ from bearish.models.financials.base import Financials
 from bearish.models.price.price import Price
 from bearish.models.query.query import AssetQuery
 from bearish.sources.base import AbstractSource
+from bearish.sources.rate_limit import get_rate_limiter
 from bearish.types import Sources, SeriesLength
+from bearish.utils.http import (
+    async_http_session,
+    collect_results,
+    get_json_async,
+    http_client,
+    raise_for_rate_limit,
+    run_async,
+)
 from bearish.utils.utils import get_start_date
 
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+API_URL = "https://api.tiingo.com/tiingo/daily/"
+HEADERS = {"Content-Type": "application/json"}
+
 
 def compute_url(ticker: str, api_key: str, from_: Optional[str] = None) -> str:
     from_ = from_ if from_ else "2019-01-02"
-    return f"https://api.tiingo.com/tiingo/daily/{ticker.lower()}/prices?startDate={from_}&token={api_key}"
+    return f"{API_URL}{ticker.lower()}/prices?startDate={from_}&token={api_key}"
 
 
 def read_api(
     api_key: str, ticker: str, from_: Optional[str] = None
 ) -> List[Dict[str, Any]]:
-    headers = {"Content-Type": "application/json"}
-    request_response = requests.get(
-        compute_url(ticker, api_key, from_), headers=headers, timeout=10
-    )
+    with get_rate_limiter(TiingoSourceBase.__source__).limit():
+        request_response = http_client().get(
+            compute_url(ticker, api_key, from_), headers=HEADERS
+        )
+        raise_for_rate_limit(request_response)
     return cast(List[Dict[str, Any]], request_response.json())
 
 
@@ -46,6 +66,19 @@ class TiingoPrice(TiingoSourceBase, Price):
     }
 
 
+def to_prices(ticker: str, datas: List[Dict[str, Any]]) -> List[TiingoPrice]:
+    return [
+        TiingoPrice.model_validate(
+            {
+                **data,
+                "symbol": ticker,
+                "date": datetime.strptime(data["date"], "%Y-%m-%dT%H:%M:%S.%fZ").date(),
+            }
+        )
+        for data in datas
+    ]
+
+
 class TiingoSource(TiingoSourceBase, AbstractSource):
     countries: List[Countries] = ["US"]  # noqa: RUF012
 
@@ -63,18 +96,41 @@ class TiingoSource(TiingoSourceBase, AbstractSource):
         prices = []
         for ticker in tickers:
             datas = read_api(self.__api_key__, ticker, from_)
-            prices.extend(
-                [
-                    TiingoPrice.model_validate(
-                        {
-                            **data,
-                            "symbol": ticker,
-                            "date": datetime.strptime(
-                                data["date"], "%Y-%m-%dT%H:%M:%S.%fZ"
-                            ).date(),
-                        }
-                    )
-                    for data in datas
-                ]
-            )
+            prices.extend(to_prices(ticker, datas))
         return prices
+
+
+class TiingoAsyncSource(TiingoSource):
+    """TiingoSource fanning out its per-ticker requests on an event loop."""
+
+    request_concurrency: int = 16
+
+    def _read_series(self, tickers: List[str], type: SeriesLength) -> List[TiingoPrice]:  # type: ignore
+        return run_async(self._read_series_async(tickers, get_start_date(type)))
+
+    async def _read_series_async(
+        self, tickers: List[str], from_: Optional[str]
+    ) -> List[TiingoPrice]:
+        async with async_http_session(self.request_concurrency) as session:
+            results = await asyncio.gather(
+                *[
+                    self._read_ticker_series(session, ticker, from_)
+                    for ticker in tickers
+                ],
+                return_exceptions=True,
+            )
+        return [
+            price for prices in collect_results(tickers, results) for price in prices
+        ]
+
+    async def _read_ticker_series(
+        self, session: "aiohttp.ClientSession", ticker: str, from_: Optional[str]
+    ) -> Optional[List[TiingoPrice]]:
+        if not self.api_usage.reserve_api_calls(1):
+            logger.warning(f"API '{self.__source__}' limit reached")
+            return None
+        await self.rate_limiter.acquire_async()
+        datas = await get_json_async(
+            session, compute_url(ticker, self.__api_key__, from_), headers=HEADERS
+        )
+        return to_prices(ticker, datas)
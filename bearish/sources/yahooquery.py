@@ -1,10 +1,8 @@
 import logging
-import time
 
-from typing import List, Optional, Dict, Any, Callable
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Callable
 
 import pandas as pd
-import yfinance as yf  # type: ignore
 from pydantic import BaseModel, Field
 
 from bearish.exchanges.exchanges import Countries
@@ -23,16 +21,25 @@ from bearish.sources.base import (
 )
 from bearish.models.financials.base import Financials
 from bearish.models.assets.assets import Assets, FailedQueryAssets
-from bearish.types import Sources, SeriesLength, DELAY
-from yahooquery import Ticker as YahooQueryTicker  # type: ignore
+from bearish.sources.rate_limit import (
+    YAHOO,
+    YAHOO_BURST,
+    YAHOO_RATE,
+    get_rate_limiter,
+)
+from bearish.types import Backends, Sources, SeriesLength
 
 from bearish.utils.utils import batch, safe_get
 
+if TYPE_CHECKING:
+    import yfinance as yf  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
 class YahooQueryBase(BaseModel):
     __source__: Sources = "YahooQuery"
+    __backend__: Optional[Backends] = YAHOO
 
 
 class YahooQueryFinancialBase(YahooQueryBase):
@@ -56,8 +63,12 @@ class YahooQueryAssetOutput(BaseModel):
 class YahooQueryAssetBase(YahooQueryBase):
     @classmethod
     def _from_tickers(
-        cls, tickers: List[Ticker], function: Callable[[str, yf.Ticker], Dict[str, Any]]
+        cls,
+        tickers: List[Ticker],
+        function: Callable[[str, "yf.Ticker"], Dict[str, Any]],
     ) -> YahooQueryAssetOutput:
+        from yahooquery import Ticker as YahooQueryTicker  # type: ignore
+
         equities = []
         failed_query: List[Ticker] = []
         chunks = batch(tickers, size=100)
@@ -66,12 +77,13 @@ class YahooQueryAssetBase(YahooQueryBase):
             yahoo_tickers = YahooQueryTicker(
                 " ".join([ticker.symbol for ticker in chunk])
             )
-            asset_profile = yahoo_tickers.asset_profile
-            summary_detail = yahoo_tickers.summary_detail
-            summary_profile = yahoo_tickers.summary_profile
-            key_stats = yahoo_tickers.key_stats
-            financial_data = yahoo_tickers.financial_data
-            quotes = yahoo_tickers.quotes
+            with get_rate_limiter(YAHOO, rate=YAHOO_RATE, burst=YAHOO_BURST).limit():
+                asset_profile = yahoo_tickers.asset_profile
+                summary_detail = yahoo_tickers.summary_detail
+                summary_profile = yahoo_tickers.summary_profile
+                key_stats = yahoo_tickers.key_stats
+                financial_data = yahoo_tickers.financial_data
+                quotes = yahoo_tickers.quotes
             for ticker in chunk:
                 data = (
                     safe_get(asset_profile, ticker.symbol)
@@ -83,7 +95,6 @@ class YahooQueryAssetBase(YahooQueryBase):
                     | {"symbol": ticker.symbol}
                 )
                 equities.append(cls.model_validate(data))
-            time.sleep(DELAY)  # Avoid hitting API rate limits
         logger.debug(f"Retrieved {len(equities)} assets.")
         return YahooQueryAssetOutput(equities=equities, failed_query=failed_query)
 
@@ -224,6 +235,8 @@ class YahooQuerySource(YahooQueryBase, AbstractSource):
         "Belgium",
         "US",
     ]
+    rate: Optional[float] = YAHOO_RATE
+    burst: int = YAHOO_BURST
 
     def set_api_key(self, api_key: str) -> None: ...
     def _read_assets(self, query: Optional[AssetQuery] = None) -> Assets:
@@ -239,6 +252,8 @@ class YahooQuerySource(YahooQueryBase, AbstractSource):
         )
 
     def _read_financials(self, tickers: List[str]) -> List[Financials]:
+        from yahooquery import Ticker as YahooQueryTicker
+
         financials = []
         yahoo_tickers = YahooQueryTicker(" ".join(tickers))
         cash_flow = yahoo_tickers.cash_flow()
@@ -266,6 +281,8 @@ class YahooQuerySource(YahooQueryBase, AbstractSource):
         return financials
 
     def _read_series(self, tickers: List[str], type: SeriesLength) -> List[Price]:
+        from yahooquery import Ticker as YahooQueryTicker
+
         yahoo_tickers = YahooQueryTicker(" ".join(tickers))
         data = yahoo_tickers.history(period=type)
         records = data.reset_index().to_dict(orient="records")
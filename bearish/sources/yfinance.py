@@ -1,17 +1,16 @@
 import logging
-import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
+from functools import partial
 
-from typing import List, Optional, Dict, Any, Callable, cast
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Callable, cast
 
 import pandas as pd
-import yfinance as yf  # type: ignore
 from pydantic import BaseModel, Field
 from tenacity import (
     retry,
     stop_after_attempt,
     wait_fixed,
-    wait_exponential,
 )
 
 from bearish.exchanges.exchanges import Countries
@@ -32,28 +31,41 @@ from bearish.sources.base import (
 )
 from bearish.models.financials.base import Financials
 from bearish.models.assets.assets import Assets, FailedQueryAssets
-from bearish.types import Sources, SeriesLength, DELAY
+from bearish.sources.rate_limit import (
+    YAHOO,
+    YAHOO_BURST,
+    YAHOO_RATE,
+    RateLimiter,
+    get_rate_limiter,
+    is_rate_limit_message,
+)
+from bearish.types import Backends, Sources, SeriesLength
+
+if TYPE_CHECKING:
+    import yfinance as yf  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 
 class YfinanceBase(BaseModel):
     __source__: Sources = "Yfinance"
+    __backend__: Optional[Backends] = YAHOO
+
+
+def rate_limiter() -> RateLimiter:
+    return get_rate_limiter(YAHOO, rate=YAHOO_RATE, burst=YAHOO_BURST)
 
 
-@retry(
-    wait=wait_exponential(multiplier=1, min=60, max=1200),
-    stop=stop_after_attempt(5),
-    reraise=True,
-)
 def get_data_frame(
-    ticker_: yf.Ticker,
+    ticker_: "yf.Ticker",
     attribute: str,
     transpose: bool = True,
     prefix: Optional[str] = None,
 ) -> pd.DataFrame:
     attribute_ = attribute if not prefix else f"{prefix}_{attribute}"
-    data = getattr(ticker_, attribute_).T if transpose else getattr(ticker_, attribute_)
+    with rate_limiter().limit():
+        data = getattr(ticker_, attribute_)
+    data = data.T if transpose and data is not None else data
     if data is None:
         return pd.DataFrame()
     data.index = [date(index.year, index.month, index.day) for index in data.index]
@@ -65,16 +77,16 @@ class YfinanceFinancialBase(YfinanceBase):
     @classmethod
     def _from_ticker(
         cls,
-        ticker_: yf.Ticker,
+        ticker_: "yf.Ticker",
         attribute: str,
         transpose: bool = True,
         prefix: Optional[str] = None,
+        raise_errors: bool = False,
     ) -> List["YfinanceFinancialBase"]:
         try:
             data = get_data_frame(
                 ticker_, attribute, transpose=transpose, prefix=prefix
             )
-            time.sleep(DELAY)
             return [
                 cls.model_validate(data_ | {"symbol": ticker_.ticker})
                 for data_ in data.to_dict(orient="records")
@@ -82,15 +94,20 @@ class YfinanceFinancialBase(YfinanceBase):
 
         except Exception as e:
             logger.error(f"Error reading {ticker_.ticker} {attribute}: {e}")
+            if raise_errors:
+                raise
             return []
 
 
 @retry(stop=stop_after_attempt(2), wait=wait_fixed(10))
 def get_info(
-    ticker: Ticker, function: Callable[[str, yf.Ticker], Dict[str, Any]]
+    ticker: Ticker, function: Callable[[str, "yf.Ticker"], Dict[str, Any]]
 ) -> Dict[str, Any]:
+    import yfinance as yf
+
     current_ticker = yf.Ticker(ticker.symbol)
-    info = function(ticker.symbol, current_ticker)
+    with rate_limiter().limit():
+        info = function(ticker.symbol, current_ticker)
     return info
 
 
@@ -102,7 +119,9 @@ class YfinanceAssetOutput(BaseModel):
 class YfinanceAssetBase(YfinanceBase):
     @classmethod
     def _from_tickers(
-        cls, tickers: List[Ticker], function: Callable[[str, yf.Ticker], Dict[str, Any]]
+        cls,
+        tickers: List[Ticker],
+        function: Callable[[str, "yf.Ticker"], Dict[str, Any]],
     ) -> YfinanceAssetOutput:
         equities = []
         failed_query = []
@@ -119,7 +138,6 @@ class YfinanceAssetBase(YfinanceBase):
                 logger.error(f"Error reading ticker: {e}", exc_info=True)
                 failed_query.append(ticker)
                 continue
-            time.sleep(DELAY)  # To avoid hitting API limits
         return YfinanceAssetOutput(equities=equities, failed_query=failed_query)
 
 
@@ -183,7 +201,7 @@ def to_funds_data_dict(data: pd.DataFrame, ticker: str) -> Dict[str, Any]:
     return data_dict
 
 
-def _get_etf(ticker: str, results: yf.Ticker) -> Dict[str, Any]:
+def _get_etf(ticker: str, results: "yf.Ticker") -> Dict[str, Any]:
     etf = {}
     etf.update(to_funds_data_dict(results.funds_data.fund_operations, ticker))
     etf.update(to_funds_data_dict(results.funds_data.equity_holdings, ticker))
@@ -262,9 +280,14 @@ class YfinanceFinancialMetrics(YfinanceFinancialBase, QuarterlyFinancialMetrics)
 
     @classmethod
     def from_ticker(
-        cls, ticker: yf.Ticker, prefix: Optional[str] = None
+        cls,
+        ticker: "yf.Ticker",
+        prefix: Optional[str] = None,
+        raise_errors: bool = False,
     ) -> List["YfinanceFinancialMetrics"]:
-        return cls._from_ticker(ticker, "financials", prefix=prefix)  # type: ignore
+        return cls._from_ticker(  # type: ignore
+            ticker, "financials", prefix=prefix, raise_errors=raise_errors
+        )
 
 
 class yFinanceEarningsDate(YfinanceFinancialBase, EarningsDate):
@@ -276,9 +299,18 @@ class yFinanceEarningsDate(YfinanceFinancialBase, EarningsDate):
 
     @classmethod
     def from_ticker(
-        cls, ticker: yf.Ticker, prefix: Optional[str] = None
+        cls,
+        ticker: "yf.Ticker",
+        prefix: Optional[str] = None,
+        raise_errors: bool = False,
     ) -> List["yFinanceEarningsDate"]:
-        return cls._from_ticker(ticker, "earnings_dates", transpose=False, prefix=prefix)  # type: ignore
+        return cls._from_ticker(  # type: ignore
+            ticker,
+            "earnings_dates",
+            transpose=False,
+            prefix=prefix,
+            raise_errors=raise_errors,
+        )
 
 
 class yFinanceBalanceSheet(YfinanceFinancialBase, QuarterlyBalanceSheet):
@@ -325,9 +357,14 @@ class yFinanceBalanceSheet(YfinanceFinancialBase, QuarterlyBalanceSheet):
 
     @classmethod
     def from_ticker(
-        cls, ticker: yf.Ticker, prefix: Optional[str] = None
+        cls,
+        ticker: "yf.Ticker",
+        prefix: Optional[str] = None,
+        raise_errors: bool = False,
     ) -> List["yFinanceBalanceSheet"]:
-        return cls._from_ticker(ticker, "balance_sheet", prefix=prefix)  # type: ignore
+        return cls._from_ticker(  # type: ignore
+            ticker, "balance_sheet", prefix=prefix, raise_errors=raise_errors
+        )
 
 
 class yFinanceCashFlow(YfinanceFinancialBase, QuarterlyCashFlow):
@@ -353,9 +390,14 @@ class yFinanceCashFlow(YfinanceFinancialBase, QuarterlyCashFlow):
 
     @classmethod
     def from_ticker(
-        cls, ticker: yf.Ticker, prefix: Optional[str] = None
+        cls,
+        ticker: "yf.Ticker",
+        prefix: Optional[str] = None,
+        raise_errors: bool = False,
     ) -> List["yFinanceCashFlow"]:
-        return cls._from_ticker(ticker, "cashflow", prefix=prefix)  # type: ignore
+        return cls._from_ticker(  # type: ignore
+            ticker, "cashflow", prefix=prefix, raise_errors=raise_errors
+        )
 
 
 class yFinancePrice(YfinanceBase, Price):
@@ -370,6 +412,25 @@ class yFinancePrice(YfinanceBase, Price):
     }
 
 
+FINANCIAL_STATEMENTS: Dict[str, Callable[["yf.Ticker"], List[Any]]] = {
+    "financial_metrics": partial(
+        YfinanceFinancialMetrics.from_ticker, raise_errors=True
+    ),
+    "balance_sheets": partial(yFinanceBalanceSheet.from_ticker, raise_errors=True),
+    "cash_flows": partial(yFinanceCashFlow.from_ticker, raise_errors=True),
+    "quarterly_financial_metrics": partial(
+        YfinanceFinancialMetrics.from_ticker, prefix="quarterly", raise_errors=True
+    ),
+    "quarterly_balance_sheets": partial(
+        yFinanceBalanceSheet.from_ticker, prefix="quarterly", raise_errors=True
+    ),
+    "quarterly_cash_flows": partial(
+        yFinanceCashFlow.from_ticker, prefix="quarterly", raise_errors=True
+    ),
+    "earnings_date": partial(yFinanceEarningsDate.from_ticker, raise_errors=True),
+}
+
+
 class yFinanceSource(YfinanceBase, AbstractSource):
     countries: List[Countries] = [
         "United Kingdom",
@@ -379,6 +440,9 @@ class yFinanceSource(YfinanceBase, AbstractSource):
         "Belgium",
         "US",
     ]
+    rate: Optional[float] = YAHOO_RATE
+    burst: int = YAHOO_BURST
+    financials_workers: int = 4
 
     def set_api_key(self, api_key: str) -> None: ...
     def _read_assets(self, query: Optional[AssetQuery] = None) -> Assets:
@@ -398,35 +462,47 @@ class yFinanceSource(YfinanceBase, AbstractSource):
         )
 
     def _read_financials(self, tickers: List[str]) -> List[Financials]:
-        financials = []
-        for ticker in tickers:
-            try:
-                ticker_ = yf.Ticker(ticker)
-            except Exception as e:
-                logger.error(f"Error reading financials for {ticker}: {e}")
-                continue
-            financials.append(
+        import yfinance as yf
+
+        with ThreadPoolExecutor(
+            max_workers=self.financials_workers, thread_name_prefix="bearish-yfinance"
+        ) as executor:
+            statements = []
+            for ticker in tickers:
+                try:
+                    ticker_ = yf.Ticker(ticker)
+                except Exception as e:
+                    logger.error(f"Error reading financials for {ticker}: {e}")
+                    continue
+                statements.append(
+                    (
+                        ticker,
+                        {
+                            field: executor.submit(read_statement, ticker_)
+                            for field, read_statement in FINANCIAL_STATEMENTS.items()
+                        },
+                    )
+                )
+            return [
                 Financials(
-                    financial_metrics=YfinanceFinancialMetrics.from_ticker(ticker_),
-                    balance_sheets=yFinanceBalanceSheet.from_ticker(ticker_),
-                    cash_flows=yFinanceCashFlow.from_ticker(ticker_),
-                    quarterly_financial_metrics=YfinanceFinancialMetrics.from_ticker(
-                        ticker_, prefix="quarterly"
-                    ),
-                    quarterly_balance_sheets=yFinanceBalanceSheet.from_ticker(
-                        ticker_, prefix="quarterly"
-                    ),
-                    quarterly_cash_flows=yFinanceCashFlow.from_ticker(
-                        ticker_, prefix="quarterly"
-                    ),
-                    earnings_date=yFinanceEarningsDate.from_ticker(ticker_),
+                    **{
+                        field: self._statement_result(ticker, future)
+                        for field, future in statement.items()
+                    }
                 )
-            )
-        return financials
+                for ticker, statement in statements
+            ]
+
+    def _statement_result(self, ticker: str, future: "Future[List[Any]]") -> List[Any]:
+        try:
+            return future.result()
+        except Exception as e:
+            self.defer(ticker, str(e))
+            return []
+
+    def _download(self, tickers: List[str], type: SeriesLength) -> pd.DataFrame:
+        import yfinance as yf
 
-    def _read_series(  # type: ignore
-        self, tickers: List[str], type: SeriesLength
-    ) -> List[yFinancePrice]:
         data = yf.download(
             tickers, period=type, group_by="ticker", auto_adjust=True, timeout=60
         )
@@ -434,7 +510,9 @@ class yFinanceSource(YfinanceBase, AbstractSource):
             ticker for ticker in tickers if data[(ticker, "Close")].dropna().empty
         ]
         if missing_tickers:
-            time.sleep(self.pause)
+            if any(is_rate_limit_message(e) for e in yf.shared._ERRORS.values()):
+                self.rate_limiter.throttle()
+            self.rate_limiter.acquire()
             valid_tickers = list(set(tickers).difference(set(missing_tickers)))
             data = data[valid_tickers]
             logger.warning(f"Missing tickers: {missing_tickers}")
@@ -450,12 +528,20 @@ class yFinanceSource(YfinanceBase, AbstractSource):
                 data = pd.concat([data, data_missing], axis=1)
             else:
                 print("None of the missing tickers where found")
+        return cast(pd.DataFrame, data)
 
+    def _read_series(  # type: ignore
+        self, tickers: List[str], type: SeriesLength
+    ) -> List[yFinancePrice]:
+        data = self._download(tickers, type)
         records_final = []
         for ticker in tickers:
             try:
                 if ticker in data.columns:
-                    records = data[ticker].reset_index().to_dict(orient="records")
+                    records = cast(
+                        List[Dict[str, Any]],
+                        data[ticker].reset_index().to_dict(orient="records"),
+                    )
                     if not records:
                         logger.error(f"No data found for ticker: {ticker}")
                     records_final.extend(
@@ -472,7 +558,23 @@ class yFinanceSource(YfinanceBase, AbstractSource):
                             for record in records
                         ]
                     )
-            except Exception as e:  # noqa: PERF203
+            except Exception as e:
                 logger.error(f"Error reading series for {ticker}: {e}")
-        time.sleep(self.pause)
         return records_final
+
+    def _read_series_frame(
+        self, tickers: List[str], type: SeriesLength
+    ) -> pd.DataFrame:
+        data = self._download(tickers, type)
+        if data.empty:
+            return pd.DataFrame()
+        data = cast(
+            pd.DataFrame,
+            pd.concat(
+                {ticker: data[ticker] for ticker in data.columns.unique(level=0)},
+                names=["symbol", "Date"],
+            ),
+        )
+        data = data.reset_index().rename(columns=yFinancePrice.__alias__)
+        data["source"] = self.__source__
+        return data
@@ -13,5 +13,7 @@ Sources = Literal[
     "YahooQuery",
 ]
 
+Backends = Literal["Yahoo"]
+
+DateStorage = Literal["iso", "epoch_day"]
 SeriesLength = Literal["max", "1d", "5d", "1mo", "3mo", "6mo"]
-DELAY = 0.2
@@ -0,0 +1,180 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from http import HTTPStatus
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+from urllib.parse import urlparse
+
+import requests  # type: ignore
+from pydantic import BaseModel, Field, PrivateAttr
+from requests.adapters import HTTPAdapter  # type: ignore
+from urllib3.util.retry import Retry
+
+from bearish.exceptions import InvalidApiKeyError
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class HttpMetrics(BaseModel):
+    requests: int = 0
+    errors: int = 0
+    bytes: int = 0
+    elapsed: float = 0.0
+
+
+class HttpClient(BaseModel):
+    """Keep-alive sessions with pooled connections, retries and per-host metrics.
+
+    Each thread gets its own ``requests.Session`` since sessions are not
+    thread safe. 429 responses are not retried here: callers raise them with
+    ``raise_for_rate_limit`` inside their source rate limiter.
+    """
+
+    timeout: float = 10
+    retries: int = 3
+    backoff_factor: float = 0.5
+    status_forcelist: List[int] = Field(default_factory=lambda: [500, 502, 503, 504])
+    pool_maxsize: int = 10
+    headers: Dict[str, str] = Field(
+        default_factory=lambda: {"Accept-Encoding": "gzip, deflate"}
+    )
+    _local: threading.local = PrivateAttr(default_factory=threading.local)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _metrics: Dict[str, HttpMetrics] = PrivateAttr(default_factory=dict)
+
+    def session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(
+                pool_maxsize=self.pool_maxsize,
+                max_retries=Retry(
+                    total=self.retries,
+                    backoff_factor=self.backoff_factor,
+                    status_forcelist=self.status_forcelist,
+                    allowed_methods=["GET"],
+                    raise_on_status=False,
+                ),
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._local.session = session
+        return session
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlparse(url).netloc
+        start = time.perf_counter()
+        try:
+            response = self.session().get(url, **kwargs)
+            size = len(response.content)
+        except Exception:
+            self.record(host, time.perf_counter() - start, error=True)
+            raise
+        elapsed = time.perf_counter() - start
+        self.record(host, elapsed, size=size, error=not response.ok)
+        logger.debug(
+            f"GET {host} {response.status_code} {size} bytes in {elapsed:.3f} s"
+        )
+        return response
+
+    def record(
+        self, host: str, elapsed: float, size: int = 0, error: bool = False
+    ) -> None:
+        with self._lock:
+            metrics = self._metrics.setdefault(host, HttpMetrics())
+            metrics.requests += 1
+            metrics.errors += int(error)
+            metrics.bytes += size
+            metrics.elapsed += elapsed
+
+    def metrics(self) -> Dict[str, HttpMetrics]:
+        with self._lock:
+            return {host: m.model_copy() for host, m in self._metrics.items()}
+
+
+def raise_for_rate_limit(response: requests.Response) -> None:
+    if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
+        response.raise_for_status()
+
+
+@lru_cache(maxsize=1)
+def http_client() -> HttpClient:
+    return HttpClient()
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run ``coroutine`` to completion from synchronous code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+def async_http_session(
+    max_connections: int, timeout: float = 10
+) -> "aiohttp.ClientSession":
+    import aiohttp
+
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=max_connections),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    )
+
+
+async def get_json_async(
+    session: "aiohttp.ClientSession", url: str, **kwargs: Any
+) -> Any:
+    host = urlparse(url).netloc
+    start = time.perf_counter()
+    try:
+        async with session.get(url, **kwargs) as response:
+            body = await response.read()
+    except Exception:
+        http_client().record(host, time.perf_counter() - start, error=True)
+        raise
+    http_client().record(
+        host,
+        time.perf_counter() - start,
+        size=len(body),
+        error=response.status >= HTTPStatus.BAD_REQUEST,
+    )
+    response.raise_for_status()
+    return json.loads(body)
+
+
+def collect_results(
+    tickers: Sequence[str], results: Sequence[Optional[T] | BaseException]
+) -> List[T]:
+    """Drop failed tickers from gathered results, except for invalid API keys."""
+    collected = []
+    for ticker, result in zip(tickers, results, strict=True):
+        if isinstance(result, InvalidApiKeyError):
+            raise result
+        if isinstance(result, BaseException):
+            logger.error(f"Error reading {ticker}: {result}")
+            continue
+        if result is not None:
+            collected.append(result)
+    return collected
@@ -0,0 +1,31 @@
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, List, Tuple
+
+from bearish.models.price.price import Price
+
+
+def synthetic_prices(symbols: int, days: int, source: str = "Yfinance") -> List[Price]:
+    start = date(2005, 1, 3)
+    created_at = date.today()
+    return [
+        Price(
+            symbol=f"SYM{s:05d}",
+            source=source,  # type: ignore
+            date=start + timedelta(days=d),
+            created_at=created_at,
+            open=100.0 + d,
+            high=101.0 + d,
+            low=99.0 + d,
+            close=100.5 + d,
+            volume=1_000_000.0,
+        )
+        for s in range(symbols)
+        for d in range(days)
+    ]
+
+
+def timed(function: Callable[..., Any], *args: Any, **kwargs: Any) -> Tuple[float, Any]:
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - start, result
@@ -0,0 +1,76 @@
+"""File size and price reads for ISO text dates against epoch-day integer dates.
+
+Ten years of business days are written for 5,000 symbols, one month at a time,
+then read back for a single symbol over the full history and for a slice of
+symbols over the last year.
+
+Run with ``python -m tests.benchmarks.date_storage``.
+"""
+
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+from bearish.database.crud import BearishDb
+from bearish.models.base import Ticker
+from bearish.models.query.query import AssetQuery, Symbols
+from bearish.types import DateStorage
+from tests.benchmarks.common import timed
+
+SYMBOLS = 5000
+YEARS = 10
+READS = [(1, YEARS), (500, 1)]
+DATE_STORAGES: list[DateStorage] = ["iso", "epoch_day"]
+
+
+def monthly_prices(days: pd.DatetimeIndex) -> pd.DataFrame:
+    symbols = [f"SYM{s:05d}" for s in range(SYMBOLS)]
+    data = pd.MultiIndex.from_product([days, symbols], names=["date", "symbol"])
+    data = data.to_frame(index=False)
+    data["source"] = "Yfinance"
+    for column in ["open", "high", "low", "close", "volume"]:
+        data[column] = 100.0
+    return data
+
+
+def benchmark(date_storage: DateStorage) -> None:
+    end = pd.Timestamp(date.today())
+    days = pd.bdate_range(end=end, periods=YEARS * 252)
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bench.db"
+        bearish_db = BearishDb(database_path=database_path, date_storage=date_storage)
+        write_time = 0.0
+        for _, month in days.to_series().groupby(days.to_period("M")):
+            elapsed, _ = timed(
+                bearish_db.write_series_frame, monthly_prices(month.index)
+            )
+            write_time += elapsed
+        bearish_db._engine.dispose()
+        print(
+            f"{date_storage:<10} size {database_path.stat().st_size / 2**20:,.1f} MiB "
+            f"write {write_time:,.1f} s"
+        )
+        bearish_db = BearishDb(database_path=database_path)
+        for symbols, years in READS:
+            query = AssetQuery(
+                symbols=Symbols(
+                    equities=[
+                        Ticker(symbol=f"SYM{s:05d}")
+                        for s in range(0, SYMBOLS, SYMBOLS // symbols)
+                    ]
+                )
+            )
+            start = (end - pd.DateOffset(years=years)).date()
+            frame_time, frame = timed(bearish_db.read_series_frame, query, start=start)
+            print(
+                f"{date_storage:<10} {symbols:>4} symbols {years:>2} years "
+                f"{len(frame):>9,} rows read_series_frame {frame_time * 1000:>9,.1f} ms"
+            )
+        bearish_db._engine.dispose()
+
+
+if __name__ == "__main__":
+    for date_storage in DATE_STORAGES:
+        benchmark(date_storage)
@@ -0,0 +1,99 @@
+"""Single and multi symbol price reads across the price table layouts.
+
+Prices are written one day at a time for every symbol, the way daily updates
+land, so that rowid tables scatter each symbol across pages. Older layouts are
+created by migrating to their revision and filled with plain inserts.
+
+Run with ``python -m tests.benchmarks.price_clustering``.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+from alembic import command
+from alembic.config import Config
+
+from bearish.database.crud import DATETIME_FORMAT, BearishDb
+from bearish.database.scripts.upgrade import ALEMBIC_FOLDER
+from bearish.models.base import Ticker
+from bearish.models.query.query import AssetQuery, Symbols
+from tests.benchmarks.common import timed
+
+SYMBOLS = 500
+DAYS = 750
+DAYS_PER_WRITE = 25
+LAYOUTS = {
+    "rowid": "facbb399b102",
+    "clustered": "3c1f0b9e7a42",
+    "symbol-id": None,
+}
+
+
+def daily_prices(days: pd.DatetimeIndex) -> pd.DataFrame:
+    symbols = [f"SYM{s:05d}" for s in range(SYMBOLS)]
+    data = pd.MultiIndex.from_product([days, symbols], names=["date", "symbol"])
+    data = data.to_frame(index=False)
+    data["source"] = "Yfinance"
+    for column in ["open", "high", "low", "close", "volume"]:
+        data[column] = 100.0
+    return data
+
+
+def create_database(database_path: Path, revision: Optional[str]) -> BearishDb:
+    days = pd.date_range("2020-01-01", periods=DAYS)
+    if revision is None:
+        bearish_db = BearishDb(database_path=database_path)
+        for start in range(0, DAYS, DAYS_PER_WRITE):
+            bearish_db.write_series_frame(
+                daily_prices(days[start : start + DAYS_PER_WRITE])
+            )
+        bearish_db._engine.dispose()
+        return BearishDb(database_path=database_path)
+
+    os.environ.update({"DATABASE_URL": f"sqlite:///{database_path}"})
+    alembic_cfg = Config(ALEMBIC_FOLDER / "alembic.ini")
+    alembic_cfg.set_main_option("script_location", str(ALEMBIC_FOLDER))
+    command.upgrade(alembic_cfg, revision)
+    bearish_db = BearishDb(database_path=database_path, auto_migration=False)
+    with bearish_db._engine.begin() as connection:
+        for start in range(0, DAYS, DAYS_PER_WRITE):
+            data = daily_prices(days[start : start + DAYS_PER_WRITE])
+            data["date"] = data["date"].dt.strftime(DATETIME_FORMAT)
+            data["created_at"] = pd.Timestamp.today().strftime("%Y-%m-%d")
+            data.to_sql("price", connection, if_exists="append", index=False)
+    return bearish_db
+
+
+def benchmark(name: str, revision: Optional[str]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bench.db"
+        bearish_db = create_database(database_path, revision)
+        print(f"{name:<10} size {database_path.stat().st_size / 2**20:,.1f} MiB")
+        warmup = AssetQuery(symbols=Symbols(equities=[Ticker(symbol="WARMUP")]))
+        bearish_db.read_series(warmup)
+        bearish_db.read_series_frame(warmup)
+        for symbols in [1, SYMBOLS]:
+            query = AssetQuery(
+                symbols=Symbols(
+                    equities=[
+                        Ticker(symbol=f"SYM{s:05d}")
+                        for s in range(0, SYMBOLS, SYMBOLS // symbols)
+                    ]
+                )
+            )
+            series_time, series = timed(bearish_db.read_series, query, months=12 * 10)
+            frame_time, _ = timed(bearish_db.read_series_frame, query)
+            print(
+                f"{name:<10} {symbols:>4} symbols {len(series):>8,} rows "
+                f"read_series {series_time * 1000:>9,.1f} ms "
+                f"read_series_frame {frame_time * 1000:>9,.1f} ms"
+            )
+        bearish_db._engine.dispose()
+
+
+if __name__ == "__main__":
+    for name, revision in LAYOUTS.items():
+        benchmark(name, revision)
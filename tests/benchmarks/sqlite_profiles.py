@@ -0,0 +1,45 @@
+"""Write and read throughput of the SQLite connection profiles.
+
+Run with ``python -m tests.benchmarks.sqlite_profiles``.
+"""
+
+import tempfile
+from pathlib import Path
+
+from bearish.database.crud import BearishDb
+from bearish.database.profiles import PROFILES, SqliteProfile
+from bearish.models.base import Ticker
+from bearish.models.query.query import AssetQuery, Symbols
+from bearish.utils.utils import batch
+from tests.benchmarks.common import synthetic_prices, timed
+
+SYMBOLS = 100
+DAYS = 500
+CHUNK_SYMBOLS = 10
+
+
+def benchmark(name: str, profile: SqliteProfile) -> None:
+    prices = synthetic_prices(SYMBOLS, DAYS)
+    chunks = batch(prices, CHUNK_SYMBOLS * DAYS)
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(
+            database_path=Path(directory) / "bench.db", sqlite_profile=profile
+        )
+        write_time = sum(timed(bearish_db.write_series, chunk)[0] for chunk in chunks)
+        query = AssetQuery(
+            symbols=Symbols(
+                equities=[Ticker(symbol=f"SYM{s:05d}") for s in range(SYMBOLS)]
+            )
+        )
+        read_time, series = timed(bearish_db.read_series, query, months=12 * 100)
+        bearish_db._engine.dispose()
+    print(
+        f"{name:<12} write {len(prices) / write_time:>10,.0f} rows/s "
+        f"read {len(series) / read_time:>10,.0f} rows/s"
+    )
+
+
+if __name__ == "__main__":
+    benchmark("sqlite", SqliteProfile())
+    for name, profile in PROFILES.items():
+        benchmark(name, profile)
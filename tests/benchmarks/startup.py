@@ -0,0 +1,104 @@
+"""Startup costs: CLI import time and opening an existing database.
+
+``python -X importtime -m bearish.main --help`` is checked against
+``IMPORT_BUDGET`` and must not pull in any of ``DEFERRED_MODULES``. Opening a
+database is timed with and without the alembic fast path. Each measurement
+runs in a fresh interpreter.
+Run with ``python -m tests.benchmarks.startup``.
+"""
+
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from bearish.database.crud import BearishDb
+
+RUNS = 5
+IMPORT_BUDGET = 2.0
+DEFERRED_MODULES = [
+    "alembic",
+    "bearish.database.crud",
+    "bearish.sources.yahooquery",
+    "bearish.sources.yfinance",
+    "sec_cik_mapper",
+    "sec_edgar_downloader",
+    "yahooquery",
+    "yfinance",
+]
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)$")
+BEFORE = """
+import time
+start = time.perf_counter()
+from sqlalchemy import create_engine
+from bearish.database.crud import BearishDb
+from bearish.database.scripts.upgrade import upgrade
+upgrade("sqlite:///{path}")
+create_engine("sqlite:///{path}").connect().close()
+print(time.perf_counter() - start)
+"""
+AFTER = """
+import time
+start = time.perf_counter()
+from bearish.database.crud import BearishDb
+BearishDb(database_path="{path}")
+print(time.perf_counter() - start)
+"""
+
+
+def import_times(*args: str) -> List[Tuple[str, int, float]]:
+    """Module, nesting level and cumulative seconds from ``-X importtime``."""
+    stderr = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    return [
+        (match.group(3), len(match.group(2)) // 2, int(match.group(1)) / 1e6)
+        for match in map(IMPORT_TIME_PATTERN.match, stderr.splitlines())
+        if match
+    ]
+
+
+def cli_import_times() -> Tuple[float, List[Tuple[str, int, float]]]:
+    """Import time of the CLI on top of interpreter startup."""
+    startup = {module for module, _, _ in import_times("-c", "pass")}
+    times = [
+        time_
+        for time_ in import_times("-c", "import bearish.main")
+        if time_[0] not in startup
+    ]
+    return sum(elapsed for _, level, elapsed in times if not level), times
+
+
+def cold_start(snippet: str, database_path: Path) -> float:
+    timings = [
+        float(
+            subprocess.run(  # noqa: S603
+                [sys.executable, "-c", snippet.format(path=database_path)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+        )
+        for _ in range(RUNS)
+    ]
+    return statistics.median(timings)
+
+
+if __name__ == "__main__":
+    total, times = cli_import_times()
+    print(f"imports {total:>8.3f} s (budget {IMPORT_BUDGET:.1f} s)")
+    top_level = [(module, elapsed) for module, level, elapsed in times if not level]
+    for module, elapsed in sorted(top_level, key=lambda t: -t[1])[:10]:
+        print(f"  {module:<40} {elapsed:>8.3f} s")
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bench.db"
+        BearishDb(database_path=database_path)._engine.dispose()
+        for name, snippet in [("before", BEFORE), ("after", AFTER)]:
+            elapsed = cold_start(snippet, database_path)
+            print(f"{name:<7} {elapsed * 1000:>8.1f} ms to import and open")
@@ -1,10 +1,10 @@
+from datetime import date, timedelta
 from pathlib import Path
 
 import pandas as pd
 
 from bearish.main import Bearish
 from bearish.models.base import Ticker
-from bearish.models.price.prices import Prices
 from bearish.models.query.query import AssetQuery, Symbols
 
 
@@ -13,10 +13,10 @@ def read_prices(symbol: str) -> pd.DataFrame:
         path=Path(__file__).parents[1] / "data" / "bear.db",
     )
 
-    prices = bearish.read_series(
-        AssetQuery(symbols=Symbols(equities=[Ticker(symbol=symbol)])), months=24 * 4
+    return bearish.read_series_frame(
+        AssetQuery(symbols=Symbols(equities=[Ticker(symbol=symbol)])),
+        start=date.today() - timedelta(days=24 * 4 * 31),
     )
-    return Prices(prices=prices).to_dataframe()
 
 
 if __name__ == "__main__":
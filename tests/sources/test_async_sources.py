@@ -0,0 +1,118 @@
+import asyncio
+import json
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+
+from bearish.main import Bearish
+from bearish.models.base import Ticker
+from bearish.models.query.query import AssetQuery, Symbols
+from bearish.sources import financial_modelling_prep, tiingo
+from bearish.sources.base import ApiUsage
+from bearish.sources.financial_modelling_prep import FmpAsyncSource
+from bearish.sources.tiingo import TiingoAsyncSource
+
+pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+DATA = Path(__file__).parents[1] / "data" / "sources"
+TICKERS = ["AAPL", "MSFT", "FAIL", "NVDA", "TSLA"]
+
+
+@pytest.fixture
+def api_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[Dict[str, int]]:
+    state = {"requests": 0, "active": 0, "peak": 0}
+
+    def _respond(path: Path, ticker: str) -> "web.Response":
+        if ticker == "FAIL":
+            return web.Response(status=500)
+        return web.json_response(json.loads(path.read_text()))
+
+    async def _track(request: "web.Request", path: Path) -> "web.Response":
+        state["requests"] += 1
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.02)
+        state["active"] -= 1
+        return _respond(path, request.match_info["ticker"].upper())
+
+    async def fmp(request: "web.Request") -> "web.Response":
+        return await _track(
+            request, DATA / "fmp" / f"{request.match_info['endpoint']}.json"
+        )
+
+    async def tiingo_daily(request: "web.Request") -> "web.Response":
+        return await _track(request, DATA / "tiingo" / "daily.json")
+
+    app = web.Application()
+    app.router.add_get("/api/v3/{endpoint}/{ticker}", fmp)
+    app.router.add_get("/tiingo/daily/{ticker}/prices", tiingo_daily)
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(app)
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    loop.run_until_complete(site.start())
+    port = runner.addresses[0][1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        financial_modelling_prep, "API_URL", f"http://127.0.0.1:{port}/api/v3/"
+    )
+    monkeypatch.setattr(tiingo, "API_URL", f"http://127.0.0.1:{port}/tiingo/daily/")
+    yield state
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.run_until_complete(runner.cleanup())
+    loop.close()
+
+
+def _tickers() -> Tuple[Ticker, ...]:
+    return tuple(Ticker(symbol=symbol, exchange="NASDAQ") for symbol in TICKERS)
+
+
+def test_fmp_async_financials(api_server: Dict[str, int]) -> None:
+    source = FmpAsyncSource(request_concurrency=4)
+    source.set_api_key("test")
+    financials = source.read_financials(list(_tickers()))
+    assert len(financials) == len(TICKERS) - 1
+    assert all(f.balance_sheets and f.cash_flows for f in financials)
+    assert api_server["requests"] == 4 * len(TICKERS)
+    assert 1 < api_server["peak"] <= 4
+    assert source.api_usage.calls == 4 * len(TICKERS)
+
+
+def test_fmp_async_honors_api_usage(api_server: Dict[str, int]) -> None:
+    source = FmpAsyncSource(api_usage=ApiUsage(calls_limit=9))
+    source.set_api_key("test")
+    assert len(source.read_financials(list(_tickers()))) == 2
+    assert api_server["requests"] == 8
+
+
+def test_fmp_async_series(api_server: Dict[str, int]) -> None:
+    source = FmpAsyncSource()
+    source.set_api_key("test")
+    prices = source.read_series(list(_tickers()), "1d", apply_filter=False)
+    assert prices
+    assert api_server["requests"] == len(TICKERS)
+
+
+def test_tiingo_async_series_from_bearish(api_server: Dict[str, int]) -> None:
+    source = TiingoAsyncSource(request_concurrency=2)
+    source.set_api_key("test")
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            price_sources=[source],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish.write_many_series(list(_tickers()), "max", apply_filter=False)
+        prices = bearish.read_series_frame(
+            AssetQuery(symbols=Symbols(equities=list(_tickers())))
+        )
+    assert set(prices.index.get_level_values("symbol")) == set(TICKERS) - {"FAIL"}
+    assert 1 < api_server["peak"] <= 2
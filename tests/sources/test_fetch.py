@@ -0,0 +1,396 @@
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pandas as pd
+from pydantic import PrivateAttr
+
+from bearish.main import Bearish
+from bearish.exceptions import LimitApiKeyReachedError
+from bearish.models.assets.assets import Assets
+from bearish.models.base import (
+    FinancialsTracker,
+    PriceTracker,
+    RetryPolicy,
+    Ticker,
+    TrackerQuery,
+)
+from bearish.models.financials.base import Financials
+from bearish.models.financials.metrics import FinancialMetrics
+from bearish.models.price.price import Price
+from bearish.models.query.query import AssetQuery, Symbols
+from bearish.sources.base import AbstractSource
+from bearish.sources.fetch import plan_chunks, route_chunks
+from bearish.types import SeriesLength
+
+
+class FakePriceSource(AbstractSource):
+    __source__ = "Tiingo"
+    countries: List[str] = ["US"]  # type: ignore
+    concurrency: int = 4
+    missing: List[str] = []
+    _active: int = 0
+    _peak: int = 0
+    _chunks: int = 0
+    _seen: List[str] = PrivateAttr(default_factory=list)
+    _windows: Dict[str, List[str]] = PrivateAttr(default_factory=dict)
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def set_api_key(self, api_key: str) -> None: ...
+
+    def _read_assets(self, query: Optional[AssetQuery] = None) -> Assets:
+        return Assets()
+
+    def _read_financials(self, tickers: List[str]) -> List[Financials]:
+        return []
+
+    def _read_series(self, tickers: List[str], type: SeriesLength) -> List[Price]:
+        return []
+
+    def _read_series_frame(
+        self, tickers: List[str], type: SeriesLength
+    ) -> pd.DataFrame:
+        with self._lock:
+            self._active += 1
+            self._chunks += 1
+            self._seen.extend(tickers)
+            self._windows.setdefault(type, []).extend(tickers)
+            self._peak = max(self._peak, self._active)
+        time.sleep(0.05)
+        with self._lock:
+            self._active -= 1
+        if "FAIL" in tickers:
+            raise ConnectionError("provider down")
+        return pd.DataFrame(
+            {
+                "symbol": [t for t in tickers if t not in self.missing],
+                "source": self.__source__,
+                "date": pd.Timestamp("2024-01-02"),
+                "open": 1.0,
+                "high": 2.0,
+                "low": 0.5,
+                "close": 1.5,
+                "volume": 100.0,
+            }
+        )
+
+
+class FakeBackupPriceSource(FakePriceSource):
+    __source__ = "YahooQuery"
+
+
+class FakeFinancialsSource(AbstractSource):
+    __source__ = "Yfinance"
+    countries: List[str] = ["US"]  # type: ignore
+    failures: Dict[str, int] = {}
+    missing: List[str] = []
+    available_calls: Optional[int] = None
+    _calls: List[List[str]] = PrivateAttr(default_factory=list)
+
+    def set_api_key(self, api_key: str) -> None: ...
+
+    def _read_assets(self, query: Optional[AssetQuery] = None) -> Assets:
+        return Assets()
+
+    def _read_financials(self, tickers: List[str]) -> List[Financials]:
+        self._calls.append(tickers)
+        if self.available_calls is not None and len(self._calls) > self.available_calls:
+            raise ConnectionError("provider down")
+        financials = []
+        for ticker in [t for t in tickers if t not in self.missing]:
+            if self.failures.get(ticker, 0):
+                self.failures[ticker] -= 1
+                self.defer(ticker, "Too Many Requests")
+                continue
+            financials.append(
+                Financials(
+                    financial_metrics=[
+                        FinancialMetrics(
+                            symbol=ticker,
+                            source=self.__source__,
+                            date="2024-12-31",
+                            net_income=1.0,
+                        )
+                    ]
+                )
+            )
+        return financials
+
+    def _read_series(self, tickers: List[str], type: SeriesLength) -> List[Price]:
+        return []
+
+
+def _financials_bearish(path: Path, source: AbstractSource) -> Bearish:
+    return Bearish(
+        path=path,
+        batch_size=2,
+        retry_policy=RetryPolicy(min_wait=0.01, max_wait=0.05, max_attempts=3),
+        financials_sources=[source],
+        price_sources=[],
+        asset_sources=[],
+        detailed_asset_sources=[],
+    )
+
+
+def _tracked_financials(bearish: Bearish) -> List[str]:
+    return sorted(
+        t.symbol
+        for t in bearish._bearish_db.read_tracker(TrackerQuery(), FinancialsTracker)
+    )
+
+
+def test_write_many_series_concurrently() -> None:
+    source = FakePriceSource()
+    symbols = [f"SYM{i}" for i in range(10)] + ["FAIL"]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            batch_size=1,
+            price_sources=[source],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish.write_many_series(
+            [Ticker(symbol=symbol) for symbol in symbols], "1d", apply_filter=False
+        )
+        prices = bearish.read_series_frame(
+            AssetQuery(symbols=Symbols(equities=[Ticker(symbol=s) for s in symbols]))
+        )
+        assert sorted(prices.index.get_level_values("symbol")) == sorted(symbols[:-1])
+        assert 1 < source._peak <= source.concurrency
+        assert bearish._bearish_db.read_price_tracker("FAIL") is None  # type: ignore
+        assert bearish._bearish_db.read_price_tracker("SYM0") is not None  # type: ignore
+
+
+def test_write_many_financials_retries_deferred_tickers() -> None:
+    source = FakeFinancialsSource(failures={"FLAKY": 2, "DEAD": 10})
+    symbols = ["AAPL", "FLAKY", "MSFT", "DEAD"]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = _financials_bearish(Path(directory) / "bearish.db", source)
+        bearish.write_many_financials(
+            [Ticker(symbol=s, exchange="NASDAQ") for s in symbols]
+        )
+        assert _tracked_financials(bearish) == ["AAPL", "FLAKY", "MSFT"]
+        assert not bearish._bearish_db.read_financials_retries("Yfinance")
+    assert source._calls[:2] == [["AAPL", "FLAKY"], ["MSFT", "DEAD"]]
+    assert sum(call.count("DEAD") for call in source._calls) == 3
+    assert sum(call.count("FLAKY") for call in source._calls) == 3
+
+
+def test_financials_retries_are_persisted() -> None:
+    source = FakeFinancialsSource(failures={"FLAKY": 1}, available_calls=1)
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "bearish.db"
+        bearish = _financials_bearish(path, source)
+        bearish.write_many_financials([Ticker(symbol="FLAKY", exchange="NASDAQ")])
+        (retry,) = bearish._bearish_db.read_financials_retries("Yfinance")
+        assert (retry.symbol, retry.exchange, retry.attempts) == ("FLAKY", "NASDAQ", 1)
+        assert retry.error == "Too Many Requests"
+        assert not _tracked_financials(bearish)
+
+        bearish = _financials_bearish(path, FakeFinancialsSource())
+        bearish.write_many_financials([])
+        assert _tracked_financials(bearish) == ["FLAKY"]
+        assert not bearish._bearish_db.read_financials_retries("Yfinance")
+
+
+def test_financials_retries_not_due_are_kept() -> None:
+    source = FakeFinancialsSource(failures={"FLAKY": 1})
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = _financials_bearish(Path(directory) / "bearish.db", source)
+        bearish.retry_policy = RetryPolicy(min_wait=600)
+        start = time.perf_counter()
+        bearish.write_many_financials(
+            [Ticker(symbol=s, exchange="NASDAQ") for s in ["AAPL", "FLAKY"]]
+        )
+        assert time.perf_counter() - start < 5
+        assert _tracked_financials(bearish) == ["AAPL"]
+        (retry,) = bearish._bearish_db.read_financials_retries("Yfinance")
+        assert (retry.symbol, retry.attempts) == ("FLAKY", 1)
+
+
+def test_write_many_financials_tracks_tickers_without_data() -> None:
+    source = FakeFinancialsSource(missing=["NONE"], available_calls=1)
+    symbols = ["AAPL", "NONE", "MSFT"]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = _financials_bearish(Path(directory) / "bearish.db", source)
+        bearish.write_many_financials(
+            [Ticker(symbol=s, exchange="NASDAQ") for s in symbols]
+        )
+        trackers = bearish._bearish_db.read_trackers(
+            TrackerQuery(reference_date=date(2100, 1, 1)), FinancialsTracker
+        )
+    assert {t.symbol: t.date for t in trackers} == {
+        "AAPL": date.today(),
+        "NONE": date.today(),
+    }
+
+
+def test_route_chunks_fails_over_and_disables_sources() -> None:
+    primary = FakePriceSource(concurrency=1)
+    backup = FakeBackupPriceSource(concurrency=1)
+    fetched: List[str] = []
+
+    def _fetch(source: AbstractSource, chunk: List[int]) -> List[int]:
+        fetched.append(source.__source__)
+        if source is primary:
+            raise LimitApiKeyReachedError("limit reached")
+        return [c for c in chunk if c % 3]
+
+    def _write(source: AbstractSource, chunk: List[int], found: List[int]) -> List[int]:
+        return [c for c in chunk if c not in found]
+
+    sources = [primary, backup]
+    unserved = route_chunks(
+        plan_chunks(range(6), sources, size=2), sources, _fetch, _write
+    )
+    assert sorted(unserved) == [0, 3]
+    assert fetched.count("Tiingo") == 1
+    assert fetched.count("YahooQuery") == 3
+
+
+def test_write_many_series_across_sources() -> None:
+    primary = FakePriceSource(concurrency=1, missing=["SYM1", "SYM4"])
+    backup = FakeBackupPriceSource(concurrency=1, missing=["SYM4"])
+    symbols = [f"SYM{i}" for i in range(8)]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            batch_size=1,
+            price_sources=[primary, backup],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish.write_many_series(
+            [Ticker(symbol=symbol) for symbol in symbols], "1d", apply_filter=False
+        )
+        prices = bearish.read_series_frame(
+            AssetQuery(symbols=Symbols(equities=[Ticker(symbol=s) for s in symbols]))
+        )
+        assert sorted(prices.index.get_level_values("symbol")) == sorted(
+            set(symbols) - {"SYM4"}
+        )
+        tracked = bearish._get_tracked_tickers(TrackerQuery(), PriceTracker)
+        assert sorted(t.symbol for t in tracked) == symbols
+        assert (
+            bearish._bearish_db.read_price_tracker("SYM4")  # type: ignore
+            == date.today()
+        )
+    assert primary._chunks > 1
+    assert backup._chunks > 2
+
+
+def test_write_many_series_tracks_tickers_without_data() -> None:
+    primary = FakePriceSource(concurrency=1, missing=["SYM1"])
+    backup = FakeBackupPriceSource(concurrency=1, missing=["SYM1"])
+    symbols = ["SYM0", "SYM1", "SYM2", "FAIL"]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            batch_size=2,
+            price_sources=[primary, backup],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish.write_many_series(
+            [Ticker(symbol=symbol) for symbol in symbols], "1d", apply_filter=False
+        )
+        tracker = bearish._bearish_db.read_price_tracker("SYM1")  # type: ignore
+        assert tracker == date.today()
+        assert bearish._bearish_db.read_price_tracker("FAIL") is None  # type: ignore
+        assert bearish.get_tickers_without_price(
+            [Ticker(symbol=s, exchange="NASDAQ") for s in symbols]
+        ) == [Ticker(symbol=s, exchange="NASDAQ") for s in ["SYM2", "FAIL"]]
+
+        seen = len(primary._seen)
+        bearish.update_prices(reference_date=date.today() + timedelta(days=1))
+    assert primary._seen[seen:] == ["SYM0"]
+
+
+def test_write_many_series_partitions_by_country() -> None:
+    us_source = FakePriceSource(concurrency=1)
+    global_source = FakeBackupPriceSource(concurrency=1, countries=["US", "Germany"])
+    us = [Ticker(symbol=f"US{i}", exchange="NASDAQ") for i in range(4)]
+    germany = [Ticker(symbol=f"DE{i}.DE") for i in range(4)]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            batch_size=1,
+            price_sources=[us_source, global_source],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish.write_many_series(us + germany + [Ticker(symbol="JP0.T")], "1d")
+        tracked = bearish._get_tracked_tickers(TrackerQuery(), PriceTracker)
+    assert {t.symbol for t in tracked} == {t.symbol for t in us + germany}
+    assert set(us_source._seen) <= {t.symbol for t in us}
+    assert {t.symbol for t in germany} <= set(global_source._seen)
+    assert us_source._chunks >= 2
+
+
+def test_update_prices_only_fetches_stale_symbols() -> None:
+    source = FakePriceSource(concurrency=1)
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            price_sources=[source],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish.write_many_series(
+            [Ticker(symbol="AAPL"), Ticker(symbol="MSFT")], "1d", apply_filter=False
+        )
+        bearish._bearish_db.write_trackers(
+            [PriceTracker(symbol="MSFT", source="Tiingo", date=date(2023, 12, 1))]
+        )
+        source._seen.clear()
+        bearish.update_prices(reference_date=date(2024, 1, 3), delay=1)
+        assert source._seen == ["MSFT"]
+
+
+def test_update_prices_incremental_windows() -> None:
+    source = FakePriceSource(concurrency=1)
+    with tempfile.TemporaryDirectory() as directory:
+        bearish = Bearish(
+            path=Path(directory) / "bearish.db",
+            price_sources=[source],
+            financials_sources=[],
+            asset_sources=[],
+            detailed_asset_sources=[],
+        )
+        bearish._bearish_db.write_trackers(
+            [
+                PriceTracker(symbol="AAPL", source="Tiingo", date=date(2024, 1, 9)),
+                PriceTracker(symbol="MSFT", source="Tiingo", date=date(2024, 1, 5)),
+                PriceTracker(symbol="GOOG", source="Tiingo", date=date(2024, 1, 1)),
+                PriceTracker(symbol="NVDA", source="Tiingo", date=date(2023, 12, 1)),
+                PriceTracker(symbol="TSLA", source="Tiingo"),
+            ]
+        )
+        bearish.update_prices(reference_date=date(2024, 1, 10), delay=0)
+        assert source._windows == {
+            "max": ["TSLA"],
+            "3mo": ["NVDA"],
+            "1mo": ["GOOG"],
+            "5d": ["MSFT"],
+            "1d": ["AAPL"],
+        }
+        source._windows.clear()
+        bearish.update_prices(
+            reference_date=date(2024, 1, 10), delay=0, series_length="1mo"
+        )
+        assert sorted(source._windows["1mo"]) == [
+            "AAPL",
+            "GOOG",
+            "MSFT",
+            "NVDA",
+            "TSLA",
+        ]
@@ -0,0 +1,238 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple
+
+import pandas as pd
+import pytest
+import requests
+
+from bearish.exceptions import LimitApiKeyReachedError
+from bearish.models.assets.assets import Assets
+from bearish.models.base import Ticker
+from bearish.models.financials.base import Financials
+from bearish.models.price.price import Price
+from bearish.models.query.query import AssetQuery
+from bearish.sources.base import AbstractSource, ApiUsage
+from bearish.sources import rate_limit
+from bearish.sources.rate_limit import (
+    RATE_LIMIT_STATE,
+    RateLimiter,
+    RateLimitState,
+    get_rate_limiter,
+    is_rate_limited,
+    rate_limiter_metrics,
+)
+from bearish.sources.financial_modelling_prep import read_api as fmp_read_api
+from bearish.sources.tiingo import read_api as tiingo_read_api
+from bearish.sources.yahooquery import YahooQuerySource
+from bearish.sources.yfinance import yFinanceSource
+from bearish.types import SeriesLength
+from bearish.utils.http import HttpClient
+from tests.sources.test_fetch import FakePriceSource
+
+WORKERS = 3
+CALLS_LIMIT = 30
+RATE = 50.0
+
+
+class HttpPriceSource(AbstractSource):
+    __source__ = "FMP"
+    countries: List[str] = ["US"]  # type: ignore
+    api_usage: ApiUsage = ApiUsage(calls_limit=CALLS_LIMIT)
+    rate: Optional[float] = RATE
+    url: str
+
+    def set_api_key(self, api_key: str) -> None: ...
+
+    def _read_assets(self, query: Optional[AssetQuery] = None) -> Assets:
+        return Assets()
+
+    def _read_financials(self, tickers: List[str]) -> List[Financials]:
+        return []
+
+    def _read_series(self, tickers: List[str], type: SeriesLength) -> List[Price]:
+        for _ in tickers:
+            if not self.api_usage.reserve_api_calls(1):
+                break
+            requests.get(self.url, timeout=10).raise_for_status()
+        return []
+
+
+def _worker(url: str) -> None:
+    source = HttpPriceSource(url=url)
+    for _ in range(CALLS_LIMIT):
+        try:
+            source.read_series([Ticker(symbol="AAPL")], "1d", apply_filter=False)
+        except LimitApiKeyReachedError:
+            return
+
+
+@pytest.fixture
+def price_server() -> Iterator[Any]:
+    hits: List[float] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            hits.append(time.time())
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b"[]")
+
+        def log_message(self, *args: Any) -> None: ...
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.hits = hits  # type: ignore
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_rate_limiter_token_bucket() -> None:
+    assert RateLimiter().acquire() == 0.0
+    rate_limiter = RateLimiter(rate=50, burst=2)
+    start = time.perf_counter()
+    waits = [rate_limiter.acquire() for _ in range(6)]
+    assert waits[:2] == [0.0, 0.0]
+    assert all(wait > 0 for wait in waits[2:])
+    assert time.perf_counter() - start == pytest.approx(4 / 50, abs=0.03)
+
+
+def test_rate_limiter_aimd() -> None:
+    rate_limiter = RateLimiter(name="test", rate=100, burst=1, increase=10)
+    response = requests.Response()
+    response.status_code = 429
+    with pytest.raises(requests.HTTPError):
+        with rate_limiter.limit():
+            raise requests.HTTPError(response=response)
+    assert rate_limiter.rate == 50
+    with pytest.raises(ValueError, match="bad payload"):
+        with rate_limiter.limit():
+            raise ValueError("bad payload")
+    assert rate_limiter.rate == 50
+    for _ in range(10):
+        with rate_limiter.limit():
+            pass
+    assert rate_limiter.rate == 100
+    metrics = rate_limiter.metrics()
+    assert metrics.name == "test"
+    assert metrics.rate == 100
+    assert metrics.throttle_events == 1
+    assert metrics.acquired == 12
+    assert metrics.waited > 0
+
+
+def test_rate_limiter_min_rate() -> None:
+    rate_limiter = RateLimiter(rate=1, min_rate=0.2)
+    for _ in range(5):
+        rate_limiter.throttle()
+    assert rate_limiter.rate == 0.2
+    assert rate_limiter.metrics().throttle_events == 5
+
+
+def test_is_rate_limited() -> None:
+    class YFRateLimitError(Exception): ...
+
+    assert is_rate_limited(YFRateLimitError())
+    assert is_rate_limited(Exception("429 Client Error: Too Many Requests"))
+    assert not is_rate_limited(ConnectionError("provider down"))
+
+
+def test_read_api_throttles_on_429(monkeypatch: pytest.MonkeyPatch) -> None:
+    response = requests.Response()
+    response.status_code = 429
+    monkeypatch.setattr(HttpClient, "get", lambda *args, **kwargs: response)
+    monkeypatch.setattr(rate_limit, "RATE_LIMITERS", {})
+    for read, name in [
+        (lambda: fmp_read_api("url", "quote", "key", "AAPL"), "FMP"),
+        (lambda: tiingo_read_api("key", "AAPL"), "Tiingo"),
+    ]:
+        with pytest.raises(requests.HTTPError):
+            read()
+        assert get_rate_limiter(name).metrics().throttle_events == 1
+
+
+def test_rate_limiter_shared_per_source() -> None:
+    first, second = FakePriceSource(), FakePriceSource()
+    assert first.rate_limiter is second.rate_limiter
+    assert first.rate_limiter is get_rate_limiter(FakePriceSource.__source__)
+    assert FakePriceSource.__source__ in {m.name for m in rate_limiter_metrics()}
+
+
+def test_rate_limiter_shared_per_backend() -> None:
+    yfinance, yahooquery = yFinanceSource(), YahooQuerySource()
+    assert yfinance.rate_limiter is yahooquery.rate_limiter
+    assert yfinance.rate_limiter.name == "Yahoo"
+    assert FakePriceSource().rate_limiter is not yfinance.rate_limiter
+
+
+def test_rate_limiter_reconfigured_per_source() -> None:
+    first = FakePriceSource(rate=10, burst=2)
+    assert (first.rate_limiter.rate, first.rate_limiter.burst) == (10, 2)
+    second = FakePriceSource(rate=20, burst=3)
+    assert second.rate_limiter is first.rate_limiter
+    assert (first.rate_limiter.rate, first.rate_limiter.max_rate) == (20, 20)
+    assert first.rate_limiter.burst == 3
+    assert get_rate_limiter(FakePriceSource.__source__, rate=1).rate == 20
+    assert FakePriceSource().rate_limiter.rate is None
+
+
+def test_pause_sets_rate_limiter() -> None:
+    with pytest.deprecated_call():
+        source = FakePriceSource(pause=2)
+    assert (source.rate_limiter.rate, source.rate_limiter.burst) == (0.5, 1)
+    with pytest.deprecated_call():
+        source.set_pause(0)
+    assert source.rate_limiter.rate is None
+
+
+def test_rate_limit_state(tmp_path: Path) -> None:
+    state = RateLimitState(path=tmp_path / "state.db")
+    assert state.reserve("test", 10, 2) == (10, 0.0)
+    assert state.reserve("test", 10, 2) == (10, 0.0)
+    assert state.reserve("test", 10, 2)[1] == pytest.approx(0.1, abs=0.01)
+    assert state.update_rate("test", 10, lambda rate: rate / 2) == 5
+    assert state.reserve("test", 10, 2)[0] == 5
+    assert state.reserve_api_calls("test", "2024-01-01", 3, 4)
+    assert not state.reserve_api_calls("test", "2024-01-01", 2, 4)
+    assert state.reserve_api_calls("test", "2024-01-02", 2, 4)
+    assert state.read_api_calls("test", "2024-01-01") == 3
+
+
+def test_acquire_async_reserves_state_off_the_loop(tmp_path: Path) -> None:
+    threads: List[threading.Thread] = []
+
+    class RecordingState(RateLimitState):
+        def reserve(self, *args: Any, **kwargs: Any) -> Tuple[float, float]:
+            threads.append(threading.current_thread())
+            return super().reserve(*args, **kwargs)
+
+    rate_limiter = RateLimiter(
+        name="test", rate=10, state=RecordingState(path=tmp_path / "state.db")
+    )
+    asyncio.run(rate_limiter.acquire_async())
+    assert threads and threading.main_thread() not in threads
+
+
+def test_rate_limit_across_processes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, price_server: Any
+) -> None:
+    monkeypatch.setenv(RATE_LIMIT_STATE, str(tmp_path / "state.db"))
+    url = f"http://127.0.0.1:{price_server.server_port}/prices"
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_worker, args=(url,)) for _ in range(WORKERS)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=60)
+        assert worker.exitcode == 0
+    hits = pd.Series(price_server.hits).sort_values()
+    assert len(hits) == CALLS_LIMIT
+    assert hits.iloc[-1] - hits.iloc[0] >= 0.8 * (CALLS_LIMIT - 1) / RATE
+    state = RateLimitState(path=tmp_path / "state.db")
+    assert state.read_api_calls("FMP", ApiUsage().current_period()) == CALLS_LIMIT
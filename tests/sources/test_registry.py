@@ -0,0 +1,36 @@
+from importlib.metadata import EntryPoint
+from typing import Any, List
+
+import pytest
+
+from bearish.exceptions import SourceNotFoundError
+from bearish.sources import registry
+from bearish.sources.registry import load_source
+from bearish.sources.tiingo import TiingoSource
+from bearish.sources.yfinance import yFinanceSource
+
+
+def test_load_builtin_sources() -> None:
+    assert load_source("Yfinance") is yFinanceSource
+    assert load_source("Tiingo") is TiingoSource
+
+
+def test_load_source_plugin(monkeypatch: pytest.MonkeyPatch) -> None:
+    def _entry_points(group: str) -> List[Any]:
+        return [
+            EntryPoint(
+                name="Plugin",
+                value="bearish.sources.tiingo:TiingoSource",
+                group=group,
+            )
+        ]
+
+    monkeypatch.setattr(registry, "SOURCES", dict(registry.SOURCES))
+    monkeypatch.setattr(registry, "entry_points", _entry_points)
+    registry._register_entry_points.cache_clear()
+    try:
+        assert load_source("Plugin") is TiingoSource
+        with pytest.raises(SourceNotFoundError):
+            load_source("Unknown")
+    finally:
+        registry._register_entry_points.cache_clear()
@@ -1,3 +1,8 @@
+import threading
+import time
+from typing import Any
+
+import pandas as pd
 import pytest
 import yfinance as yf
 
@@ -116,3 +121,58 @@ def test_bug_financials():
     assert financial_metrics
     assert balance_sheets
     assert not cash_flows
+
+
+def test_yfinance_read_series_frame(monkeypatch: pytest.MonkeyPatch) -> None:
+    dates = pd.date_range("2024-01-01", periods=3, name="Date")
+    columns = pd.MultiIndex.from_product(
+        [["AAPL", "MSFT"], ["Open", "High", "Low", "Close", "Volume"]]
+    )
+    data = pd.DataFrame(1.0, index=dates, columns=columns)
+    monkeypatch.setattr(yf, "download", lambda *args, **kwargs: data)
+    source = yFinanceSource(pause=0)
+    frame = source.read_series_frame(
+        [Ticker(symbol="AAPL"), Ticker(symbol="MSFT")], "5d", apply_filter=False
+    )
+    assert len(frame) == 6
+    assert set(frame["symbol"]) == {"AAPL", "MSFT"}
+    assert {"date", "open", "high", "low", "close", "volume", "source"}.issubset(
+        frame.columns
+    )
+
+
+class FakeYfTicker:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, ticker: str) -> None:
+        self.ticker = ticker
+
+    def __getattr__(self, attribute: str) -> Any:
+        with self.lock:
+            FakeYfTicker.active += 1
+            FakeYfTicker.peak = max(FakeYfTicker.peak, FakeYfTicker.active)
+        time.sleep(0.02)
+        with self.lock:
+            FakeYfTicker.active -= 1
+        if self.ticker == "FAIL" and attribute == "balance_sheet":
+            raise ConnectionError("provider down")
+        dates = pd.date_range("2023-12-31", periods=2, freq="YE")
+        if attribute == "earnings_dates":
+            return pd.DataFrame({"Reported EPS": [1.0, 2.0]}, index=dates)
+        return pd.DataFrame([[1.0, 2.0]], index=["Net Income"], columns=dates)
+
+
+def test_read_financials_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(yf, "Ticker", FakeYfTicker)
+    source = yFinanceSource(financials_workers=4)
+    monkeypatch.setattr(source.rate_limiter, "rate", None)
+    symbols = ["AAPL", "FAIL", "MSFT", "GOOG"]
+    financials = source._read_financials(symbols)
+    assert [f.financial_metrics[0].symbol for f in financials] == symbols
+    assert [bool(f.balance_sheets) for f in financials] == [True, False, True, True]
+    assert all(len(f.quarterly_cash_flows) == 2 for f in financials)
+    assert all(len(f.earnings_date) == 2 for f in financials)
+    assert 1 < FakeYfTicker.peak <= 4
+    assert list(source.pop_deferred(symbols)) == ["FAIL"]
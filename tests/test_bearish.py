@@ -491,7 +491,7 @@ def test_get_financials(bearish_db_with_assets: BearishDb) -> None:
 
 def test_read_tracker(bear_db: BearishDb) -> None:
     date_today = bear_db.read_price_tracker("AAPL")
-    reference_date = date_today - timedelta(days=12)
+    reference_date = date_today + timedelta(days=12)
     date_str = reference_date.strftime("%Y-%m-%d")
     trackers = bear_db.read_tracker(
         TrackerQuery(reference_date=datetime.strptime(date_str, "%Y-%m-%d").date()),
@@ -503,13 +503,10 @@ def test_read_tracker(bear_db: BearishDb) -> None:
 
 def test_read_tracker_today(bear_db: BearishDb) -> None:
     date_today = bear_db.read_price_tracker("AAPL")
-    reference_date = date_today - timedelta(days=3)
-    date_str = reference_date.strftime("%Y-%m-%d")
     trackers = bear_db.read_tracker(
-        TrackerQuery(reference_date=datetime.strptime(date_str, "%Y-%m-%d").date()),
-        PriceTracker,
+        TrackerQuery(reference_date=date_today), PriceTracker
     )
-    assert trackers
+    assert "AAPL" not in [t.symbol for t in trackers]
 
 
 def test_update_prices(bear_db: BearishDb) -> None:
@@ -0,0 +1,478 @@
+import sqlite3
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+from alembic.script import ScriptDirectory
+from sqlalchemy import text
+
+from bearish.database import crud
+from bearish.database.crud import BearishDb
+from bearish.database.profiles import PROFILES, SqliteProfile
+from bearish.models.assets.assets import Assets
+from bearish.models.assets.equity import Equity
+from bearish.models.base import FinancialsTracker, PriceTracker, Ticker, TrackerQuery
+from bearish.models.financials.base import Financials
+from bearish.models.financials.earnings_date import EarningsDate
+from bearish.models.financials.metrics import FinancialMetrics
+from bearish.models.price.price import Price
+from bearish.models.price.prices import Prices
+from bearish.models.query.query import AssetQuery, Symbols
+from bearish.sources.base import ApiUsage
+from bearish.database.scripts.upgrade import (
+    ALEMBIC_FOLDER,
+    HEAD_REVISION,
+    current_revision,
+    upgrade,
+)
+
+
+def _schema(database_path: Path) -> Dict[str, Any]:
+    connection = sqlite3.connect(database_path)
+    schema = {}
+    tables = connection.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'table'"
+    ).fetchall()
+    for table, sql in tables:
+        columns = sorted(
+            row[1:] for row in connection.execute(f"PRAGMA table_xinfo('{table}')")
+        )
+        indexes = sorted(
+            (
+                index[1],
+                index[2],
+                index[3],
+                [
+                    column[2]
+                    for column in connection.execute(f"PRAGMA index_info('{index[1]}')")
+                ],
+            )
+            for index in connection.execute(f"PRAGMA index_list('{table}')")
+        )
+        schema[table] = (columns, indexes, "WITHOUT ROWID" in sql.upper())
+    views = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'view'"
+    ).fetchall()
+    for (view,) in views:
+        schema[view] = sorted(
+            row[1:] for row in connection.execute(f"PRAGMA table_xinfo('{view}')")
+        )
+    schema["alembic_version"] = connection.execute(
+        "SELECT version_num FROM alembic_version"
+    ).fetchall()
+    connection.close()
+    return schema
+
+
+def _pragma(bearish_db: BearishDb, name: str) -> str | int:
+    with bearish_db._engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()  # type: ignore
+
+
+@pytest.mark.parametrize("profile", list(PROFILES))
+def test_sqlite_profile_presets(profile: str) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(
+            database_path=Path(directory) / "bearish.db", sqlite_profile=profile
+        )
+        settings = PROFILES[profile]  # type: ignore
+        journal_mode = settings.journal_mode or "DELETE"
+        assert _pragma(bearish_db, "journal_mode") == journal_mode.lower()
+        assert _pragma(bearish_db, "cache_size") == settings.cache_size
+        assert _pragma(bearish_db, "busy_timeout") == settings.busy_timeout
+        if settings.page_size:
+            assert _pragma(bearish_db, "page_size") == settings.page_size
+        bearish_db._engine.dispose()
+
+
+def test_safe_profile_keeps_journal_mode() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        BearishDb(database_path=database_path)._engine.dispose()
+        assert not database_path.with_name("bearish.db-wal").exists()
+        connection = sqlite3.connect(database_path)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.close()
+        bearish_db = BearishDb(database_path=database_path)
+        assert _pragma(bearish_db, "journal_mode") == "wal"
+        bearish_db._engine.dispose()
+
+
+def test_sqlite_profile_file_pragmas_only_on_new_database() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        bearish_db = BearishDb(database_path=database_path)
+        page_size = _pragma(bearish_db, "page_size")
+        bearish_db._engine.dispose()
+        bearish_db = BearishDb(
+            database_path=database_path,
+            sqlite_profile=SqliteProfile(page_size=page_size * 2, synchronous="OFF"),
+        )
+        assert _pragma(bearish_db, "page_size") == page_size
+        assert _pragma(bearish_db, "synchronous") == 0
+        bearish_db._engine.dispose()
+
+
+def test_head_revision_matches_alembic() -> None:
+    script = ScriptDirectory(str(ALEMBIC_FOLDER))
+    assert HEAD_REVISION == script.get_current_head()
+
+
+def test_skip_upgrade_when_at_head(monkeypatch: pytest.MonkeyPatch) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        BearishDb(database_path=database_path)._engine.dispose()
+
+        def _upgrade(database_url: str) -> None:
+            raise AssertionError("Database is already at head")
+
+        monkeypatch.setattr(crud, "upgrade", _upgrade)
+        bearish_db = BearishDb(database_path=database_path)
+        with bearish_db._engine.connect() as connection:
+            assert current_revision(connection) == HEAD_REVISION
+        bearish_db._engine.dispose()
+
+
+def test_fresh_database_matches_migration_chain() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        migrated_path = Path(directory) / "migrated.db"
+        upgrade(f"sqlite:///{migrated_path}")
+        fresh_path = Path(directory) / "fresh.db"
+        BearishDb(database_path=fresh_path)._engine.dispose()
+        assert _schema(fresh_path) == _schema(migrated_path)
+
+
+def test_write_series_frame() -> None:
+    dates = pd.date_range(end=pd.Timestamp.today().normalize(), periods=5)
+    series = pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "source": "Yfinance",
+            "date": dates,
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": range(5),
+            "volume": 100,
+        }
+    )
+    series.loc[0, "close"] = np.nan
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(database_path=Path(directory) / "bearish.db")
+        bearish_db.write_series_frame(series)
+        bearish_db.write_series_frame(series.to_records(index=False))
+        bearish_db.write_series(
+            [
+                Price(
+                    symbol="AAPL",
+                    source="Yfinance",
+                    date=dates[-1].date(),
+                    open=1.0,
+                    high=2.0,
+                    low=0.5,
+                    close=10.0,
+                    volume=100,
+                )
+            ]
+        )
+        prices = bearish_db.read_series(
+            AssetQuery(symbols=Symbols(equities=[Ticker(symbol="AAPL")])), months=1
+        )
+        assert len(prices) == 4
+        assert sorted(price.close for price in prices) == [1.0, 2.0, 3.0, 10.0]
+        bearish_db._engine.dispose()
+
+
+def test_read_series_frame() -> None:
+    series = pd.DataFrame(
+        {
+            "symbol": ["AAPL"] * 3 + ["MSFT"] * 3,
+            "source": "Yfinance",
+            "date": list(pd.date_range("2024-01-01", periods=3)) * 2,
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": range(6),
+            "volume": 100,
+        }
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(database_path=Path(directory) / "bearish.db")
+        bearish_db.write_series_frame(series)
+        query = AssetQuery(
+            symbols=Symbols(equities=[Ticker(symbol="AAPL"), Ticker(symbol="MSFT")])
+        )
+        prices = bearish_db.read_series_frame(
+            query, start=date(2024, 1, 2), end=date(2024, 1, 3), columns=["close"]
+        )
+        assert prices.index.names == ["symbol", "date"]
+        assert list(prices.columns) == ["close"]
+        assert prices["close"].dtype == "float64"
+        assert prices.index.get_level_values("date").dtype == "datetime64[ns]"
+        assert prices["close"].tolist() == [1.0, 2.0, 4.0, 5.0]
+        assert len(bearish_db.read_series_frame(query)) == 6
+        with pytest.raises(ValueError):
+            bearish_db.read_series_frame(query, columns=["unknown"])
+        prices = Prices.from_ticker(bearish_db, Ticker(symbol="AAPL"))
+        assert prices.get_last_date() == date(2024, 1, 3)
+        bearish_db._engine.dispose()
+
+
+def test_iter_series_financials_and_assets(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(crud, "YIELD_PER", 2)
+    symbols = ["AAPL", "MSFT", "NVDA"]
+    series = pd.DataFrame(
+        {
+            "symbol": np.repeat(symbols, 3),
+            "source": "Yfinance",
+            "date": list(pd.date_range(end=pd.Timestamp.today(), periods=3)) * 3,
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": 1.5,
+            "volume": 100,
+        }
+    )
+    query = AssetQuery(
+        symbols=Symbols(equities=[Ticker(symbol=symbol) for symbol in symbols])
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(database_path=Path(directory) / "bearish.db")
+        bearish_db.write_series_frame(series)
+        bearish_db.write_financials(
+            [
+                Financials(
+                    financial_metrics=[
+                        FinancialMetrics(
+                            symbol=symbol, source="Yfinance", date=date(2024, 1, 1)
+                        )
+                    ],
+                    earnings_date=[
+                        EarningsDate(
+                            symbol=symbol, source="Yfinance", date=date(2024, 1, 1)
+                        )
+                    ],
+                )
+                for symbol in symbols[:2]
+            ]
+        )
+        bearish_db.write_assets(
+            Assets(
+                equities=[
+                    Equity(symbol=symbol, source="Yfinance") for symbol in symbols
+                ]
+            )
+        )
+
+        series_batches = list(bearish_db.iter_series(query))
+        assert [{p.symbol for p in prices} for prices in series_batches] == [
+            {symbol} for symbol in symbols
+        ]
+        assert all(len(prices) == 3 for prices in series_batches)
+
+        financials = list(bearish_db.iter_financials(query))
+        assert [f.financial_metrics[0].symbol for f in financials] == symbols[:2]
+        assert all(len(f.earnings_date) == 1 for f in financials)
+
+        assets = list(bearish_db.iter_assets(query))
+        assert [len(a.equities) for a in assets] == [2, 1]
+        bearish_db._engine.dispose()
+
+
+def test_series_tables_keyed_by_symbol_id() -> None:
+    price = {
+        "symbol": "AAPL",
+        "date": date(2024, 1, 2),
+        "open": 1.0,
+        "high": 2.0,
+        "low": 0.5,
+        "close": 1.5,
+        "volume": 100,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        bearish_db = BearishDb(database_path=database_path)
+        bearish_db.write_series(
+            [
+                Price(source="Yfinance", **price),  # type: ignore
+                Price(source="Tiingo", exchange="NMS", **price),  # type: ignore
+            ]
+        )
+        bearish_db.write_series_frame(
+            pd.DataFrame([price | {"source": "Yfinance", "date": date(2024, 1, 3)}])
+        )
+        assert set(bearish_db._symbol_ids) == {("AAPL", "Yfinance"), ("AAPL", "Tiingo")}
+        bearish_db._engine.dispose()
+
+        connection = sqlite3.connect(database_path)
+        assert connection.execute(
+            "SELECT symbol, source, exchange FROM symbol ORDER BY id"
+        ).fetchall() == [("AAPL", "Yfinance", None), ("AAPL", "Tiingo", "NMS")]
+        assert connection.execute(
+            "SELECT symbol_id, COUNT(*) FROM pricedata GROUP BY symbol_id"
+        ).fetchall() == [(1, 2), (2, 1)]
+        assert connection.execute(
+            "SELECT source, exchange, close FROM price WHERE date >= '2024-01-03'"
+        ).fetchall() == [("Yfinance", None, 1.5)]
+        connection.close()
+
+
+def test_series_write_updates_cached_symbol_exchange() -> None:
+    price = {
+        "symbol": "AAPL",
+        "source": "Yfinance",
+        "date": date(2024, 1, 2),
+        "open": 1.0,
+        "high": 2.0,
+        "low": 0.5,
+        "close": 1.5,
+        "volume": 100,
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        bearish_db = BearishDb(database_path=database_path)
+        bearish_db.write_series([Price(exchange="NYQ", **price)])  # type: ignore
+        bearish_db.write_series([Price(**price)])  # type: ignore
+        bearish_db.write_series(
+            [Price(exchange="NMS", **price | {"date": date(2024, 1, 3)})]  # type: ignore
+        )
+        bearish_db._engine.dispose()
+
+        connection = sqlite3.connect(database_path)
+        assert connection.execute(
+            "SELECT symbol, source, exchange FROM symbol"
+        ).fetchall() == [("AAPL", "Yfinance", "NMS")]
+        connection.close()
+
+
+def test_epoch_day_date_storage() -> None:
+    series = pd.DataFrame(
+        {
+            "symbol": "AAPL",
+            "source": "Yfinance",
+            "date": pd.date_range("2024-01-01", periods=3, tz="UTC"),
+            "open": 1.0,
+            "high": 2.0,
+            "low": 0.5,
+            "close": range(3),
+            "volume": 100,
+        }
+    )
+    query = AssetQuery(symbols=Symbols(equities=[Ticker(symbol="AAPL")]))
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        bearish_db = BearishDb(database_path=database_path, date_storage="epoch_day")
+        bearish_db.write_series_frame(series)
+        bearish_db.write_financials(
+            [
+                Financials(
+                    earnings_date=[
+                        EarningsDate(
+                            symbol="AAPL", source="Yfinance", date=date(2024, 1, 5)
+                        )
+                    ]
+                )
+            ]
+        )
+        bearish_db._engine.dispose()
+
+        bearish_db = BearishDb(database_path=database_path)
+        assert bearish_db._date_storage == "epoch_day"
+        bearish_db.write_series(
+            [
+                Price(
+                    symbol="AAPL",
+                    source="Yfinance",
+                    date=date(2024, 1, 4),
+                    open=1.0,
+                    high=2.0,
+                    low=0.5,
+                    close=3.0,
+                    volume=100,
+                )
+            ]
+        )
+        prices = bearish_db.read_series_frame(
+            query, start=date(2024, 1, 2), end=date(2024, 1, 4), columns=["close"]
+        )
+        assert prices.index.get_level_values("date").tolist() == list(
+            pd.date_range("2024-01-02", periods=3)
+        )
+        assert prices["close"].tolist() == [1.0, 2.0, 3.0]
+        prices_ = Prices.from_ticker(bearish_db, Ticker(symbol="AAPL"))
+        assert prices_.get_last_date() == date(2024, 1, 4)
+        financials = bearish_db.read_financials(query)
+        assert pd.Timestamp(financials.earnings_date[0].date) == pd.Timestamp(
+            "2024-01-05"
+        )
+        bearish_db._engine.dispose()
+
+        connection = sqlite3.connect(database_path)
+        assert connection.execute(
+            "SELECT DISTINCT typeof(date) FROM pricedata"
+        ).fetchall() == [("integer",)]
+        assert connection.execute(
+            "SELECT date FROM price WHERE date >= '2024-01-04'"
+        ).fetchall() == [("2024-01-04 00:00:00.000000",)]
+        connection.close()
+
+
+def test_api_usage_ledger() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "bearish.db"
+        bearish_db = BearishDb(database_path=database_path)
+        api_usage = ApiUsage(calls_limit=5)
+        api_usage.share("FMP", bearish_db)
+        assert api_usage.reserve_api_calls(4)
+        assert not api_usage.reserve_api_calls(2)
+        assert api_usage.remaining_calls() == 1
+        bearish_db._engine.dispose()
+
+        next_run = ApiUsage(calls_limit=5)
+        next_run.share("FMP", BearishDb(database_path=database_path))
+        assert next_run.total_calls() == 4
+        assert next_run.reserve_api_calls(1)
+        assert next_run.limit_reached()
+        assert not ApiUsage(calls_limit=5).limit_reached()
+
+
+def test_read_untracked_symbols() -> None:
+    symbols = [f"SYM{i}" for i in range(10_000)]
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(database_path=Path(directory) / "bearish.db")
+        bearish_db.write_trackers(
+            [PriceTracker(symbol=s, source="Yfinance") for s in symbols[::2]]
+            + [PriceTracker(symbol="SYM1", source="Tiingo")]
+        )
+        bearish_db.write_trackers([FinancialsTracker(symbol="SYM3", source="Yfinance")])
+        untracked = bearish_db.read_untracked_symbols(symbols, PriceTracker)
+        assert untracked == [s for s in symbols[1::2] if s != "SYM1"]
+        assert bearish_db.read_untracked_symbols(
+            ["SYM2", "SYM3"], FinancialsTracker
+        ) == ["SYM2"]
+        assert bearish_db.read_tracked_symbols(FinancialsTracker) == {"SYM3"}
+
+
+def test_read_tracker_staleness() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(database_path=Path(directory) / "bearish.db")
+        bearish_db.write_trackers(
+            [
+                PriceTracker(symbol="AAPL", source="Yfinance", date=date(2024, 1, 9)),
+                PriceTracker(symbol="MSFT", source="Yfinance", date=date(2024, 1, 2)),
+                PriceTracker(symbol="MSFT", source="Tiingo", date=date(2024, 1, 10)),
+                PriceTracker(symbol="NVDA", source="Yfinance", date=date(2024, 1, 5)),
+                PriceTracker(symbol="TSLA", source="Tiingo", date=date(2023, 12, 1)),
+            ]
+        )
+        stale = bearish_db.read_tracker(
+            TrackerQuery(reference_date=date(2024, 1, 10), delay=1), PriceTracker
+        )
+        assert [t.symbol for t in stale] == ["TSLA", "NVDA"]
+        tracked = bearish_db.read_tracker(TrackerQuery(), PriceTracker)
+        assert [t.symbol for t in tracked] == ["TSLA", "NVDA", "AAPL", "MSFT"]
+        assert tracked[-1].source == "Tiingo"
@@ -0,0 +1,78 @@
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, List
+
+import pytest
+import requests_mock
+
+from bearish.utils.http import HttpClient
+
+PAYLOAD = b'[{"symbol": "AAPL"}]' * 100
+
+
+@pytest.fixture
+def http_server() -> Iterator[Any]:
+    clients: List[int] = []
+    failures = {"/flaky": 2}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802
+            clients.append(self.client_address[1])
+            if failures.get(self.path, 0):
+                failures[self.path] -= 1
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = PAYLOAD
+            self.send_response(200)
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                body = gzip.compress(body)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None: ...
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.clients = clients  # type: ignore
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_keep_alive_and_gzip(http_server: Any) -> None:
+    client = HttpClient()
+    host = f"127.0.0.1:{http_server.server_port}"
+    for _ in range(5):
+        response = client.get(f"http://{host}/prices")
+        assert response.content == PAYLOAD
+        assert response.headers["Content-Encoding"] == "gzip"
+    assert len(set(http_server.clients)) == 1
+    metrics = client.metrics()[host]
+    assert metrics.requests == 5
+    assert metrics.errors == 0
+    assert metrics.bytes == 5 * len(PAYLOAD)
+    assert metrics.elapsed > 0
+
+
+def test_http_client_retries(http_server: Any) -> None:
+    client = HttpClient(backoff_factor=0)
+    host = f"127.0.0.1:{http_server.server_port}"
+    assert client.get(f"http://{host}/flaky").ok
+    assert len(http_server.clients) == 3
+    assert client.metrics()[host].requests == 1
+
+
+def test_http_client_records_errors() -> None:
+    client = HttpClient()
+    with requests_mock.Mocker() as req:
+        req.get("https://api.example.com/down", status_code=404)
+        assert not client.get("https://api.example.com/down").ok
+    assert client.metrics()["api.example.com"].errors == 1
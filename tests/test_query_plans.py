@@ -0,0 +1,85 @@
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Generator, List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+from bearish.database.crud import BearishDb
+from bearish.database.schemas import PriceEtfORM, PriceIndexORM
+from bearish.models.base import FinancialsTracker, PriceTracker, Ticker, TrackerQuery
+from bearish.models.query.query import AssetQuery, Symbols
+
+QUERY = AssetQuery(
+    symbols=Symbols(equities=[Ticker(symbol="AAPL"), Ticker(symbol="MSFT")])
+)
+HOT_QUERIES: List[Tuple[str, Callable[[BearishDb], Any]]] = [
+    ("read_series", lambda db: db.read_series(QUERY, months=12)),
+    (
+        "read_series_index",
+        lambda db: db.read_series(QUERY, months=12, table=PriceIndexORM),
+    ),
+    ("read_series_etf", lambda db: db.read_series(QUERY, months=12, table=PriceEtfORM)),
+    (
+        "read_series_frame",
+        lambda db: db.read_series_frame(
+            QUERY, start=date(2024, 1, 1), end=date(2024, 12, 31)
+        ),
+    ),
+    ("iter_series", lambda db: list(db.iter_series(QUERY, months=12))),
+    ("read_financials", lambda db: db.read_financials(QUERY)),
+    ("iter_financials", lambda db: list(db.iter_financials(QUERY))),
+    ("read_assets", lambda db: db.read_assets(QUERY)),
+    ("read_price_tracker", lambda db: db.read_price_tracker("AAPL")),
+    (
+        "read_price_tracker_by_exchange",
+        lambda db: db.read_tracker(TrackerQuery(exchange="NMS"), PriceTracker),
+    ),
+    (
+        "read_financials_tracker_by_exchange",
+        lambda db: db.read_tracker(TrackerQuery(exchange="NMS"), FinancialsTracker),
+    ),
+]
+
+
+@pytest.fixture(scope="module", params=["iso", "epoch_day"])
+def bearish_db(request: pytest.FixtureRequest) -> Generator[BearishDb, None, None]:
+    with tempfile.TemporaryDirectory() as directory:
+        bearish_db = BearishDb(
+            database_path=Path(directory) / "bearish.db", date_storage=request.param
+        )
+        yield bearish_db
+        bearish_db._engine.dispose()
+
+
+@pytest.mark.parametrize("name, read", HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES])
+def test_hot_query_uses_index(
+    bearish_db: BearishDb, name: str, read: Callable[[BearishDb], Any]
+) -> None:
+    statements = []
+
+    def _record(*args: Any) -> None:
+        statement, parameters = args[2], args[3]
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(bearish_db._engine, "before_cursor_execute", _record)
+    try:
+        read(bearish_db)
+    finally:
+        event.remove(bearish_db._engine, "before_cursor_execute", _record)
+
+    assert statements
+    with bearish_db._engine.connect() as connection:
+        for statement, parameters in statements:
+            plan = [
+                row[3]
+                for row in connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+            ]
+            assert not [step for step in plan if step.startswith("SCAN")], (
+                statement,
+                plan,
+            )
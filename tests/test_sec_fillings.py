@@ -1,11 +1,14 @@
-from datetime import datetime
+import pickle
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Dict
 
 import pytest
 
 from bearish.database.crud import BearishDb
+from bearish.models.sec import sec
 from bearish.models.sec.ciks import _read_tsv
-from bearish.models.sec.sec import Secs
+from bearish.models.sec.sec import Secs, load_ticker_mapping
 
 
 def test_sec(bearish_db: BearishDb) -> None:
@@ -55,3 +58,30 @@ def test_read_share_data(bear_db: BearishDb) -> None:
     companies = bear_db.read_sec_companies()
     data = bear_db.read_sec_share_data(companies[0])
     assert not data.empty
+
+
+def test_load_ticker_mapping_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+
+    def _company_ticker() -> Dict[str, str]:
+        calls.append(1)
+        if len(calls) > 2:
+            raise ConnectionError("offline")
+        return {"APPLE": "AAPL"}
+
+    monkeypatch.setattr(sec, "company_ticker", _company_ticker)
+    cache_path = tmp_path / "cache" / "ticker_mapping.pickle"
+    assert load_ticker_mapping(cache_path) == {"APPLE": "AAPL"}
+    assert load_ticker_mapping(cache_path) == {"APPLE": "AAPL"}
+    assert len(calls) == 1
+
+    assert load_ticker_mapping(cache_path, ttl=timedelta(0)) == {"APPLE": "AAPL"}
+    assert len(calls) == 2
+    assert load_ticker_mapping(cache_path, ttl=timedelta(0)) == {"APPLE": "AAPL"}
+    assert len(calls) == 3
+
+    cache_path.write_bytes(pickle.dumps({"version": 0, "mapping": {}}))
+    with pytest.raises(ConnectionError):
+        load_ticker_mapping(cache_path)
@@ -0,0 +1,30 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from tests.benchmarks.startup import DEFERRED_MODULES, cli_import_times
+
+LAZY_SOURCES = """
+import sys
+from bearish.main import Bearish
+Bearish(path="{path}")
+print(",".join(sorted(sys.modules)))
+"""
+
+
+def test_cli_startup_defers_heavy_imports() -> None:
+    _, times = cli_import_times()
+    imported = {module for module, _, _ in times}
+    assert not imported.intersection(DEFERRED_MODULES)
+
+
+def test_bearish_creates_sources_on_first_use(tmp_path: Path) -> None:
+    modules = subprocess.run(
+        [sys.executable, "-c", LAZY_SOURCES.format(path=tmp_path / "bearish.db")],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert not set(modules.strip().split(",")).intersection(
+        ["bearish.sources.yfinance", "bearish.sources.yahooquery", "yfinance"]
+    )